@@ -0,0 +1,148 @@
+# =============================================================================
+# bench_file_category.py - File Category Benchmark / Dosya Kategorisi Ölçümü
+# =============================================================================
+# Compares ways of classifying 100k file names into icon categories:
+#   legacy  - the previous get_file_icon: os.path.exists + os.path.isdir,
+#             then os.path.splitext and a linear "in" scan over six lists
+#   lists   - the same splitext + list scans on names only (no disk)
+#   single  - get_file_category(name, is_dir): one dict lookup, no disk
+#   batch   - get_file_categories(names, dir_flags): whole listing at once
+# The legacy variant is measured on real (empty) files in a temporary
+# folder, because its cost includes the two file system calls.
+#
+# 100 bin dosya adını ikon kategorilerine ayırma yollarını karşılaştırır:
+#   legacy  - önceki get_file_icon: os.path.exists + os.path.isdir, ardından
+#             os.path.splitext ve altı liste üzerinde doğrusal "in" taraması
+#   lists   - aynı splitext + liste taramaları, sadece adlarla (disk yok)
+#   single  - get_file_category(ad, klasör_mü): tek sözlük araması, disk yok
+#   batch   - get_file_categories(adlar, klasör_bayrakları): tüm liste tek seferde
+# Legacy, maliyeti iki dosya sistemi çağrısını da içerdiği için geçici bir
+# klasördeki gerçek (boş) dosyalar üzerinde ölçülür.
+#
+# Usage / Kullanım:
+#   python -m benchmarks.bench_file_category [name_count]
+# =============================================================================
+
+import os           # File system calls / Dosya sistemi çağrıları
+import sys          # Command-line arguments / Komut satırı argümanları
+import time         # Timing / Zamanlama
+import shutil       # Cleanup / Temizlik
+import random       # Synthetic names / Sentetik adlar
+import tempfile     # Temporary folder / Geçici klasör
+
+from src.file_utils import (EMOJI_ICONS, TEXT_EXTENSIONS, IMAGE_EXTENSIONS,
+                            CODE_EXTENSIONS, VIDEO_EXTENSIONS, AUDIO_EXTENSIONS,
+                            ARCHIVE_EXTENSIONS, get_file_category,
+                            get_file_categories)
+
+
+def legacy_get_file_icon(file_path):
+    """
+    The previous implementation, kept here for comparison.
+    Karşılaştırma için burada tutulan önceki uygulama.
+    """
+    if not os.path.exists(file_path):
+        return EMOJI_ICONS["unknown"]
+
+    if os.path.isdir(file_path):
+        return EMOJI_ICONS["directory"]
+
+    return EMOJI_ICONS[legacy_category(file_path)]
+
+
+def legacy_category(file_name):
+    """
+    The previous extension matching: splitext and a linear scan per list.
+    Önceki uzantı eşleştirmesi: splitext ve her liste için doğrusal tarama.
+    """
+    name_part, extension = os.path.splitext(file_name)
+    extension = extension.lower()
+
+    if extension in TEXT_EXTENSIONS:
+        return "text"
+    if extension in IMAGE_EXTENSIONS:
+        return "image"
+    if extension in CODE_EXTENSIONS:
+        return "code"
+    if extension == ".pdf":
+        return "pdf"
+    if extension in VIDEO_EXTENSIONS:
+        return "video"
+    if extension in AUDIO_EXTENSIONS:
+        return "audio"
+    if extension in ARCHIVE_EXTENSIONS:
+        return "archive"
+    return "file"
+
+
+def make_names(count):
+    """
+    Returns count file names with a mix of known, unknown and no extensions.
+    Bilinen, bilinmeyen ve uzantısız adların karışımından count dosya adı döndürür.
+    """
+    extensions = [".py", ".txt", ".JPG", ".o", ".so", ".tar.gz", ".kt", ".flac",
+                  ".mkv", ".pdf", ".d", ".json", "", ".bak", ".zip", ".h"]
+    generator = random.Random(1)
+
+    names = []
+    for index in range(count):
+        names.append("file_%06d%s" % (index, generator.choice(extensions)))
+    return names
+
+
+def best_of(repeat, function):
+    """
+    Fastest of several runs (seconds). / Birkaç çalıştırmanın en hızlısı (saniye).
+    """
+    best = None
+    for run in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    name_count = 100000
+    if len(sys.argv) > 1:
+        name_count = int(sys.argv[1])
+
+    names = make_names(name_count)
+    dir_flags = [False] * name_count
+
+    folder = tempfile.mkdtemp(prefix="bench_category_")
+    try:
+        paths = []
+        for name in names:
+            path = os.path.join(folder, name)
+            open(path, "w").close()
+            paths.append(path)
+
+        # The new API must agree with the old one / Yeni API eskisiyle uyuşmalı
+        for path, category in zip(paths, get_file_categories(names, dir_flags)):
+            expected = legacy_get_file_icon(path)
+            assert EMOJI_ICONS[category] == expected, path
+
+        timings = (
+            ("legacy", best_of(3, lambda: [legacy_get_file_icon(path) for path in paths])),
+            ("lists", best_of(5, lambda: [legacy_category(name) for name in names])),
+            ("single", best_of(5, lambda: [get_file_category(name, False) for name in names])),
+            ("batch", best_of(5, lambda: get_file_categories(names, dir_flags))),
+        )
+    finally:
+        shutil.rmtree(folder)
+
+    print("Names / Adlar: " + str(name_count))
+    print("%-8s %10s %12s %8s" % ("variant", "total ms", "ns/name", "speedup"))
+
+    legacy_time = timings[0][1]
+    for variant, elapsed in timings:
+        print("%-8s %10.1f %12.0f %7.1fx" % (variant, elapsed * 1000.0,
+                                             elapsed * 1e9 / name_count,
+                                             legacy_time / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,672 @@
+# =============================================================================
+# bench_suite.py - Benchmark Suite / Ölçüm Takımı
+# =============================================================================
+# Builds synthetic directory trees in a temporary folder and times the
+# listing pipeline on them, so two versions of the code can be compared:
+#   wide   - one folder with 100k files
+#   deep   - a chain of 50 nested folders with a few files on each level
+#   mixed  - folders with dot files, ".hidden" lists and ignored names
+#   empty  - one folder with many empty subfolders (expander probes)
+#
+# Headless stages (no Tk), run on every folder of a tree:
+#   scan        - scan_directory (scandir, hidden flags, categories, sort)
+#   filter      - HiddenRules.apply and filter_hidden_items
+#   sort        - sort_nodes by name and by size, sort_items_by_type
+#   classify    - get_file_categories on the names
+#   probe       - probe_child_directories on the visible subfolders
+#   pipeline    - explorer_core.load_listing, as used by FileExplorerApp
+#   walk_*      - the whole tree through explorer_core.Loader.walk with a
+#                 thread pool and with a process pool
+# The pipeline stage also records the profiler's call counts.
+#
+# The Tk stages (open, refresh, expand_all) drive a real FileExplorerApp.
+# They run on $DISPLAY, or on a private Xvfb server when Xvfb is installed;
+# otherwise they are skipped and the reason is written to the results.
+#
+# Results are written as JSON; "--compare" prints the change against an
+# earlier results file. Trees are generated from a fixed seed.
+#
+# Geçici bir klasörde sentetik dizin ağaçları oluşturur ve listeleme
+# hattını bunlar üzerinde ölçer; böylece kodun iki sürümü karşılaştırılabilir:
+#   wide   - 100 bin dosyalı tek bir klasör
+#   deep   - her seviyesinde birkaç dosya olan 50 iç içe klasör zinciri
+#   mixed  - nokta dosyaları, ".hidden" listeleri ve yoksayılan adlar içeren klasörler
+#   empty  - çok sayıda boş alt klasörü olan tek bir klasör (genişletici yoklamaları)
+#
+# Arayüzsüz aşamalar (Tk yok), bir ağacın her klasöründe çalışır:
+#   scan        - scan_directory (scandir, gizli bayrakları, kategoriler, sıralama)
+#   filter      - HiddenRules.apply ve filter_hidden_items
+#   sort        - ada ve boyuta göre sort_nodes, sort_items_by_type
+#   classify    - adlar üzerinde get_file_categories
+#   probe       - görünür alt klasörlerde probe_child_directories
+#   pipeline    - FileExplorerApp'in kullandığı explorer_core.load_listing
+#   walk_*      - explorer_core.Loader.walk ile tüm ağaç, bir iş parçacığı
+#                 havuzu ve bir süreç havuzuyla
+# Pipeline aşaması profilleyicinin çağrı sayılarını da kaydeder.
+#
+# Tk aşamaları (open, refresh, expand_all) gerçek bir FileExplorerApp'i
+# sürer. $DISPLAY üzerinde ya da Xvfb kuruluysa özel bir Xvfb sunucusunda
+# çalışırlar; aksi halde atlanır ve nedeni sonuçlara yazılır.
+#
+# Sonuçlar JSON olarak yazılır; "--compare" önceki bir sonuç dosyasına göre
+# değişimi yazdırır. Ağaçlar sabit bir tohumdan üretilir.
+#
+# Usage / Kullanım:
+#   python -m benchmarks.bench_suite [--scale 0.1] [--repeat 3] [--trees wide,deep]
+#                                    [--no-tk] [--output FILE] [--compare FILE]
+# =============================================================================
+
+import os           # File system calls / Dosya sistemi çağrıları
+import sys          # Python version / Python sürümü
+import json         # Results file / Sonuç dosyası
+import time         # Timing / Zamanlama
+import shutil       # Cleanup, Xvfb lookup / Temizlik, Xvfb arama
+import random       # Synthetic names / Sentetik adlar
+import argparse     # Command-line arguments / Komut satırı argümanları
+import platform     # Machine description / Makine açıklaması
+import tempfile     # Temporary folder / Geçici klasör
+import subprocess   # Xvfb and git / Xvfb ve git
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from src import config
+from src.dir_scanner import scan_directory, probe_child_directories
+from src.file_utils import filter_hidden_items, sort_items_by_type, get_file_categories
+from src.hidden_rules import HiddenRules, HIDDEN_LIST_NAME
+from src.explorer_core import LocalFileSystem, Loader, TreeModel
+from src.profiler import Operation
+from src.tree_node import sort_nodes
+
+
+# Tree names in run order / Çalıştırma sırasına göre ağaç adları
+TREE_NAMES = ("wide", "deep", "mixed", "empty")
+
+# Ignore patterns used by the filter stages and the app
+# Filtre aşamalarının ve uygulamanın kullandığı yoksayma desenleri
+PATTERNS = ["__pycache__/", "*.pyc", "node_modules/", "*.tmp", "!keep.tmp"]
+
+# File name extensions of the synthetic trees / Sentetik ağaçların dosya uzantıları
+EXTENSIONS = [".py", ".txt", ".JPG", ".o", ".so", ".tar.gz", ".kt", ".flac",
+              ".mkv", ".pdf", ".d", ".json", "", ".bak", ".zip", ".h", ".pyc", ".tmp"]
+
+# Seconds the Tk stages may take before they are reported as timed out
+# Tk aşamalarının zaman aşımı olarak bildirilmeden önce sürebileceği saniye
+TK_TIMEOUT_S = 300
+
+
+# =============================================================================
+# Synthetic Trees / Sentetik Ağaçlar
+# =============================================================================
+
+def _write_files(folder, names, generator):
+    """
+    Creates files with a few bytes of content each.
+    Her biri birkaç bayt içerikli dosyalar oluşturur.
+    """
+    for name in names:
+        with open(os.path.join(folder, name), "wb") as new_file:
+            new_file.write(b"x" * generator.randint(0, 64))
+
+
+def _file_names(prefix, count, generator, hidden_ratio=0.0):
+    """
+    Returns count file names; about hidden_ratio of them start with a dot.
+    count dosya adı döndürür; yaklaşık hidden_ratio kadarı noktayla başlar.
+    """
+    names = []
+    for index in range(count):
+        name = "%s_%06d%s" % (prefix, index, generator.choice(EXTENSIONS))
+        if generator.random() < hidden_ratio:
+            name = "." + name
+        names.append(name)
+    return names
+
+
+def build_wide(base, scale, generator):
+    """
+    One folder with 100k files (times scale). / 100 bin (çarpı ölçek) dosyalı tek bir klasör.
+    """
+    root = os.path.join(base, "wide")
+    os.mkdir(root)
+    _write_files(root, _file_names("file", max(1, int(100000 * scale)), generator), generator)
+    return root
+
+
+def build_deep(base, scale, generator):
+    """
+    A chain of 50 nested folders with 10 files each (depth is not scaled).
+    Her birinde 10 dosya olan 50 iç içe klasör zinciri (derinlik ölçeklenmez).
+    """
+    root = os.path.join(base, "deep")
+    folder = root
+    for level in range(50):
+        os.mkdir(folder)
+        _write_files(folder, _file_names("level%02d" % level, 10, generator), generator)
+        folder = os.path.join(folder, "sub_%02d" % level)
+    return root
+
+
+def build_mixed(base, scale, generator):
+    """
+    50 folders of 400 entries (times scale): about 30% dot files, a
+    ".hidden" list in every other folder and ignored "__pycache__" folders.
+    400 öğeli (çarpı ölçek) 50 klasör: yaklaşık %30 nokta dosyası, iki
+    klasörden birinde ".hidden" listesi ve yoksayılan "__pycache__" klasörleri.
+    """
+    root = os.path.join(base, "mixed")
+    os.mkdir(root)
+    per_folder = max(1, int(400 * scale))
+
+    for index in range(50):
+        folder = os.path.join(root, "project_%02d" % index)
+        os.mkdir(folder)
+        names = _file_names("src", per_folder, generator, hidden_ratio=0.3)
+        _write_files(folder, names, generator)
+
+        os.mkdir(os.path.join(folder, "__pycache__"))
+        os.mkdir(os.path.join(folder, ".git"))
+        _write_files(os.path.join(folder, "__pycache__"),
+                     _file_names("cached", 5, generator), generator)
+
+        if index % 2 == 0:
+            listed = generator.sample(names, len(names) // 10)
+            with open(os.path.join(folder, HIDDEN_LIST_NAME), "w", encoding="utf-8") as hidden_list:
+                hidden_list.write("\n".join(listed) + "\n")
+    return root
+
+
+def build_empty(base, scale, generator):
+    """
+    One folder with 10k empty subfolders (times scale) and a few files.
+    10 bin (çarpı ölçek) boş alt klasörlü ve birkaç dosyalı tek bir klasör.
+    """
+    root = os.path.join(base, "empty")
+    os.mkdir(root)
+    for index in range(max(1, int(10000 * scale))):
+        os.mkdir(os.path.join(root, "empty_%05d" % index))
+    _write_files(root, _file_names("file", 20, generator), generator)
+    return root
+
+
+TREE_BUILDERS = {
+    "wide": build_wide,
+    "deep": build_deep,
+    "mixed": build_mixed,
+    "empty": build_empty,
+}
+
+
+def list_folders(root):
+    """
+    Every folder of a tree, top-down. / Bir ağacın tüm klasörleri, yukarıdan aşağı.
+    """
+    folders = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names.sort()
+        folders.append(dir_path)
+    return folders
+
+
+# =============================================================================
+# Headless Stages / Arayüzsüz Aşamalar
+# =============================================================================
+
+def measure(repeat, setup, function):
+    """
+    Runs function(setup()) several times; only the call itself is timed.
+    function(setup()) çağrısını birkaç kez çalıştırır; sadece çağrının kendisi ölçülür.
+
+    Returns:
+        dict: best_ms, median_ms and runs_ms. / best_ms, median_ms ve runs_ms.
+    """
+    runs = []
+    for run in range(repeat):
+        state = setup()
+        started = time.perf_counter()
+        function(state)
+        runs.append((time.perf_counter() - started) * 1000.0)
+
+    ordered = sorted(runs)
+    return {
+        "best_ms": round(ordered[0], 3),
+        "median_ms": round(ordered[len(ordered) // 2], 3),
+        "runs_ms": [round(run, 3) for run in runs],
+    }
+
+
+def _scan_all(folders):
+    """
+    Lists every folder (hidden entries included). / Her klasörü listeler (gizliler dahil).
+    """
+    listings = []
+    for folder in folders:
+        listings.append(scan_directory(folder, True))
+    return listings
+
+
+def run_headless(folders, rules, repeat):
+    """
+    Times the headless stages on the folders of one tree.
+    Bir ağacın klasörlerinde arayüzsüz aşamaları ölçer.
+
+    Returns:
+        dict: Stage name -> timings, plus "counts" of the pipeline stage.
+              Aşama adı -> ölçümler, ayrıca pipeline aşamasının "counts" değeri.
+    """
+    def fresh_listings():
+        return _scan_all(folders)
+
+    def fresh_names():
+        names = []
+        for folder in folders:
+            names.append(sorted(os.listdir(folder)))
+        return names
+
+    def filter_stage(listings):
+        for folder, nodes in zip(folders, listings):
+            rules.apply(folder, nodes)
+
+    def filter_names_stage(names):
+        for folder, folder_names in zip(folders, names):
+            filter_hidden_items(folder_names, folder)
+
+    def shuffled_listings():
+        listings = fresh_listings()
+        generator = random.Random(7)
+        for nodes in listings:
+            generator.shuffle(nodes)
+        return listings
+
+    def sort_stage(column):
+        def sort_all(listings):
+            for nodes in listings:
+                sort_nodes(nodes, column)
+        return sort_all
+
+    def sort_names_stage(names):
+        for folder, folder_names in zip(folders, names):
+            sort_items_by_type(folder_names, folder)
+
+    def classify_input():
+        inputs = []
+        for nodes in fresh_listings():
+            names = []
+            dir_flags = []
+            for node in nodes:
+                names.append(node.name)
+                dir_flags.append(node.is_dir)
+            inputs.append((names, dir_flags))
+        return inputs
+
+    def classify_stage(inputs):
+        for names, dir_flags in inputs:
+            get_file_categories(names, dir_flags)
+
+    def visible_listings():
+        listings = fresh_listings()
+        for folder, nodes in zip(folders, listings):
+            rules.apply(folder, nodes)
+        visible = []
+        for nodes in listings:
+            shown = []
+            for node in nodes:
+                if not node.hidden:
+                    shown.append(node)
+            visible.append(shown)
+        return visible
+
+    def probe_stage(visible):
+        for shown in visible:
+            probe_child_directories(shown, False, None, None, rules)
+
+    operations = []
+
+    def new_operation():
+        operation = Operation(len(operations) + 1, "pipeline", "")
+        operations.append(operation)
+        return operation
+
+    # The app's loader, without the listing cache / Uygulamanın yükleyicisi, listeleme önbelleği olmadan
+    file_system = LocalFileSystem(None, rules)
+    loader = Loader(file_system)
+
+    def pipeline_stage(operation):
+        for folder in folders:
+            loader.load(folder, False, True, None, False, None, operation)
+
+    def walk_stage(executor):
+        def walk_tree(state):
+            TreeModel(folders[0], Loader(file_system, executor)).expand_all()
+        return walk_tree
+
+    threads = ThreadPoolExecutor(max_workers=config.WORKER_COUNT)
+    processes = ProcessPoolExecutor(max_workers=config.WORKER_COUNT)
+    try:
+        walk_threads = measure(repeat, lambda: None, walk_stage(threads))
+        walk_processes = measure(repeat, lambda: None, walk_stage(processes))
+    finally:
+        threads.shutdown()
+        processes.shutdown()
+
+    stages = {
+        "scan": measure(repeat, lambda: None, lambda state: _scan_all(folders)),
+        "filter": measure(repeat, fresh_listings, filter_stage),
+        "filter_names": measure(repeat, fresh_names, filter_names_stage),
+        "sort_name": measure(repeat, shuffled_listings, sort_stage("name")),
+        "sort_size": measure(repeat, shuffled_listings, sort_stage("size")),
+        "sort_items_by_type": measure(repeat, fresh_names, sort_names_stage),
+        "classify": measure(repeat, classify_input, classify_stage),
+        "probe": measure(repeat, visible_listings, probe_stage),
+        "pipeline": measure(repeat, new_operation, pipeline_stage),
+        "walk_threads": walk_threads,
+        "walk_processes": walk_processes,
+    }
+
+    # Counts and phases of the last pipeline run / Son pipeline çalıştırmasının sayıları ve aşamaları
+    last = operations[-1].to_dict()
+    stages["pipeline"]["counts"] = last["counts"]
+    stages["pipeline"]["phases_ms"] = last["phases_ms"]
+    return stages
+
+
+# =============================================================================
+# Tk Stages / Tk Aşamaları
+# =============================================================================
+
+def start_xvfb():
+    """
+    Starts a private Xvfb server when there is no display.
+    Ekran yoksa özel bir Xvfb sunucusu başlatır.
+
+    Returns:
+        tuple: (process or None, reason the Tk stages cannot run or None).
+               (süreç veya None, Tk aşamalarının çalışamama nedeni veya None).
+    """
+    if os.environ.get("DISPLAY"):
+        return None, None
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None, "no $DISPLAY and Xvfb is not installed"
+
+    # First free display number / İlk boş ekran numarası
+    display = 99
+    while (os.path.exists("/tmp/.X11-unix/X%d" % display)
+           or os.path.exists("/tmp/.X%d-lock" % display)):
+        display += 1
+
+    process = subprocess.Popen([xvfb, ":%d" % display, "-screen", "0", "1280x1024x24",
+                                "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # Wait for the server socket / Sunucu soketini bekle
+    deadline = time.monotonic() + 10.0
+    while not os.path.exists("/tmp/.X11-unix/X%d" % display):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            return None, "Xvfb did not start"
+        time.sleep(0.05)
+
+    os.environ["DISPLAY"] = ":%d" % display
+    return process, None
+
+
+def _pump(root, done, timeout):
+    """
+    Runs the Tk event loop until done() is true.
+    done() doğru olana kadar Tk olay döngüsünü çalıştırır.
+
+    Returns:
+        float or None: Seconds it took, None on timeout. / Geçen saniye; zaman aşımında None.
+    """
+    started = time.perf_counter()
+    while not done():
+        if time.perf_counter() - started > timeout:
+            return None
+        root.update()
+        time.sleep(0.001)
+    return time.perf_counter() - started
+
+
+def run_tk(tree_root, timeout):
+    """
+    Opens a tree in a real FileExplorerApp and times open, refresh and
+    Expand All.
+    Bir ağacı gerçek bir FileExplorerApp'te açar ve açma, yenileme ve
+    Tümünü Genişlet'i ölçer.
+
+    Returns:
+        dict: Stage name -> ms (None on timeout), plus profiler totals.
+              Aşama adı -> ms (zaman aşımında None), ayrıca profilleyici toplamları.
+    """
+    import tkinter as tk
+    from src.file_explorer import FileExplorerApp
+
+    root = tk.Tk()
+    root.geometry("1000x700")
+    started = time.perf_counter()
+    app = FileExplorerApp(root, directory=tree_root)
+    results = {}
+
+    # Top-level operations as the app measured them (the history is short)
+    # Uygulamanın ölçtüğü üst düzey işlemler (geçmiş kısadır)
+    operations = []
+
+    def collect(operation):
+        if operation.parent is None:
+            operations.append(operation.to_dict())
+
+    app.profiler.listeners.append(collect)
+
+    try:
+        def loads_done():
+            return not app._loads
+
+        def refresh_done():
+            return not app._rescans and not app._loads
+
+        def expand_done():
+            return app._expand_job is None
+
+        elapsed = _pump(root, loads_done, timeout)
+        if elapsed is not None:
+            elapsed = time.perf_counter() - started
+        results["open"] = elapsed
+
+        app.refresh_view()
+        results["refresh"] = _pump(root, refresh_done, timeout)
+
+        app.expand_all()
+        results["expand_all"] = _pump(root, expand_done, timeout)
+
+        for name in ("open", "refresh", "expand_all"):
+            if results[name] is not None:
+                results[name] = round(results[name] * 1000.0, 3)
+
+        results["ui_ms"] = round(app.profiler.ui_seconds * 1000.0, 3)
+        results["longest_ui_block_ms"] = round(app.profiler.longest_ui_block * 1000.0, 3)
+        results["ui_blocks"] = app.profiler.ui_block_count
+        results["rows"] = len(app.nodes)
+        results["operations"] = operations
+    finally:
+        app._on_close()
+    return results
+
+
+# =============================================================================
+# Results / Sonuçlar
+# =============================================================================
+
+def _git_revision():
+    """
+    Current commit of the checkout, or None. / Çalışma kopyasının geçerli commit'i veya None.
+    """
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                         stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode("ascii").strip()
+
+
+def compare(old_results, new_results):
+    """
+    Prints the best times of two runs side by side.
+    İki çalıştırmanın en iyi sürelerini yan yana yazdırır.
+    """
+    print("%-7s %-20s %12s %12s %8s" % ("tree", "stage", "old ms", "new ms", "change"))
+    for tree_name, tree in new_results["trees"].items():
+        old_tree = old_results.get("trees", {}).get(tree_name)
+        if old_tree is None:
+            continue
+
+        for stage, timings in tree["headless"].items():
+            old_timings = old_tree.get("headless", {}).get(stage)
+            if old_timings is None or not old_timings["best_ms"]:
+                continue
+            change = timings["best_ms"] / old_timings["best_ms"]
+            print("%-7s %-20s %12.1f %12.1f %7.2fx" % (tree_name, stage, old_timings["best_ms"],
+                                                      timings["best_ms"], change))
+
+        old_tk = old_tree.get("tk") or {}
+        for stage in ("open", "refresh", "expand_all"):
+            old_ms = old_tk.get(stage)
+            new_ms = (tree.get("tk") or {}).get(stage)
+            if not old_ms or new_ms is None:
+                continue
+            print("%-7s %-20s %12.1f %12.1f %7.2fx" % (tree_name, "tk:" + stage, old_ms,
+                                                      new_ms, new_ms / old_ms))
+
+
+def print_summary(results):
+    """
+    Prints the best time of every stage. / Her aşamanın en iyi süresini yazdırır.
+    """
+    for tree_name, tree in results["trees"].items():
+        print("%s: %d folders, %d entries / %d klasör, %d öğe"
+              % (tree_name, tree["folders"], tree["entries"], tree["folders"], tree["entries"]))
+        for stage, timings in tree["headless"].items():
+            print("  %-20s %10.1f ms" % (stage, timings["best_ms"]))
+
+        tk_results = tree.get("tk")
+        if tk_results is None:
+            continue
+        for stage in ("open", "refresh", "expand_all"):
+            if tk_results[stage] is None:
+                print("  %-20s %10s" % ("tk:" + stage, "timeout"))
+            else:
+                print("  %-20s %10.1f ms" % ("tk:" + stage, tk_results[stage]))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="File Explorer benchmark suite / ölçüm takımı")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplies entry counts (0.1 for a quick run) / öğe sayılarını çarpar")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per headless stage / arayüzsüz aşama başına çalıştırma")
+    parser.add_argument("--seed", type=int, default=1,
+                        help="seed of the synthetic names / sentetik adların tohumu")
+    parser.add_argument("--trees", default=",".join(TREE_NAMES),
+                        help="comma-separated trees / virgülle ayrılmış ağaçlar")
+    parser.add_argument("--no-tk", action="store_true",
+                        help="skip the Tk stages / Tk aşamalarını atla")
+    parser.add_argument("--output", default=None,
+                        help="results file (default benchmarks/results/suite-<time>.json)")
+    parser.add_argument("--compare", default=None, metavar="FILE",
+                        help="earlier results to compare with / karşılaştırılacak önceki sonuçlar")
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+
+    tree_names = []
+    for name in arguments.trees.split(","):
+        name = name.strip()
+        if name not in TREE_BUILDERS:
+            raise SystemExit("Unknown tree / Bilinmeyen ağaç: " + name)
+        tree_names.append(name)
+
+    # The app runs without the persistent cache, watcher and name index so
+    # that every run starts cold and leaves nothing behind
+    # Uygulama kalıcı önbellek, izleyici ve ad indeksi olmadan çalışır;
+    # böylece her çalıştırma soğuk başlar ve geride bir şey bırakmaz
+    config.CACHE_ENABLED = False
+    config.WATCHER_MODE = "off"
+    config.NAME_INDEX_ENABLED = False
+    config.PROFILE_OPERATIONS = True
+    config.HIDDEN_PATTERNS = PATTERNS
+    rules = HiddenRules(PATTERNS, use_hidden_lists=True)
+
+    xvfb = None
+    tk_skipped = "--no-tk"
+    if not arguments.no_tk:
+        try:
+            import tkinter
+            xvfb, tk_skipped = start_xvfb()
+        except ImportError:
+            tk_skipped = "tkinter is not available"
+
+    results = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "scale": arguments.scale,
+            "repeat": arguments.repeat,
+            "seed": arguments.seed,
+            "patterns": PATTERNS,
+            "tk_skipped": tk_skipped,
+        },
+        "trees": {},
+    }
+
+    base = tempfile.mkdtemp(prefix="bench_suite_")
+    try:
+        for tree_name in tree_names:
+            generator = random.Random("%d-%s" % (arguments.seed, tree_name))
+            print("Building / Oluşturuluyor: " + tree_name)
+            tree_root = TREE_BUILDERS[tree_name](base, arguments.scale, generator)
+
+            folders = list_folders(tree_root)
+            entries = 0
+            for folder in folders:
+                entries += len(os.listdir(folder))
+
+            tree = {
+                "folders": len(folders),
+                "entries": entries,
+                "headless": run_headless(folders, rules, arguments.repeat),
+                "tk": None,
+            }
+            if tk_skipped is None:
+                tree["tk"] = run_tk(tree_root, TK_TIMEOUT_S)
+            results["trees"][tree_name] = tree
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    output = arguments.output
+    if output is None:
+        folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+        os.makedirs(folder, exist_ok=True)
+        output = os.path.join(folder, "suite-%s.json" % time.strftime("%Y%m%d-%H%M%S"))
+    with open(output, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2, ensure_ascii=False)
+
+    print_summary(results)
+    if tk_skipped is not None:
+        print("Tk stages skipped / Tk aşamaları atlandı: " + tk_skipped)
+    print("Results / Sonuçlar: " + output)
+
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as old_file:
+            compare(json.load(old_file), results)
+
+
+if __name__ == "__main__":
+    main()
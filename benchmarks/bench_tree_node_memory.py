@@ -0,0 +1,114 @@
+# =============================================================================
+# bench_tree_node_memory.py - TreeNode Memory Benchmark / TreeNode Bellek Ölçümü
+# =============================================================================
+# Compares the memory used by the compact __slots__ TreeNode with the
+# previous __dict__-based node that stored a full path string per node.
+# A synthetic tree is built in memory (no disk access) together with an
+# item-id -> node dictionary like FileExplorerApp.nodes.
+#
+# Kompakt __slots__ TreeNode'un bellek kullanımını, düğüm başına tam yol
+# metni saklayan önceki __dict__ tabanlı düğümle karşılaştırır. Bellekte
+# sentetik bir ağaç oluşturulur (diske erişim yok), yanında
+# FileExplorerApp.nodes gibi bir öğe-id -> düğüm sözlüğü de tutulur.
+#
+# Usage / Kullanım:
+#   python -m benchmarks.bench_tree_node_memory [folders] [files_per_folder]
+# =============================================================================
+
+import os           # Path joining / Yol birleştirme
+import sys          # Command-line arguments / Komut satırı argümanları
+import gc           # Clean measurements / Temiz ölçümler
+import tracemalloc  # Memory measurement / Bellek ölçümü
+
+from src.tree_node import TreeNode
+
+
+class LegacyTreeNode:
+    """
+    The previous TreeNode layout: __dict__ per node, full path, list per node.
+    Önceki TreeNode düzeni: düğüm başına __dict__, tam yol, düğüm başına liste.
+    """
+
+    def __init__(self, name, path, is_dir, category=None, hidden=False):
+        self.name = name
+        self.path = path
+        self.is_dir = is_dir
+        self.category = category or ("directory" if is_dir else "file")
+        self.hidden = hidden
+        self.children = []
+        self.loaded = False
+        self.has_children = None
+        self.stale = False
+        self.size = None
+        self.mtime = None
+
+    def add_children(self, child_nodes):
+        self.children.extend(child_nodes)
+
+
+def build_tree(node_class, folder_count, files_per_folder):
+    """
+    Builds root -> folders -> files and an item-id map of every node.
+    kök -> klasörler -> dosyalar ağacını ve tüm düğümlerin öğe-id haritasını oluşturur.
+    """
+    root_path = "/srv/build/monorepo/output"
+    root = node_class("output", root_path, True)
+    item_map = {"I0": root}
+
+    folders = []
+    for folder_index in range(folder_count):
+        name = "module_%05d" % folder_index
+        folders.append(node_class(name, os.path.join(root_path, name), True))
+    root.add_children(folders)
+
+    for folder in folders:
+        folder_path = folder.path
+        files = []
+        for file_index in range(files_per_folder):
+            name = "object_file_%06d.o" % file_index
+            files.append(node_class(name, os.path.join(folder_path, name), False,
+                                    category="file"))
+        folder.add_children(files)
+        for node in files:
+            item_map["I%X" % len(item_map)] = node
+
+    return root, item_map
+
+
+def measure(node_class, folder_count, files_per_folder):
+    """
+    Returns (node count, bytes used) for one node class.
+    Bir düğüm sınıfı için (düğüm sayısı, kullanılan bayt) döndürür.
+    """
+    gc.collect()
+    tracemalloc.start()
+    root, item_map = build_tree(node_class, folder_count, files_per_folder)
+    used_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(item_map) + folder_count, used_bytes
+
+
+def main():
+    folder_count = 500
+    files_per_folder = 400
+    if len(sys.argv) > 2:
+        folder_count = int(sys.argv[1])
+        files_per_folder = int(sys.argv[2])
+
+    print("Nodes / Düğümler: " + str(folder_count * (files_per_folder + 1) + 1))
+    print("%-16s %14s %12s" % ("class", "total MB", "bytes/node"))
+
+    results = {}
+    for node_class in (LegacyTreeNode, TreeNode):
+        node_count, used_bytes = measure(node_class, folder_count, files_per_folder)
+        results[node_class.__name__] = used_bytes
+        print("%-16s %14.1f %12.0f" % (node_class.__name__,
+                                        used_bytes / 1024.0 / 1024.0,
+                                        used_bytes / float(node_count)))
+
+    ratio = results["LegacyTreeNode"] / float(results["TreeNode"])
+    print("Saving / Kazanç: %.1fx" % ratio)
+
+
+if __name__ == "__main__":
+    main()
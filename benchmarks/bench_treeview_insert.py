@@ -0,0 +1,197 @@
+# =============================================================================
+# bench_treeview_insert.py - Treeview Insert Benchmark / Treeview Ekleme Ölçümü
+# =============================================================================
+# Compares ways of putting 50k rows (10% folders with a "Yükleniyor..."
+# placeholder) into a ttk.Treeview:
+#   per_row  - one treeview.insert per row and per placeholder (the
+#              previous FileExplorerApp._insert_rows)
+#   bulk     - BulkInserter: one Tcl call per chunk of rows
+#   tk_floor - a Tcl loop creating the same items without text and
+#              without any Python work: the cost of Tk itself, so
+#              per_row / tk_floor is the best speedup any path that
+#              creates one Treeview item per row can reach
+# Each variant inserts in chunks of INSERT_CHUNK_SIZE rows and the time
+# includes a final update_idletasks, so layout and redraw are counted.
+#
+# Needs a display: $DISPLAY, or Xvfb (started like in bench_suite).
+#
+# 50 bin satırı (%10'u "Yükleniyor..." yer tutuculu klasör) bir
+# ttk.Treeview'a koyma yollarını karşılaştırır:
+#   per_row  - satır ve yer tutucu başına bir treeview.insert (önceki
+#              FileExplorerApp._insert_rows)
+#   bulk     - BulkInserter: satır parçası başına bir Tcl çağrısı
+#   tk_floor - aynı öğeleri metinsiz ve hiç Python işi olmadan oluşturan
+#              bir Tcl döngüsü: Tk'nin kendi maliyeti; bu yüzden
+#              per_row / tk_floor, satır başına bir Treeview öğesi oluşturan
+#              herhangi bir yolun ulaşabileceği en iyi hızlanmadır
+# Her varyant INSERT_CHUNK_SIZE satırlık parçalar halinde ekler ve süreye
+# son bir update_idletasks dahildir; böylece yerleşim ve çizim sayılır.
+#
+# Ekran gerekir: $DISPLAY veya Xvfb (bench_suite'teki gibi başlatılır).
+#
+# Usage / Kullanım:
+#   python -m benchmarks.bench_treeview_insert [row_count]
+# =============================================================================
+
+import sys          # Command-line arguments / Komut satırı argümanları
+import time         # Timing / Zamanlama
+
+from src import config
+from src.treeview_bulk import BulkInserter
+from benchmarks.bench_suite import start_xvfb
+
+
+# Creates count empty rows and a placeholder under every tenth one
+# count boş satır ve her onuncusunun altına bir yer tutucu oluşturur
+TK_FLOOR_PROC = """
+proc ::bench_tk_floor {tree count} {
+    for {set index 0} {$index < $count} {incr index} {
+        set item [$tree insert {} end]
+        if {$index % 10 == 0} {
+            $tree insert $item end
+        }
+    }
+}
+"""
+
+
+def make_rows(count):
+    """
+    Returns (text, is_folder) rows; every tenth one is a folder.
+    (metin, klasör_mü) satırları döndürür; her onuncusu bir klasör.
+    """
+    rows = []
+    for index in range(count):
+        if index % 10 == 0:
+            rows.append(("📁 folder_%06d" % index, True))
+        else:
+            rows.append(("📄 file_%06d.txt" % index, False))
+    return rows
+
+
+def insert_per_row(treeview, rows):
+    """
+    The previous path: one insert call per row and per placeholder.
+    Önceki yol: satır ve yer tutucu başına bir insert çağrısı.
+    """
+    for text, is_folder in rows:
+        item_id = treeview.insert("", "end", text=text, open=False, values=())
+        if is_folder:
+            treeview.insert(item_id, "end", text="Yükleniyor...")
+
+
+def insert_bulk(bulk, rows):
+    """
+    The current path: builds the arguments like FileExplorerApp._insert_rows
+    and makes one BulkInserter call.
+    Şimdiki yol: argümanları FileExplorerApp._insert_rows gibi oluşturur ve
+    tek bir BulkInserter çağrısı yapar.
+    """
+    texts = []
+    folder_rows = []
+    for index, (text, is_folder) in enumerate(rows):
+        texts.append(text)
+        if is_folder:
+            folder_rows.append(index)
+    bulk.insert_rows("", texts, None, folder_rows, "Yükleniyor...")
+
+
+def insert_tk_floor(treeview, rows):
+    """
+    Tk's own cost for the rows: same items, no text, no Python per row.
+    Satırlar için Tk'nin kendi maliyeti: aynı öğeler, metin yok, satır başına Python yok.
+    """
+    treeview.tk.call("::bench_tk_floor", str(treeview), len(rows))
+
+
+def tree_texts(treeview):
+    """
+    Returns (text, child texts) of the top-level rows.
+    En üst seviye satırların (metin, alt metinler) çiftlerini döndürür.
+    """
+    texts = []
+    for item_id in treeview.get_children(""):
+        child_texts = [treeview.item(child_id, "text") for child_id in treeview.get_children(item_id)]
+        texts.append((treeview.item(item_id, "text"), child_texts))
+    return texts
+
+
+def timed(root, treeview, insert_chunk, rows, chunk_size):
+    """
+    Inserts rows chunk by chunk into an empty tree and returns the seconds.
+    Satırları boş bir ağaca parça parça ekler ve saniyeyi döndürür.
+    """
+    treeview.delete(*treeview.get_children(""))
+    root.update_idletasks()
+
+    started = time.perf_counter()
+    for start in range(0, len(rows), chunk_size):
+        insert_chunk(rows[start:start + chunk_size])
+    root.update_idletasks()
+    elapsed = time.perf_counter() - started
+
+    assert len(treeview.get_children("")) == len(rows)
+    return elapsed
+
+
+def main():
+    row_count = 50000
+    if len(sys.argv) > 1:
+        row_count = int(sys.argv[1])
+
+    xvfb, reason = start_xvfb()
+    if reason is not None:
+        print("Skipped / Atlandı: " + reason)
+        return
+
+    import tkinter as tk
+    from tkinter import ttk
+
+    try:
+        root = tk.Tk()
+        root.geometry("800x600")
+        treeview = ttk.Treeview(root, show="tree", columns=("size", "modified", "type"))
+        treeview.pack(fill="both", expand=True)
+        root.update()
+
+        rows = make_rows(row_count)
+        chunk_size = config.INSERT_CHUNK_SIZE
+        bulk = BulkInserter(treeview)
+        root.tk.eval(TK_FLOOR_PROC)
+
+        # Both paths must build the same tree / İki yol da aynı ağacı kurmalı
+        timed(root, treeview, lambda chunk: insert_bulk(bulk, chunk), rows[:100], chunk_size)
+        bulk_texts = tree_texts(treeview)
+        timed(root, treeview, lambda chunk: insert_per_row(treeview, chunk), rows[:100], chunk_size)
+        row_texts = tree_texts(treeview)
+        assert bulk_texts == row_texts
+
+        timings = []
+        for variant, insert_chunk in (
+                ("per_row", lambda chunk: insert_per_row(treeview, chunk)),
+                ("bulk", lambda chunk: insert_bulk(bulk, chunk)),
+                ("tk_floor", lambda chunk: insert_tk_floor(treeview, chunk))):
+            best = None
+            for run in range(3):
+                elapsed = timed(root, treeview, insert_chunk, rows, chunk_size)
+                if best is None or elapsed < best:
+                    best = elapsed
+            timings.append((variant, best))
+
+        root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print("Rows / Satırlar: %d, chunk / parça: %d" % (row_count, chunk_size))
+    print("%-8s %10s %10s %8s" % ("variant", "total ms", "us/row", "speedup"))
+    per_row_time = timings[0][1]
+    for variant, elapsed in timings:
+        print("%-8s %10.1f %10.2f %7.1fx" % (variant, elapsed * 1000.0,
+                                            elapsed * 1e6 / row_count,
+                                            per_row_time / elapsed))
+
+
+if __name__ == "__main__":
+    main()
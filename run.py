@@ -10,9 +10,13 @@
 # Usage / Kullanım:
 #   python run.py                  -> Opens with home directory / Ev dizini ile açar
 #   python run.py /path/to/dir     -> Opens with specified directory / Belirtilen dizin ile açar
+#   python run.py --trace [file]   -> Writes a JSON trace of every operation
+#                                     (default explorer_trace.jsonl)
+#                                     Her işlemin JSON izini yazar
+#                                     (varsayılan explorer_trace.jsonl)
 # =============================================================================
 
-import sys                              # For command-line arguments / Komut satırı argümanları için
+import argparse                         # For command-line arguments / Komut satırı argümanları için
 import tkinter as tk                    # For the main window / Ana pencere için
 from src.file_explorer import FileExplorerApp   # Main application class / Ana uygulama sınıfı
 
@@ -22,18 +26,25 @@ def main():
     Creates the main window and starts the File Explorer application.
     Ana pencereyi oluşturur ve FileExplorerApp uygulamasını başlatır.
     """
-    # Create the main Tkinter window / Ana Tkinter penceresini oluştur
+    # Optional starting directory and trace file
+    # İsteğe bağlı başlangıç dizini ve iz dosyası
+    parser = argparse.ArgumentParser(description="File Explorer / Dosya Gezgini")
+    parser.add_argument("directory", nargs="?", default=None,
+                        help="starting directory / başlangıç dizini")
+    parser.add_argument("--trace", nargs="?", const="explorer_trace.jsonl", default=None,
+                        metavar="FILE",
+                        help="write a JSON Lines trace of operations / işlemlerin JSON Lines izini yaz")
+    arguments = parser.parse_args()
+
+    # Create the main Tkinter window (after the arguments, so --help and
+    # usage errors work without a display)
+    # Ana Tkinter penceresini oluştur (argümanlardan sonra; böylece --help ve
+    # kullanım hataları ekran olmadan da çalışır)
     root = tk.Tk()
 
-    # Check if a starting directory was provided as a command-line argument
-    # Komut satırı argümanı olarak başlangıç dizini verilip verilmediğini kontrol et
-    if len(sys.argv) > 1:
-        initial_directory = sys.argv[1]
-    else:
-        initial_directory = None
-
     # Create the File Explorer application / FileExplorerApp uygulamasını oluştur
-    app = FileExplorerApp(root, directory=initial_directory)
+    app = FileExplorerApp(root, directory=arguments.directory,
+                          trace_path=arguments.trace)
 
     # Start the Tkinter event loop (keeps the window open and processes events)
     # Tkinter olay döngüsünü başlat (pencereyi açık tutar ve olayları işler)
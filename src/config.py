@@ -0,0 +1,213 @@
+# =============================================================================
+# config.py - Application Settings / Uygulama Ayarları
+# =============================================================================
+# Tunable settings used by the file explorer. Values here are defaults;
+# FileExplorerApp copies them into instance attributes at start-up.
+#
+# Dosya gezgininin kullandığı ayarlanabilir değerler. Buradaki değerler
+# varsayılandır; FileExplorerApp başlangıçta bunları örnek özniteliklerine
+# kopyalar.
+# =============================================================================
+
+# --- Folder expander ("Yükleniyor...") mode / Klasör genişletici modu ---
+# "probe"      : Read each subfolder only until its first visible entry.
+#                Her alt klasörü sadece ilk görünür öğeye kadar oku.
+# "optimistic" : Always show an expander, fix it when the folder is opened.
+#                Useful on slow network mounts.
+#                Her zaman genişletici göster, klasör açılınca düzelt.
+#                Yavaş ağ bağlantılarında kullanışlıdır.
+EXPANDER_MODE = "probe"
+
+# --- Background loading / Arka planda yükleme ---
+# Number of worker threads that read directories
+# Dizinleri okuyan işçi iş parçacığı sayısı
+WORKER_COUNT = 4
+
+# Rows inserted into the Treeview per UI step (one Tcl call each)
+# Her arayüz adımında Treeview'a eklenen satır sayısı (her biri tek Tcl çağrısı)
+INSERT_CHUNK_SIZE = 2000
+
+# How often (ms) finished background jobs are checked
+# Biten arka plan işlerinin ne sıklıkla (ms) kontrol edildiği
+POLL_INTERVAL_MS = 20
+
+# --- Virtualized listing / Sanal listeleme ---
+# Folders with more entries than this are shown page by page
+# Bundan fazla öğesi olan klasörler sayfa sayfa gösterilir
+VIRTUAL_THRESHOLD = 5000
+
+# Rows inserted per page (visible window plus margin)
+# Sayfa başına eklenen satır (görünür pencere artı pay)
+VIRTUAL_PAGE_SIZE = 200
+
+# --- Persistent listing cache / Kalıcı listeleme önbelleği ---
+# Reuse listings of unchanged directories across refreshes and restarts
+# Değişmeyen dizinlerin listelerini yenilemeler ve yeniden başlatmalar arasında kullan
+CACHE_ENABLED = True
+
+# SQLite file; None = ~/.cache/FileExplorerApp/listings.sqlite3
+# SQLite dosyası; None = ~/.cache/FileExplorerApp/listings.sqlite3
+CACHE_PATH = None
+
+# Maximum number of cached directories (least recently used are dropped)
+# Önbellekteki en fazla dizin sayısı (en uzun süredir kullanılmayanlar atılır)
+CACHE_MAX_DIRECTORIES = 20000
+
+# Listings kept in memory when the SQLite file is disabled or unavailable
+# (0 = none); evicted folders open again from here without a scan
+# SQLite dosyası kapalıysa veya kullanılamıyorsa bellekte tutulan listeler
+# (0 = hiç); boşaltılan klasörler buradan taramasız yeniden açılır
+MEMORY_CACHE_MAX_DIRECTORIES = 5000
+
+# --- Node budget / Düğüm bütçesi ---
+# When the tree holds more items than this, collapsed folders that were not
+# touched recently are unloaded (rows and nodes) and get their "Yükleniyor..."
+# placeholder back; 0 = never unload
+# Ağaç bundan fazla öğe tutunca, yakın zamanda dokunulmamış daraltılmış
+# klasörler boşaltılır (satırlar ve düğümler) ve "Yükleniyor..." yer
+# tutucularını geri alır; 0 = hiç boşaltma
+NODE_BUDGET = 100000
+
+# A collapsed folder is kept at least this long (seconds) after its last use
+# Daraltılmış bir klasör son kullanımından sonra en az bu kadar tutulur (saniye)
+EVICT_IDLE_S = 30
+
+# --- Idle prefetch / Boşta ön yükleme ---
+# Read visible, unopened folders and the parent of the root into the listing
+# cache while the explorer is idle, so opening them or going up is instant
+# Gezgin boştayken görünür, açılmamış klasörleri ve kökün üst klasörünü
+# listeleme önbelleğine oku; böylece onları açmak veya yukarı çıkmak anında olur
+PREFETCH_ENABLED = True
+
+# Quiet time (ms) after the last scroll, load or click before prefetching
+# Ön yüklemeden önce son kaydırma, yükleme veya tıklamadan sonraki sessizlik (ms)
+PREFETCH_IDLE_MS = 500
+
+# Folders read per idle period / Boşta geçen süre başına okunan klasör sayısı
+PREFETCH_MAX_FOLDERS = 8
+
+# Memory ceiling: stop after this many entries until the next refresh
+# Bellek sınırı: bir sonraki yenilemeye kadar bu kadar öğeden sonra dur
+PREFETCH_MAX_ENTRIES = 100000
+
+# --- Live folder watcher / Canlı klasör izleyici ---
+# "auto"    : inotify on Linux, polling elsewhere and on network mounts
+#             Linux'ta inotify, diğer yerlerde ve ağ bağlantılarında yoklama
+# "inotify" : same as "auto" / "auto" ile aynı
+# "poll"    : always poll folder mtimes / her zaman klasör mtime yokla
+# "off"     : no live updates / canlı güncelleme yok
+WATCHER_MODE = "auto"
+
+# Changes are applied after this much quiet time (ms) ...
+# Değişiklikler bu kadar sessizlikten (ms) sonra uygulanır ...
+WATCH_QUIET_MS = 300
+
+# ... but never later than this (ms) during a long burst
+# ... ama uzun bir olay patlamasında asla bundan geç değil (ms)
+WATCH_MAX_DELAY_MS = 2000
+
+# Polling interval for the polling watcher (ms)
+# Yoklamalı izleyicinin yoklama aralığı (ms)
+WATCH_POLL_INTERVAL_MS = 2000
+
+# Maximum number of watched folders / En fazla izlenen klasör sayısı
+MAX_WATCHES = 2000
+
+# --- Navigation history / Gezinme geçmişi ---
+# Folders remembered for Back/Forward (Alt+Left / Alt+Right)
+# Geri/İleri için hatırlanan klasörler (Alt+Sol / Alt+Sağ)
+HISTORY_MAX = 50
+
+# Trees of recently left folders kept in memory (least recently used are
+# dropped). Going back to one shows it without reading the disk and
+# checks it for changes in the background.
+# Yakın zamanda ayrılınan klasörlerin bellekte tutulan ağaçları (en uzun
+# süredir kullanılmayanlar atılır). Birine geri dönmek onu diski okumadan
+# gösterir ve arka planda değişiklikleri kontrol eder.
+HISTORY_SNAPSHOTS = 3
+
+# Trees with more items than this are not kept / Bundan fazla öğeli ağaçlar tutulmaz
+HISTORY_SNAPSHOT_MAX_NODES = 50000
+
+# --- Expand All budgets / Tümünü Genişlet sınırları ---
+# Deepest level that is opened (root = 0) / Açılan en derin seviye (kök = 0)
+EXPAND_MAX_DEPTH = 3
+
+# Stop loading new folders after this many items / Bu kadar öğeden sonra yeni klasör yükleme
+EXPAND_MAX_NODES = 20000
+
+# Folders read at the same time / Aynı anda okunan klasör sayısı
+EXPAND_PARALLEL_LOADS = 8
+
+# --- File search / Dosya arama ---
+# Folders read at the same time during a search / Arama sırasında aynı anda okunan klasör sayısı
+SEARCH_WORKERS = 4
+
+# Search stops after this many matches / Arama bu kadar eşleşmeden sonra durur
+SEARCH_MAX_RESULTS = 10000
+
+# Results added to the list per UI step / Her arayüz adımında listeye eklenen sonuç sayısı
+SEARCH_RESULTS_PER_TICK = 500
+
+# --- File name index / Dosya adı indeksi ---
+# Use the on-disk name index of a directory when it exists (built from the
+# File menu) and update it in the background when the directory is opened
+# Bir dizinin diskteki ad indeksini varsa kullan (Dosya menüsünden oluşturulur)
+# ve dizin açılınca arka planda güncelle
+NAME_INDEX_ENABLED = True
+NAME_INDEX_AUTO_UPDATE = True
+
+# Maximum results of an index query / Bir indeks sorgusunun en fazla sonucu
+NAME_INDEX_MAX_RESULTS = 2000
+
+# --- Folder size (info window) / Klasör boyutu (bilgi penceresi) ---
+# Folders read at the same time / Aynı anda okunan klasör sayısı
+DIR_SIZE_WORKERS = 4
+
+# Cached subtree totals are trusted for this long (seconds)
+# Önbellekteki alt ağaç toplamlarına bu kadar süre güvenilir (saniye)
+DIR_SIZE_CACHE_MAX_AGE_S = 600
+
+# --- Hidden entries / Gizli öğeler ---
+# Also hide names listed in a folder's ".hidden" file (one name per line)
+# Bir klasörün ".hidden" dosyasında listelenen adları da gizle (satır başına bir ad)
+HIDDEN_FILE_LISTS = True
+
+# gitignore-style name patterns treated as hidden, e.g.
+# ["__pycache__/", "*.pyc", "node_modules/", "!keep.pyc"]
+# Gizli sayılan gitignore tarzı ad desenleri, ör.
+# ["__pycache__/", "*.pyc", "node_modules/", "!keep.pyc"]
+HIDDEN_PATTERNS = []
+
+# --- Detail columns / Ayrıntı sütunları ---
+# Show Size, Modified and Type columns (costs one stat per entry on POSIX)
+# Boyut, Değiştirilme ve Tür sütunlarını göster (POSIX'te öğe başına bir stat)
+SHOW_DETAIL_COLUMNS = False
+
+# --- Content sniffing / İçerik koklama ---
+# Files with no known extension that are visible in the tree are classified
+# in the background by their first 512 bytes (magic numbers, text check)
+# Ağaçta görünen ve bilinen bir uzantısı olmayan dosyalar arka planda ilk
+# 512 baytlarına göre sınıflandırılır (sihirli sayılar, metin kontrolü)
+CONTENT_SNIFFING = True
+
+# Cached results (least recently used are dropped)
+# Önbellekteki sonuçlar (en uzun süredir kullanılmayanlar atılır)
+CONTENT_SNIFF_CACHE_SIZE = 20000
+
+# Wait this long (ms) after scrolling before reading visible files
+# Görünür dosyaları okumadan önce kaydırmadan sonra bu kadar bekle (ms)
+CONTENT_SNIFF_DELAY_MS = 150
+
+# --- Profiling / Profilleme ---
+# Measure folder loads, refreshes and Expand All (phases, file system
+# calls, items per second, UI thread time). Also turned on by the
+# performance panel and by "python run.py --trace".
+# Klasör yüklemelerini, yenilemeleri ve Tümünü Genişlet'i ölç (aşamalar,
+# dosya sistemi çağrıları, saniyedeki öğe, UI iş parçacığı süresi).
+# Performans paneli ve "python run.py --trace" ile de açılır.
+PROFILE_OPERATIONS = False
+
+# Show the performance panel above the status bar at start-up
+# Başlangıçta durum çubuğunun üstünde performans panelini göster
+SHOW_DEBUG_PANEL = False
@@ -0,0 +1,231 @@
+# =============================================================================
+# content_sniffer.py - Content-Based File Types / İçeriğe Dayalı Dosya Türleri
+# =============================================================================
+# Files whose extension says nothing (build outputs, logs, "README",
+# "Makefile", ...) are classified by their first bytes: known magic
+# numbers identify images, archives, PDFs, audio/video and executables,
+# and a sample that decodes as UTF-8 without control bytes is text.
+#
+# At most SNIFF_BYTES bytes are read with a single os.pread call. Results
+# are cached by (device, inode, mtime, size), so a file is only read
+# again after it has changed. The cache is shared by worker threads.
+#
+# Uzantısı bir şey söylemeyen dosyalar (derleme çıktıları, günlükler,
+# "README", "Makefile", ...) ilk baytlarına göre sınıflandırılır: bilinen
+# sihirli sayılar resimleri, arşivleri, PDF'leri, ses/videoyu ve
+# çalıştırılabilir dosyaları tanır; kontrol baytı içermeden UTF-8 olarak
+# çözülen bir örnek metindir.
+#
+# Tek bir os.pread çağrısıyla en fazla SNIFF_BYTES bayt okunur. Sonuçlar
+# (aygıt, inode, mtime, boyut) ile önbelleğe alınır; böylece bir dosya
+# sadece değiştikten sonra tekrar okunur. Önbellek işçi iş parçacıkları
+# tarafından paylaşılır.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import stat         # Regular file check / Normal dosya kontrolü
+import threading    # Cache lock / Önbellek kilidi
+from collections import OrderedDict
+
+
+# Bytes read from the start of a file / Dosyanın başından okunan bayt
+SNIFF_BYTES = 512
+
+# --- Magic numbers / Sihirli sayılar ---
+# (category, ((offset, bytes), ...)): every part must match
+# (kategori, ((konum, baytlar), ...)): her parça eşleşmeli
+MAGIC_SIGNATURES = (
+    ("image", ((0, b"\x89PNG\r\n\x1a\n"),)),
+    ("image", ((0, b"\xff\xd8\xff"),)),
+    ("image", ((0, b"GIF87a"),)),
+    ("image", ((0, b"GIF89a"),)),
+    ("image", ((0, b"II*\x00"),)),
+    ("image", ((0, b"MM\x00*"),)),
+    ("image", ((0, b"RIFF"), (8, b"WEBP"))),
+    ("pdf", ((0, b"%PDF-"),)),
+    ("archive", ((0, b"PK\x03\x04"),)),
+    ("archive", ((0, b"PK\x05\x06"),)),
+    ("archive", ((0, b"\x1f\x8b"),)),
+    ("archive", ((0, b"BZh"),)),
+    ("archive", ((0, b"\xfd7zXZ\x00"),)),
+    ("archive", ((0, b"\x28\xb5\x2f\xfd"),)),
+    ("archive", ((0, b"7z\xbc\xaf\x27\x1c"),)),
+    ("archive", ((0, b"Rar!\x1a\x07"),)),
+    ("archive", ((257, b"ustar"),)),
+    ("executable", ((0, b"\x7fELF"),)),
+    ("executable", ((0, b"\xcf\xfa\xed\xfe"),)),
+    ("executable", ((0, b"\xce\xfa\xed\xfe"),)),
+    ("executable", ((0, b"\xca\xfe\xba\xbe"),)),
+    ("audio", ((0, b"ID3"),)),
+    ("audio", ((0, b"OggS"),)),
+    ("audio", ((0, b"fLaC"),)),
+    ("audio", ((0, b"RIFF"), (8, b"WAVE"))),
+    ("video", ((0, b"RIFF"), (8, b"AVI "))),
+    ("video", ((0, b"\x1aE\xdf\xa3"),)),
+    ("video", ((4, b"ftyp"),)),
+    ("code", ((0, b"#!"),)),
+)
+
+# Control bytes allowed in text: \b \t \n \f \r and ESC (colored logs)
+# Metinde izin verilen kontrol baytları: \b \t \n \f \r ve ESC (renkli günlükler)
+TEXT_CONTROL_BYTES = frozenset(b"\b\t\n\f\r\x1b")
+
+# Bytes that make a sample binary / Bir örneği ikili yapan baytlar
+BINARY_BYTES = bytes(byte for byte in range(32) if byte not in TEXT_CONTROL_BYTES) + b"\x7f"
+
+# Cache value of files that were read but not recognized
+# Okunan ama tanınmayan dosyaların önbellek değeri
+_UNRECOGNIZED = "file"
+
+
+def _looks_like_text(data):
+    """
+    True if a sample is UTF-8 text without binary control bytes.
+    Bir örnek ikili kontrol baytı içermeyen UTF-8 metinse True.
+    """
+    # Bytes of BINARY_BYTES are removed; if anything was removed it is binary
+    # BINARY_BYTES baytları silinir; bir şey silindiyse ikilidir
+    if len(data.translate(None, BINARY_BYTES)) != len(data):
+        return False
+
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError as error:
+        # The sample may end inside a multi-byte character
+        # Örnek çok baytlı bir karakterin ortasında bitebilir
+        return error.reason == "unexpected end of data" and error.start >= len(data) - 3
+    return True
+
+
+def sniff_bytes(data):
+    """
+    Classifies the first bytes of a file.
+    Bir dosyanın ilk baytlarını sınıflandırır.
+
+    Args:
+        data (bytes): Start of the file. / Dosyanın başı.
+    Returns:
+        str or None: Category name, or None if unrecognized (or empty).
+                     Kategori adı; tanınmazsa (veya boşsa) None.
+    """
+    if not data:
+        return None
+
+    for category, parts in MAGIC_SIGNATURES:
+        matched = True
+        for offset, magic in parts:
+            if data[offset:offset + len(magic)] != magic:
+                matched = False
+                break
+        if matched:
+            return category
+
+    if _looks_like_text(data):
+        return "text"
+    return None
+
+
+def _read_head(path):
+    """
+    Reads at most SNIFF_BYTES bytes from the start of a regular file.
+    Normal bir dosyanın başından en fazla SNIFF_BYTES bayt okur.
+
+    Returns:
+        bytes or None: None for anything that is not a regular file.
+                       Normal dosya olmayan her şey için None.
+    """
+    # O_NONBLOCK: a FIFO swapped in after the stat must not hang the worker
+    # O_NONBLOCK: stat'tan sonra yerine konan bir FIFO işçiyi kilitlememeli
+    flags = os.O_RDONLY | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags)
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        if hasattr(os, "pread"):
+            return os.pread(fd, SNIFF_BYTES, 0)
+        return os.read(fd, SNIFF_BYTES)
+    finally:
+        os.close(fd)
+
+
+class ContentSniffer:
+    """
+    Content classifier with a result cache; safe to use from several threads.
+    Sonuç önbellekli içerik sınıflandırıcı; birden çok iş parçacığından kullanılabilir.
+    """
+
+    def __init__(self, max_entries=20000):
+        """
+        Args:
+            max_entries (int): Cache size (least recently used are dropped).
+                               Önbellek boyutu (en uzun süredir kullanılmayanlar atılır).
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()     # (dev, ino, mtime_ns, size) -> category
+        self._lock = threading.Lock()
+
+    def sniff(self, path):
+        """
+        Returns the content category of a file, or None if unknown.
+        Bir dosyanın içerik kategorisini döndürür; bilinmiyorsa None.
+
+        Args:
+            path (str): File path (symbolic links are followed).
+                        Dosya yolu (sembolik bağlar takip edilir).
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        with self._lock:
+            category = self._entries.get(key)
+            if category is not None:
+                self._entries.move_to_end(key)
+                return self._result(category)
+
+        try:
+            data = _read_head(path)
+        except OSError:
+            return None
+        if data is None:
+            return None
+
+        category = sniff_bytes(data) or _UNRECOGNIZED
+        with self._lock:
+            self._entries[key] = category
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self._result(category)
+
+    def sniff_many(self, paths):
+        """
+        Classifies several files (one worker job per visible batch).
+        Birkaç dosyayı sınıflandırır (görünür grup başına bir işçi görevi).
+
+        Returns:
+            list: Category or None for each path. / Her yol için kategori veya None.
+        """
+        categories = []
+        for path in paths:
+            categories.append(self.sniff(path))
+        return categories
+
+    def clear(self):
+        """
+        Forgets every result. / Tüm sonuçları unutur.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _result(category):
+        """
+        Maps the cached value to the returned one. / Önbellek değerini dönüş değerine çevirir.
+        """
+        if category == _UNRECOGNIZED:
+            return None
+        return category
@@ -0,0 +1,383 @@
+# =============================================================================
+# dir_scanner.py - Directory Listing Engine / Dizin Listeleme Motoru
+# =============================================================================
+# Reads a directory in a single os.scandir() pass and returns fully populated
+# TreeNode objects (name, type, icon category, hidden flag). The entry type
+# comes from the cached d_type of each DirEntry, so no extra stat call is
+# needed for normal files and folders.
+#
+# Bir dizini tek bir os.scandir() geçişinde okur ve tamamen doldurulmuş
+# TreeNode nesneleri (ad, tür, ikon kategorisi, gizli bayrağı) döndürür.
+# Öğe türü her DirEntry'nin önbelleklenmiş d_type değerinden gelir, bu yüzden
+# normal dosya ve klasörler için ek stat çağrısı gerekmez.
+# =============================================================================
+
+import os  # For os.scandir / os.scandir için
+
+from .tree_node import TreeNode, sort_nodes
+from .file_utils import get_file_categories, is_hidden_entry
+from .hidden_rules import read_hidden_list
+from . import profiler
+
+
+class ScanCancelled(Exception):
+    """
+    Raised when a scan is stopped through its cancel event.
+    Tarama iptal olayı ile durdurulduğunda fırlatılır.
+    """
+
+
+def _entry_is_dir(entry):
+    """
+    Returns True if the entry is a directory (follows symlinks like os.path.isdir).
+    Öğe klasörse True döndürür (os.path.isdir gibi sembolik bağları takip eder).
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_broken_link(entry, entry_is_dir):
+    """
+    Returns True for a symbolic link whose target does not exist.
+    Hedefi olmayan bir sembolik bağ için True döndürür.
+    """
+    # Only symlinks need an extra check / Sadece sembolik bağlar ek kontrol gerektirir
+    if entry_is_dir or not entry.is_symlink():
+        return False
+    return not os.path.exists(entry.path)
+
+
+def scan_directory(dir_path, show_hidden=False, cancel_event=None, with_stat=False):
+    """
+    Lists a directory in one pass and returns sorted TreeNode objects.
+    Bir dizini tek geçişte listeler ve sıralı TreeNode nesneleri döndürür.
+
+    Args:
+        dir_path (str): Directory path. / Dizin yolu.
+        show_hidden (bool): Include hidden entries. / Gizli öğeleri dahil et.
+        cancel_event (threading.Event, optional): Stops the scan when set.
+                                                  Ayarlanınca taramayı durdurur.
+        with_stat (bool): Also fill size and mtime (one stat per entry on POSIX).
+                          Boyut ve mtime değerlerini de doldur (POSIX'te öğe başına bir stat).
+    Returns:
+        list: TreeNode objects, directories first. / TreeNode nesneleri, önce klasörler.
+    Raises:
+        OSError: If the directory cannot be read. / Dizin okunamazsa.
+        ScanCancelled: If cancel_event was set. / cancel_event ayarlandıysa.
+    """
+    nodes = []
+    names = []
+    dir_flags = []
+    broken_links = []
+
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ScanCancelled(dir_path)
+
+            hidden = is_hidden_entry(entry)
+
+            # Skip hidden entries if needed / Gerekirse gizli öğeleri atla
+            if hidden and not show_hidden:
+                continue
+
+            entry_is_dir = _entry_is_dir(entry)
+            node = TreeNode(entry.name, entry.path, entry_is_dir, hidden=hidden)
+
+            # A broken link gets the "unknown" icon / Kırık bağ "bilinmeyen" ikonu alır
+            if _is_broken_link(entry, entry_is_dir):
+                broken_links.append(node)
+
+            # Optional stat: free on Windows, one syscall on POSIX
+            # İsteğe bağlı stat: Windows'ta maliyetsiz, POSIX'te bir sistem çağrısı
+            if with_stat:
+                try:
+                    entry_stat = entry.stat()
+                    node.size = entry_stat.st_size
+                    node.mtime = entry_stat.st_mtime
+                except OSError:
+                    node.size = 0
+                    node.mtime = 0.0
+
+            nodes.append(node)
+            names.append(entry.name)
+            dir_flags.append(entry_is_dir)
+
+    # Icon categories of the whole listing at once / Tüm listenin ikon kategorileri tek seferde
+    for node, category in zip(nodes, get_file_categories(names, dir_flags)):
+        node.category = category
+    for node in broken_links:
+        node.category = "unknown"
+
+    # Calls made for this listing (the profiler ignores them when off)
+    # Bu liste için yapılan çağrılar (profilleyici kapalıyken yok sayar)
+    profiler.count("scandir")
+    if with_stat:
+        profiler.count("stat", len(nodes))
+    if broken_links:
+        profiler.count("stat", len(broken_links))
+
+    # Sort: directories first, then files / Sırala: önce klasörler, sonra dosyalar
+    sort_nodes(nodes)
+    return nodes
+
+
+def nodes_to_entries(nodes):
+    """
+    Converts nodes to compact tuples for the listing cache.
+    Düğümleri listeleme önbelleği için kompakt demetlere çevirir.
+
+    Returns:
+        list: (name, is_dir, size, mtime, hidden, category) tuples.
+    """
+    entries = []
+    for node in nodes:
+        entries.append((node.name, node.is_dir, node.size, node.mtime,
+                        node.hidden, node.category))
+    return entries
+
+
+def entries_to_nodes(dir_path, entries):
+    """
+    Rebuilds TreeNode objects from cached tuples (no file system access).
+    Önbellekteki demetlerden TreeNode nesnelerini yeniden oluşturur (dosya sistemine erişmez).
+
+    Args:
+        dir_path (str): Directory the entries belong to. / Öğelerin ait olduğu dizin.
+        entries (list): Tuples from nodes_to_entries. / nodes_to_entries demetleri.
+    Returns:
+        list: TreeNode objects in the cached (sorted) order. / Önbellekteki (sıralı) düzende TreeNode nesneleri.
+    """
+    # Entry names never contain a separator, so one join is enough
+    # Öğe adları asla ayırıcı içermez, bu yüzden tek bir join yeterlidir
+    prefix = os.path.join(dir_path, "")
+
+    nodes = []
+    for name, entry_is_dir, size, mtime, hidden, category in entries:
+        node = TreeNode(name, prefix + name, entry_is_dir,
+                        category=category, hidden=hidden)
+        node.size = size
+        node.mtime = mtime
+        nodes.append(node)
+    return nodes
+
+
+def read_directory(dir_path, cache=None, cancel_event=None, with_stat=False,
+                   rules=None):
+    """
+    Returns all entries of a directory (hidden ones included), using the
+    listing cache when the directory has not changed since it was stored.
+    The cache keeps the plain hidden flag (name or attribute); the hiding
+    rules are applied afterwards, so changed rules or an edited ".hidden"
+    file take effect without invalidating it.
+    Bir dizinin tüm öğelerini (gizliler dahil) döndürür; dizin saklandığından
+    beri değişmediyse listeleme önbelleğini kullanır. Önbellek yalın gizli
+    bayrağını (ad veya öznitelik) tutar; gizleme kuralları sonradan
+    uygulanır, böylece değişen kurallar veya düzenlenen bir ".hidden"
+    dosyası önbelleği geçersiz kılmadan etkili olur.
+
+    Args:
+        dir_path (str): Directory path. / Dizin yolu.
+        cache (ListingCache, optional): Persistent listing cache. / Kalıcı listeleme önbelleği.
+        cancel_event (threading.Event, optional): Stops the scan when set.
+                                                  Ayarlanınca taramayı durdurur.
+        with_stat (bool): Entries must have size and mtime. / Öğelerde boyut ve mtime olmalı.
+        rules (HiddenRules, optional): ".hidden" files and ignore patterns.
+                                       ".hidden" dosyaları ve yoksayma desenleri.
+    Returns:
+        list: Sorted TreeNode objects. / Sıralı TreeNode nesneleri.
+    Raises:
+        OSError: If the directory cannot be read. / Dizin okunamazsa.
+        ScanCancelled: If cancel_event was set. / cancel_event ayarlandıysa.
+    """
+    with profiler.phase("scan"):
+        if cache is None:
+            nodes = scan_directory(dir_path, True, cancel_event, with_stat)
+        else:
+            # The directory's own stat validates the cached listing
+            # Dizinin kendi stat bilgisi önbellekteki listeyi doğrular
+            dir_stat = os.stat(dir_path)
+            profiler.count("stat")
+            entries = cache.get(dir_path, dir_stat, with_stat)
+            if entries is not None:
+                profiler.count("cache_hit")
+                nodes = entries_to_nodes(dir_path, entries)
+            else:
+                profiler.count("cache_miss")
+                nodes = scan_directory(dir_path, True, cancel_event, with_stat)
+                cache.put(dir_path, dir_stat, nodes_to_entries(nodes))
+
+    if rules is not None:
+        with profiler.phase("filter"):
+            rules.apply(dir_path, nodes)
+    return nodes
+
+
+def _any_visible(dir_path, candidates, rules):
+    """
+    True if one of the candidates survives the hiding rules. The folder's
+    ".hidden" file is read only when a candidate gets that far.
+    Adaylardan biri gizleme kurallarından geçerse True. Klasörün ".hidden"
+    dosyası sadece bir aday o noktaya gelirse okunur.
+
+    Args:
+        candidates (iterable): (name, is_dir) of entries not hidden by name
+                               or attribute. / Ada veya özniteliğe göre
+                               gizli olmayan öğelerin (ad, klasör_mü) değerleri.
+    """
+    hidden_names = None
+    for name, entry_is_dir in candidates:
+        if rules is None:
+            return True
+        if rules.is_ignored(name, entry_is_dir):
+            continue
+        if not rules.use_hidden_lists:
+            return True
+
+        if hidden_names is None:
+            hidden_names = read_hidden_list(dir_path)
+        if name not in hidden_names:
+            return True
+    return False
+
+
+def has_visible_children(dir_path, show_hidden=False, cache=None, rules=None):
+    """
+    Checks if a directory has at least one visible entry.
+    Stops reading at the first one, so large folders cost almost nothing.
+    Bir dizinde en az bir görünür öğe olup olmadığını kontrol eder.
+    İlk öğede okumayı bırakır, bu yüzden büyük klasörlerin maliyeti çok düşüktür.
+
+    Args:
+        dir_path (str): Directory path. / Dizin yolu.
+        show_hidden (bool): Count hidden entries. / Gizli öğeleri say.
+        cache (ListingCache, optional): Persistent listing cache. / Kalıcı listeleme önbelleği.
+        rules (HiddenRules, optional): ".hidden" files and ignore patterns.
+                                       ".hidden" dosyaları ve yoksayma desenleri.
+    Returns:
+        bool: True if not empty. False if empty or unreadable.
+              Boş değilse True. Boşsa veya okunamıyorsa False.
+    """
+    # A valid cached listing answers without reading the directory
+    # Geçerli bir önbellek listesi dizini okumadan cevap verir
+    if cache is not None:
+        try:
+            profiler.count("stat")
+            entries = cache.get(dir_path, os.stat(dir_path))
+        except OSError:
+            return False
+
+        if entries is not None:
+            if show_hidden:
+                return len(entries) > 0
+            candidates = ((entry[0], entry[1]) for entry in entries if not entry[4])
+            return _any_visible(dir_path, candidates, rules)
+
+    try:
+        # Leaving the "with" block closes the iterator early
+        # "with" bloğundan çıkmak yineleyiciyi erkenden kapatır
+        profiler.count("scandir")
+        with os.scandir(dir_path) as entries:
+            if show_hidden:
+                for entry in entries:
+                    return True
+                return False
+
+            candidates = ((entry.name, _entry_is_dir(entry)) for entry in entries
+                          if not is_hidden_entry(entry))
+            return _any_visible(dir_path, candidates, rules)
+    except OSError:
+        # Cannot access directory / Dizine erişilemedi
+        return False
+
+
+def probe_child_directories(nodes, show_hidden=False, cancel_event=None, cache=None,
+                            rules=None):
+    """
+    Sets has_children on every directory node using has_visible_children.
+    Her klasör düğümünün has_children değerini has_visible_children ile ayarlar.
+
+    Args:
+        nodes (list): TreeNode objects. / TreeNode nesneleri.
+        show_hidden (bool): Count hidden entries. / Gizli öğeleri say.
+        cache (ListingCache, optional): Persistent listing cache. / Kalıcı listeleme önbelleği.
+        rules (HiddenRules, optional): ".hidden" files and ignore patterns.
+                                       ".hidden" dosyaları ve yoksayma desenleri.
+        cancel_event (threading.Event, optional): Stops probing when set.
+                                                  Ayarlanınca yoklamayı durdurur.
+    Raises:
+        ScanCancelled: If cancel_event was set. / cancel_event ayarlandıysa.
+    """
+    for node in nodes:
+        if not node.is_dir:
+            continue
+        if cancel_event is not None and cancel_event.is_set():
+            raise ScanCancelled(node.path)
+        node.has_children = has_visible_children(node.path, show_hidden, cache, rules)
+
+
+def merge_listing(old_children, new_children):
+    """
+    Compares a loaded listing with a fresh scan. Entries that still exist
+    keep their old node object (and so their loaded subtree); their
+    attributes are updated in place.
+    Yüklenmiş bir listeyi yeni bir taramayla karşılaştırır. Hâlâ var olan
+    öğeler eski düğüm nesnelerini (ve böylece yüklenmiş alt ağaçlarını)
+    korur; öznitelikleri yerinde güncellenir.
+
+    Args:
+        old_children (list): Current TreeNode children. / Mevcut TreeNode alt öğeleri.
+        new_children (list): Freshly scanned, sorted TreeNodes. / Yeni taranmış, sıralı TreeNode'lar.
+    Returns:
+        tuple: (merged, added, removed, changed)
+            merged  - new sorted children list / yeni sıralı alt öğe listesi
+            added   - nodes that are new / yeni düğümler
+            removed - old nodes that are gone / kaybolan eski düğümler
+            changed - kept nodes whose attributes changed / öznitelikleri değişen düğümler
+    """
+    old_by_name = {}
+    for node in old_children:
+        old_by_name[node.name] = node
+
+    merged = []
+    added = []
+    changed = []
+
+    for new_node in new_children:
+        old_node = old_by_name.pop(new_node.name, None)
+
+        # New entry, or a file that became a folder (or the reverse)
+        # Yeni öğe veya klasöre dönüşen bir dosya (ya da tersi)
+        if old_node is None or old_node.is_dir != new_node.is_dir:
+            if old_node is not None:
+                old_by_name[new_node.name + "/"] = old_node
+            merged.append(new_node)
+            added.append(new_node)
+            continue
+
+        # Same entry: copy attributes that may have changed
+        # Aynı öğe: değişmiş olabilecek öznitelikleri kopyala
+        is_changed = False
+        for attribute in ("category", "hidden", "size", "mtime", "has_children"):
+            new_value = getattr(new_node, attribute)
+
+            # A scan gives "file" to names without a known extension; a
+            # category found by content sniffing is kept (and rechecked by it)
+            # Tarama bilinen uzantısı olmayan adlara "file" verir; içerik
+            # koklamayla bulunan kategori korunur (ve onun tarafından yeniden kontrol edilir)
+            if (attribute == "category" and new_value == "file"
+                    and old_node.category not in ("file", "unknown")):
+                continue
+
+            if getattr(old_node, attribute) != new_value:
+                setattr(old_node, attribute, new_value)
+                is_changed = True
+
+        if is_changed:
+            changed.append(old_node)
+        merged.append(old_node)
+
+    removed = list(old_by_name.values())
+    return merged, added, removed, changed
@@ -0,0 +1,354 @@
+# =============================================================================
+# dir_size.py - Recursive Folder Size / Özyinelemeli Klasör Boyutu
+# =============================================================================
+# Computes the disk usage of a folder like "du": every file under it is
+# counted by its allocated blocks (st_blocks * 512, or st_size where the
+# system has no st_blocks). Folders are read in parallel with os.scandir
+# by a small thread pool, and the running total can be read while the
+# computation is going on.
+#
+# When a folder's subtree is finished its total is cached together with
+# the folder's st_mtime_ns and st_ino and the paths of its subfolders. A
+# later computation (for example for the parent folder) uses the cached
+# total instead of walking the subtree again, after checking that no
+# folder in the subtree changed: every folder below is stat'ed again (one
+# stat per folder instead of one scandir and one stat per entry). A
+# folder's mtime only changes when entries are added, removed or renamed,
+# so cached totals are also dropped after a maximum age to pick up files
+# that grew in place.
+#
+# Bir klasörün disk kullanımını "du" gibi hesaplar: altındaki her dosya
+# ayrılmış bloklarıyla sayılır (st_blocks * 512; sistemde st_blocks yoksa
+# st_size). Klasörler küçük bir iş parçacığı havuzunda os.scandir ile
+# paralel okunur ve hesaplama sürerken ara toplam okunabilir.
+#
+# Bir klasörün alt ağacı bitince toplamı, klasörün st_mtime_ns ve st_ino
+# değerleri ve alt klasörlerinin yollarıyla birlikte önbelleğe alınır.
+# Sonraki bir hesaplama (ör. üst klasör için), alt ağaçta hiçbir klasörün
+# değişmediğini kontrol ettikten sonra alt ağacı tekrar gezmek yerine
+# önbellekteki toplamı kullanır: alttaki her klasör yeniden stat edilir
+# (öğe başına bir scandir ve bir stat yerine klasör başına bir stat). Bir
+# klasörün mtime değeri sadece öğe eklenince, silinince veya yeniden
+# adlandırılınca değişir; bu yüzden yerinde büyüyen dosyaları yakalamak
+# için önbellekteki toplamlar belli bir süre sonra atılır.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import time         # Cache age / Önbellek yaşı
+import threading    # Locks and cancel event / Kilitler ve iptal olayı
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def _allocated_size(stat_result):
+    """
+    Bytes a file uses on disk. / Bir dosyanın diskte kullandığı bayt.
+    """
+    blocks = getattr(stat_result, "st_blocks", None)
+    if blocks is None:
+        return stat_result.st_size
+    return blocks * 512
+
+
+class DirSizeCache:
+    """
+    Subtree totals of folders, validated by the mtime and inode of every
+    folder in the subtree and by age.
+    Klasörlerin alt ağaç toplamları; alt ağaçtaki her klasörün mtime ve
+    inode değerleri ve yaş ile doğrulanır.
+    """
+
+    def __init__(self, max_entries=50000, max_age_s=600):
+        """
+        Args:
+            max_entries (int): Size cap (least recently used are dropped).
+                               Boyut sınırı (en uzun süredir kullanılmayanlar atılır).
+            max_age_s (float): Totals older than this are not used (seconds).
+                               Bundan eski toplamlar kullanılmaz (saniye).
+        """
+        self.max_entries = max_entries
+        self.max_age_s = max_age_s
+        self._entries = OrderedDict()     # path -> (mtime_ns, ino, time, totals, subfolders)
+        self._lock = threading.Lock()
+
+    def get(self, dir_path, dir_stat):
+        """
+        Returns the cached (bytes, files, folders) of a folder, or None.
+        Every folder below it is stat'ed again; one changed, missing or
+        uncached folder makes the total unusable.
+        Bir klasörün önbellekteki (bayt, dosya, klasör) değerlerini döndürür,
+        yoksa None. Altındaki her klasör yeniden stat edilir; değişmiş,
+        silinmiş veya önbellekte olmayan tek bir klasör toplamı kullanılmaz yapar.
+        """
+        totals = self._lookup(dir_path, dir_stat)
+        if totals is None:
+            return None
+
+        # Walk the subtree with a stack (deep trees would hit the recursion limit)
+        # Alt ağacı bir yığınla gez (derin ağaçlar özyineleme sınırına takılırdı)
+        pending = list(self._subfolders(dir_path))
+        while pending:
+            path = pending.pop()
+            try:
+                folder_stat = os.stat(path, follow_symlinks=False)
+            except OSError:
+                return None
+            if self._lookup(path, folder_stat) is None:
+                return None
+            pending.extend(self._subfolders(path))
+        return totals
+
+    def _lookup(self, dir_path, dir_stat):
+        """
+        Returns the totals of one folder if its own stamp and age are valid.
+        Bir klasörün kendi damgası ve yaşı geçerliyse toplamlarını döndürür.
+        """
+        with self._lock:
+            cached = self._entries.get(dir_path)
+            if cached is None:
+                return None
+
+            mtime_ns, ino, stored_at, totals, subfolders = cached
+            if mtime_ns != dir_stat.st_mtime_ns or ino != dir_stat.st_ino:
+                return None
+            if time.monotonic() - stored_at > self.max_age_s:
+                return None
+
+            self._entries.move_to_end(dir_path)
+            return totals
+
+    def _subfolders(self, dir_path):
+        """
+        Paths of the subfolders stored with a folder's total.
+        Bir klasörün toplamıyla saklanan alt klasörlerinin yolları.
+        """
+        with self._lock:
+            cached = self._entries.get(dir_path)
+            if cached is None:
+                return ()
+            return cached[4]
+
+    def put(self, dir_path, dir_stat, totals, subfolders=()):
+        """
+        Stores the (bytes, files, folders) of a finished folder.
+        Bitmiş bir klasörün (bayt, dosya, klasör) değerlerini saklar.
+
+        Args:
+            subfolders (list): Paths of its direct subfolders. / Doğrudan alt klasörlerinin yolları.
+        """
+        with self._lock:
+            self._entries[dir_path] = (dir_stat.st_mtime_ns, dir_stat.st_ino,
+                                       time.monotonic(), totals, tuple(subfolders))
+            self._entries.move_to_end(dir_path)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Forgets every total. / Tüm toplamları unutur.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class _Folder:
+    """
+    A folder being summed (used by the coordinator thread).
+    Toplanmakta olan bir klasör (koordinatör iş parçacığı kullanır).
+    """
+
+    __slots__ = ("path", "stat", "parent", "bytes", "files", "folders", "pending",
+                 "subfolders")
+
+    def __init__(self, path, stat, parent):
+        self.path = path
+        self.stat = stat            # Stat of the folder itself / Klasörün kendi stat bilgisi
+        self.parent = parent        # Parent _Folder or None / Ebeveyn _Folder veya None
+        self.bytes = 0              # Subtree bytes / Alt ağaç baytları
+        self.files = 0              # Subtree files / Alt ağaç dosyaları
+        self.folders = 0            # Subtree folders / Alt ağaç klasörleri
+        self.pending = 0            # Subfolders not finished / Bitmemiş alt klasörler
+        self.subfolders = []        # Paths of direct subfolders / Doğrudan alt klasör yolları
+
+
+class DirSizeJob:
+    """
+    One running folder size computation.
+    Çalışan tek bir klasör boyutu hesaplaması.
+    """
+
+    def __init__(self, dir_path, cache=None, workers=4):
+        """
+        Args:
+            dir_path (str): Folder to measure. / Ölçülecek klasör.
+            cache (DirSizeCache, optional): Shared subtree totals. / Paylaşılan alt ağaç toplamları.
+            workers (int): Parallel folder readers. / Paralel klasör okuyucu sayısı.
+        """
+        self.dir_path = dir_path
+        self.cache = cache
+        self.workers = workers
+        self.cancel_event = threading.Event()
+
+        # Running totals, readable from the UI thread
+        # UI iş parçacığından okunabilen ara toplamlar
+        self.total_bytes = 0
+        self.file_count = 0
+        self.folder_count = 0
+        self.error_count = 0        # Unreadable folders / Okunamayan klasörler
+        self.done = False
+
+        self._lock = threading.Lock()
+        self._seen_links = set()    # (st_dev, st_ino) of hard-linked files / Sabit bağlı dosyalar
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """
+        Starts the computation in the background.
+        Hesaplamayı arka planda başlatır.
+        """
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Stops the computation. / Hesaplamayı durdurur.
+        """
+        self.cancel_event.set()
+
+    def _run(self):
+        """
+        Coordinator thread: schedules folders and adds finished subtrees
+        to their parents.
+        Koordinatör iş parçacığı: klasörleri planlar ve biten alt ağaçları
+        ebeveynlerine ekler.
+        """
+        try:
+            root_stat = os.stat(self.dir_path)
+        except OSError:
+            self.error_count += 1
+            self.done = True
+            return
+
+        # Cached totals leave out the folder's own blocks; du counts them
+        # Önbellekteki toplamlar klasörün kendi bloklarını içermez; du onları sayar
+        self.total_bytes = _allocated_size(root_stat)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                root = _Folder(self.dir_path, root_stat, None)
+                running = {pool.submit(self._scan_folder, root): root}
+
+                while running:
+                    finished, unfinished = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in finished:
+                        folder = running.pop(future)
+                        if self.cancel_event.is_set():
+                            continue
+
+                        subfolders = future.result()
+                        folder.pending = len(subfolders)
+                        for subfolder in subfolders:
+                            running[pool.submit(self._scan_folder, subfolder)] = subfolder
+
+                        if folder.pending == 0:
+                            self._finish_folder(folder)
+        finally:
+            self.done = True
+
+    def _finish_folder(self, folder):
+        """
+        Caches a finished folder and adds it to its parents
+        (which may finish in turn).
+        Biten bir klasörü önbelleğe alır ve ebeveynlerine ekler
+        (onlar da sırayla bitebilir).
+        """
+        while folder is not None:
+            if self.cache is not None and self.error_count == 0:
+                self.cache.put(folder.path, folder.stat,
+                               (folder.bytes, folder.files, folder.folders),
+                               folder.subfolders)
+
+            parent = folder.parent
+            if parent is None:
+                return
+
+            parent.bytes += folder.bytes
+            parent.files += folder.files
+            parent.folders += folder.folders
+            parent.pending -= 1
+            if parent.pending > 0:
+                return
+            folder = parent
+
+    def _scan_folder(self, folder):
+        """
+        Worker job: sums the files of one folder and returns its subfolders
+        that have no cached total.
+        İşçi görevi: bir klasörün dosyalarını toplar ve önbellekte toplamı
+        olmayan alt klasörlerini döndürür.
+        """
+        subfolders = []
+        if self.cancel_event.is_set():
+            return subfolders
+
+        own_bytes = 0
+        own_files = 0
+        cached_folders = 0
+
+        try:
+            with os.scandir(folder.path) as scan:
+                for entry in scan:
+                    try:
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        entry_is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    if not entry_is_dir:
+                        # Hard links are counted once / Sabit bağlar bir kez sayılır
+                        if entry_stat.st_nlink > 1 and not self._first_link(entry_stat):
+                            continue
+                        own_bytes += _allocated_size(entry_stat)
+                        own_files += 1
+                        continue
+
+                    own_bytes += _allocated_size(entry_stat)
+                    folder.subfolders.append(entry.path)
+                    cached = None
+                    if self.cache is not None:
+                        cached = self.cache.get(entry.path, entry_stat)
+
+                    if cached is None:
+                        subfolders.append(_Folder(entry.path, entry_stat, folder))
+                        continue
+
+                    # Reuse the subtree total / Alt ağaç toplamını kullan
+                    own_bytes += cached[0]
+                    own_files += cached[1]
+                    cached_folders += cached[2] + 1
+        except OSError:
+            with self._lock:
+                self.error_count += 1
+
+        folder.bytes += own_bytes
+        folder.files += own_files
+        folder.folders += cached_folders + len(subfolders)
+
+        with self._lock:
+            self.total_bytes += own_bytes
+            self.file_count += own_files
+            self.folder_count += cached_folders + len(subfolders)
+        return subfolders
+
+    def _first_link(self, entry_stat):
+        """
+        True the first time a hard-linked file is seen.
+        Sabit bağlı bir dosya ilk kez görüldüğünde True.
+        """
+        key = (entry_stat.st_dev, entry_stat.st_ino)
+        with self._lock:
+            if key in self._seen_links:
+                return False
+            self._seen_links.add(key)
+            return True
@@ -0,0 +1,406 @@
+# =============================================================================
+# explorer_core.py - Headless Explorer Core / Arayüzsüz Gezgin Çekirdeği
+# =============================================================================
+# The directory logic of the explorer without any Tk code:
+#   LocalFileSystem - the local disk, read through the listing cache and
+#                     the hiding rules
+#   load_listing    - one folder: list, mark hidden, sort, probe subfolders
+#   Loader          - runs loads on an executor (threads or processes) and
+#                     hands out TreeNode batches through futures and iterators
+#   TreeModel       - a root TreeNode that a Loader fills
+#
+# FileExplorerApp uses the same functions for every folder it shows, so a
+# headless run (benchmarks, scripts) measures the code the window runs.
+#
+# With a ProcessPoolExecutor the listing is done in worker processes: they
+# send back compact tuples and the nodes are rebuilt in the caller. Worker
+# processes do not use the SQLite listing cache.
+#
+# Gezginin dizin mantığı, hiç Tk kodu olmadan:
+#   LocalFileSystem - listeleme önbelleği ve gizleme kuralları üzerinden
+#                     okunan yerel disk
+#   load_listing    - tek klasör: listele, gizlileri işaretle, sırala, alt
+#                     klasörleri yokla
+#   Loader          - yüklemeleri bir yürütücüde (iş parçacıkları veya
+#                     süreçler) çalıştırır ve TreeNode gruplarını future'lar
+#                     ve yineleyicilerle verir
+#   TreeModel       - bir Loader'ın doldurduğu kök TreeNode
+#
+# FileExplorerApp gösterdiği her klasör için aynı fonksiyonları kullanır;
+# böylece arayüzsüz bir çalıştırma (ölçümler, betikler) pencerenin
+# çalıştırdığı kodu ölçer.
+#
+# ProcessPoolExecutor ile listeleme işçi süreçlerinde yapılır: kompakt
+# demetler geri gönderilir ve düğümler çağıranda yeniden oluşturulur. İşçi
+# süreçleri SQLite listeleme önbelleğini kullanmaz.
+# =============================================================================
+
+import os           # Path names / Yol adları
+from collections import deque   # Breadth-first queue / Genişlik öncelikli kuyruk
+from concurrent.futures import Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .tree_node import TreeNode, sort_nodes
+from .dir_scanner import (read_directory, probe_child_directories, has_visible_children,
+                          nodes_to_entries, entries_to_nodes)
+from .profiler import NULL_OPERATION, activated
+
+
+class LocalFileSystem:
+    """
+    The local disk, read through the listing cache and the hiding rules.
+    Listeleme önbelleği ve gizleme kuralları üzerinden okunan yerel disk.
+    """
+
+    def __init__(self, cache=None, rules=None):
+        """
+        Args:
+            cache (ListingCache, optional): Persistent listing cache. / Kalıcı listeleme önbelleği.
+            rules (HiddenRules, optional): ".hidden" files and ignore patterns.
+                                           ".hidden" dosyaları ve yoksayma desenleri.
+        """
+        self.cache = cache
+        self.rules = rules
+
+    def list_directory(self, dir_path, cancel_event=None, with_stat=False):
+        """
+        All entries of a folder, hidden ones marked. See read_directory.
+        Bir klasörün tüm öğeleri, gizliler işaretli. Bkz. read_directory.
+        """
+        return read_directory(dir_path, self.cache, cancel_event, with_stat, self.rules)
+
+    def probe(self, nodes, show_hidden=False, cancel_event=None):
+        """
+        Sets has_children on folder nodes. See probe_child_directories.
+        Klasör düğümlerinde has_children ayarlar. Bkz. probe_child_directories.
+        """
+        probe_child_directories(nodes, show_hidden, cancel_event, self.cache, self.rules)
+
+    def has_visible_children(self, dir_path, show_hidden=False):
+        """
+        True if a folder has a visible entry. See has_visible_children.
+        Bir klasörde görünür öğe varsa True. Bkz. has_visible_children.
+        """
+        return has_visible_children(dir_path, show_hidden, self.cache, self.rules)
+
+    def __getstate__(self):
+        # The SQLite connection stays in the parent process
+        # SQLite bağlantısı ana süreçte kalır
+        return {"cache": None, "rules": self.rules}
+
+
+def load_listing(file_system, dir_path, show_hidden=False, probe=True, cancel_event=None,
+                 with_stat=False, sort=None, op=NULL_OPERATION):
+    """
+    Lists a folder, marks hidden entries, sorts and probes the shown
+    subfolders. Hidden entries are returned too (see split_hidden).
+    Bir klasörü listeler, gizli öğeleri işaretler, sıralar ve gösterilen
+    alt klasörleri yoklar. Gizli öğeler de döndürülür (bkz. split_hidden).
+
+    Args:
+        file_system (LocalFileSystem): Where to read. / Okunacak yer.
+        dir_path (str): Folder path. / Klasör yolu.
+        show_hidden (bool): Hidden entries are shown. / Gizli öğeler gösteriliyor.
+        probe (bool): Set has_children of subfolders. / Alt klasörlerin has_children değerini ayarla.
+        cancel_event (threading.Event, optional): Stops the load when set.
+                                                  Ayarlanınca yüklemeyi durdurur.
+        with_stat (bool): Read sizes and dates too. / Boyut ve tarihleri de oku.
+        sort (tuple, optional): (column, reverse) if not by name.
+                                Ada göre değilse (sütun, ters).
+        op (Operation, optional): Profiler operation to report to.
+                                  Bildirilecek profilleyici işlemi.
+    Returns:
+        list: Sorted TreeNode objects. / Sıralı TreeNode nesneleri.
+    Raises:
+        OSError: If the folder cannot be read. / Klasör okunamazsa.
+        ScanCancelled: If cancel_event was set. / cancel_event ayarlandıysa.
+    """
+    with activated(op):
+        children = file_system.list_directory(dir_path, cancel_event, with_stat)
+
+        if sort is not None:
+            with op.phase("sort"):
+                sort_nodes(children, sort[0], sort[1])
+
+        if probe:
+            # Hidden subfolders are probed when they are shown
+            # Gizli alt klasörler gösterildiklerinde yoklanır
+            with op.phase("probe"):
+                shown = children
+                if not show_hidden:
+                    shown = []
+                    for node in children:
+                        if not node.hidden:
+                            shown.append(node)
+                file_system.probe(shown, show_hidden, cancel_event)
+    return children
+
+
+def _load_entries(file_system, dir_path, show_hidden, probe, with_stat, sort):
+    """
+    Worker process job: load_listing as compact tuples.
+    İşçi süreci görevi: kompakt demetler olarak load_listing.
+
+    Returns:
+        tuple: (entries, has_children flags). / (öğeler, has_children bayrakları).
+    """
+    children = load_listing(file_system, dir_path, show_hidden, probe, None,
+                            with_stat, sort)
+    flags = []
+    for node in children:
+        flags.append(node.has_children)
+    return nodes_to_entries(children), flags
+
+
+def split_hidden(children, show_hidden):
+    """
+    Splits a listing into the entries to show and the hidden ones kept aside.
+    Bir listeyi gösterilecek öğelere ve bir kenarda tutulan gizlilere ayırır.
+
+    Returns:
+        tuple: (shown, hidden) lists. / (gösterilen, gizli) listeleri.
+    """
+    if show_hidden:
+        return children, []
+
+    shown = []
+    hidden = []
+    for node in children:
+        if node.hidden:
+            hidden.append(node)
+        else:
+            shown.append(node)
+    return shown, hidden
+
+
+def attach_children(parent_node, children, show_hidden):
+    """
+    Stores a listing on its folder node and marks it loaded.
+    Bir listeyi klasör düğümünde saklar ve yüklenmiş olarak işaretler.
+
+    Returns:
+        list: The shown children. / Gösterilen alt öğeler.
+    """
+    shown, hidden = split_hidden(children, show_hidden)
+    parent_node.set_children(shown)
+    parent_node.set_hidden_children(hidden)
+    parent_node.loaded = True
+    return shown
+
+
+def iter_batches(nodes, batch_size):
+    """
+    Yields consecutive slices of at most batch_size nodes.
+    En fazla batch_size düğümlük ardışık dilimler üretir.
+    """
+    for start in range(0, len(nodes), batch_size):
+        yield nodes[start:start + batch_size]
+
+
+class Loader:
+    """
+    Loads folders on an executor and hands out TreeNode batches.
+    Klasörleri bir yürütücüde yükler ve TreeNode grupları verir.
+    """
+
+    def __init__(self, file_system, executor=None, batch_size=500):
+        """
+        Args:
+            file_system (LocalFileSystem): Where to read. / Okunacak yer.
+            executor (Executor, optional): Thread or process pool; None runs
+                                           everything in the caller.
+                                           İş parçacığı veya süreç havuzu;
+                                           None her şeyi çağıranda çalıştırır.
+            batch_size (int): Nodes per yielded batch. / Üretilen grup başına düğüm.
+        """
+        self.file_system = file_system
+        self.executor = executor
+        self.batch_size = batch_size
+        self.uses_processes = isinstance(executor, ProcessPoolExecutor)
+
+    def load(self, dir_path, show_hidden=False, probe=True, cancel_event=None,
+             with_stat=False, sort=None, op=NULL_OPERATION):
+        """
+        Loads one folder in the calling thread. See load_listing.
+        Bir klasörü çağıran iş parçacığında yükler. Bkz. load_listing.
+        """
+        return load_listing(self.file_system, dir_path, show_hidden, probe,
+                            cancel_event, with_stat, sort, op)
+
+    def submit(self, dir_path, show_hidden=False, probe=True, cancel_event=None,
+               with_stat=False, sort=None, op=NULL_OPERATION):
+        """
+        Loads one folder on the executor.
+        Bir klasörü yürütücüde yükler.
+
+        Returns:
+            Future: Resolves to the sorted TreeNode list. Worker processes
+                    cannot see cancel_event or op.
+                    Sıralı TreeNode listesine çözülür. İşçi süreçleri
+                    cancel_event ve op değerlerini göremez.
+        """
+        if not self.uses_processes:
+            return self.executor.submit(self.load, dir_path, show_hidden, probe,
+                                        cancel_event, with_stat, sort, op)
+
+        # Worker processes send tuples back; nodes are rebuilt here
+        # İşçi süreçleri demet gönderir; düğümler burada yeniden oluşturulur
+        future = Future()
+        entries_future = self.executor.submit(_load_entries, self.file_system, dir_path,
+                                              show_hidden, probe, with_stat, sort)
+
+        def rebuild(done):
+            try:
+                entries, flags = done.result()
+            except BaseException as error:
+                future.set_exception(error)
+                return
+
+            children = entries_to_nodes(dir_path, entries)
+            for node, has_children in zip(children, flags):
+                node.has_children = has_children
+            future.set_result(children)
+
+        entries_future.add_done_callback(rebuild)
+        return future
+
+    def iter_children(self, node, show_hidden=False, probe=True, with_stat=False, sort=None):
+        """
+        Loads a folder node and yields its shown children in batches.
+        Bir klasör düğümünü yükler ve gösterilen alt öğelerini gruplar halinde üretir.
+        """
+        children = self.load(node.path, show_hidden, probe, None, with_stat, sort)
+        shown = attach_children(node, children, show_hidden)
+        for batch in iter_batches(shown, self.batch_size):
+            yield batch
+
+    def walk(self, node, show_hidden=False, probe=False, with_stat=False, max_depth=None,
+             cancel_event=None):
+        """
+        Loads a folder and its subfolders breadth-first, several at a time
+        on the executor. Folders that cannot be read are skipped.
+        Bir klasörü ve alt klasörlerini genişlik öncelikli, yürütücüde
+        aynı anda birkaç tane olarak yükler. Okunamayan klasörler atlanır.
+
+        Args:
+            node (TreeNode): Top folder. / En üst klasör.
+            max_depth (int, optional): Deepest level loaded (node = 0).
+                                       Yüklenen en derin seviye (node = 0).
+        Yields:
+            tuple: (folder node, batch of its shown children).
+                   (klasör düğümü, gösterilen alt öğelerinden bir grup).
+        """
+        if self.executor is None:
+            folders = deque([(node, 0)])
+            while folders:
+                folder, depth = folders.popleft()
+                try:
+                    children = self.load(folder.path, show_hidden, probe, cancel_event,
+                                         with_stat)
+                except OSError:
+                    continue
+
+                shown = attach_children(folder, children, show_hidden)
+                for batch in iter_batches(shown, self.batch_size):
+                    yield folder, batch
+                if max_depth is None or depth < max_depth:
+                    for child in shown:
+                        if child.is_dir:
+                            folders.append((child, depth + 1))
+            return
+
+        pending = {}
+
+        def start(folder, depth):
+            future = self.submit(folder.path, show_hidden, probe, cancel_event, with_stat)
+            pending[future] = (folder, depth)
+
+        start(node, 0)
+        try:
+            while pending:
+                done, running = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, depth = pending.pop(future)
+                    try:
+                        children = future.result()
+                    except OSError:
+                        continue
+
+                    shown = attach_children(folder, children, show_hidden)
+                    for batch in iter_batches(shown, self.batch_size):
+                        yield folder, batch
+                    if max_depth is None or depth < max_depth:
+                        for child in shown:
+                            if child.is_dir:
+                                start(child, depth + 1)
+        finally:
+            # The caller stopped early / Çağıran erken durdu
+            for future in pending:
+                future.cancel()
+
+
+class TreeModel:
+    """
+    A root folder node and the loader that fills it.
+    Bir kök klasör düğümü ve onu dolduran yükleyici.
+    """
+
+    def __init__(self, root_path, loader, root_node=None):
+        """
+        Args:
+            root_path (str): Root folder. / Kök klasör.
+            loader (Loader): Loads the folders. / Klasörleri yükler.
+            root_node (TreeNode, optional): Already loaded folder node of
+                                            root_path to keep as the root.
+                                            root_path'in kök olarak tutulacak,
+                                            zaten yüklenmiş klasör düğümü.
+        """
+        self.loader = loader
+
+        if root_node is not None:
+            root_node.detach()
+            self.root = root_node
+            return
+
+        root_name = os.path.basename(root_path)
+        if root_name == "":
+            root_name = root_path
+
+        self.root = TreeNode(root_name, root_path, True)
+
+    def load(self, node=None, show_hidden=False):
+        """
+        Loads one folder (the root by default) and returns its shown children.
+        Bir klasörü (varsayılan olarak kök) yükler ve gösterilen alt öğelerini döndürür.
+        """
+        if node is None:
+            node = self.root
+
+        shown = []
+        for batch in self.loader.iter_children(node, show_hidden):
+            shown.extend(batch)
+        return shown
+
+    def expand_all(self, max_depth=None, show_hidden=False):
+        """
+        Loads the whole tree (or max_depth levels of it).
+        Tüm ağacı (veya max_depth seviyesini) yükler.
+
+        Returns:
+            int: Nodes loaded. / Yüklenen düğümler.
+        """
+        count = 0
+        for folder, batch in self.loader.walk(self.root, show_hidden, max_depth=max_depth):
+            count += len(batch)
+        return count
+
+    def iter_nodes(self):
+        """
+        Yields every loaded node below the root, depth-first.
+        Kökün altındaki her yüklenmiş düğümü derinlik öncelikli üretir.
+        """
+        stack = list(reversed(self.root.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.is_dir:
+                stack.extend(reversed(node.children))
@@ -9,16 +9,95 @@
 # =============================================================================
 
 import os           # File/directory operations / Dosya/klasör işlemleri
+import re           # Search pattern errors / Arama deseni hataları
 import sys          # System parameters / Sistem parametreleri
 import time         # Time operations / Zaman işlemleri
+import queue        # Thread-safe result queue / İş parçacığı güvenli sonuç kuyruğu
+import threading    # Cancel events / İptal olayları
+from collections import deque, OrderedDict   # Breadth-first queue, LRU order / Genişlik öncelikli kuyruk, LRU sırası
 import subprocess   # For opening files / Dosya açmak için
+from concurrent.futures import ThreadPoolExecutor   # Worker pool / İşçi havuzu
 import tkinter as tk                            # GUI library / GUI kütüphanesi
 from tkinter import ttk, messagebox, filedialog # Widgets, dialogs / Widget'lar, iletişim kutuları
 
 # Import project modules / Proje modüllerini içe aktar
-from .tree_node import TreeNode
-from .file_utils import get_file_icon, is_hidden, format_size
-from .file_utils import filter_hidden_items, sort_items_by_type
+from .tree_node import sort_nodes, NO_CHILDREN
+from .file_utils import is_hidden, format_size, CATEGORY_NAMES, get_file_category
+from .dir_scanner import merge_listing
+from .dir_scanner import ScanCancelled
+from .explorer_core import LocalFileSystem, Loader, TreeModel, split_hidden
+from .listing_cache import ListingCache, MemoryListingCache, default_cache_path
+from .fs_watcher import FolderWatcher
+from .file_search import FileSearch, make_matcher
+from .name_index import IndexBuilder, open_index
+from .dir_size import DirSizeJob, DirSizeCache
+from .content_sniffer import ContentSniffer
+from .hidden_rules import HiddenRules
+from .profiler import Profiler, NULL_OPERATION, format_operation
+from .treeview_bulk import BulkInserter
+from .prefetcher import Prefetcher
+from . import config
+
+
+# Treeview row height in pixels / Piksel cinsinden Treeview satır yüksekliği
+ROW_HEIGHT = 25
+
+# Search mode choices: (label, mode) / Arama modu seçenekleri: (etiket, mod)
+SEARCH_MODE_LABELS = (
+    ("Metin", "substring"),
+    ("Önek", "prefix"),
+    ("Joker (*.txt)", "glob"),
+    ("Düzenli İfade", "regex"),
+)
+
+
+class _LoadJob:
+    """
+    State of one background directory load.
+    Arka planda yapılan tek bir dizin yüklemesinin durumu.
+    """
+
+    def __init__(self, parent_id, parent_node):
+        self.parent_id = parent_id                  # Treeview item ID / Treeview öğe ID'si
+        self.parent_node = parent_node              # Node being loaded / Yüklenen düğüm
+        self.cancel_event = threading.Event()       # Set to cancel / İptal için ayarla
+        self.callbacks = []                         # Called when done / Bitince çağrılır
+        self.inserting = False                      # Rows being inserted? / Satırlar ekleniyor mu?
+        self.sort = None                            # (column, reverse) of the scan / Taramanın (sütun, ters) sırası
+        self.op = NULL_OPERATION                    # Profiler operation / Profilleyici işlemi
+
+
+class _ExpandJob:
+    """
+    State of a running "Expand All" crawl.
+    Çalışan bir "Tümünü Genişlet" taramasının durumu.
+    """
+
+    def __init__(self, max_depth, max_nodes):
+        self.max_depth = max_depth      # Depth budget / Derinlik sınırı
+        self.max_nodes = max_nodes      # Item budget / Öğe sınırı
+        self.pending = deque()          # (item ID, depth) waiting / Bekleyen (öğe ID, derinlik)
+        self.in_flight = set()          # Item IDs loading / Yüklenen öğe ID'leri
+        self.folder_count = 0           # Folders opened / Açılan klasörler
+        self.node_count = 0             # Items loaded / Yüklenen öğeler
+        self.depth = 0                  # Deepest level reached / Ulaşılan en derin seviye
+        self.op = NULL_OPERATION        # Profiler operation / Profilleyici işlemi
+
+
+class _TreeSnapshot:
+    """
+    A tree left by a root change, kept for Back/Forward.
+    Bir kök değişikliğiyle bırakılan, Geri/İleri için tutulan ağaç.
+    """
+
+    def __init__(self, root_node, settings, node_count):
+        self.root_node = root_node      # Loaded root TreeNode / Yüklenmiş kök TreeNode
+        self.settings = settings        # (show_hidden, sort, details) / (gizli, sıralama, ayrıntılar)
+        self.node_count = node_count    # Rows it had / Sahip olduğu satırlar
+        self.expanded = set()           # Open folder nodes / Açık klasör düğümleri
+        self.selection = []             # Selected nodes / Seçili düğümler
+        self.focus = None               # Focused node / Odaktaki düğüm
+        self.scroll = 0.0               # Top of the view (0..1) / Görünümün üstü (0..1)
 
 
 class FileExplorerApp:
@@ -27,7 +106,7 @@ class FileExplorerApp:
     Ana dosya gezgini uygulaması.
     """
 
-    def __init__(self, root, directory=None):
+    def __init__(self, root, directory=None, trace_path=None):
         """
         Initializes the application.
         Uygulamayı başlatır.
@@ -35,6 +114,10 @@ class FileExplorerApp:
         Args:
             root (tk.Tk): Main window. / Ana pencere.
             directory (str, optional): Starting directory. / Başlangıç dizini.
+            trace_path (str, optional): JSON Lines trace file of measured
+                                        operations (turns profiling on).
+                                        Ölçülen işlemlerin JSON Lines iz
+                                        dosyası (profillemeyi açar).
         """
         self.root = root
 
@@ -52,8 +135,139 @@ class FileExplorerApp:
         # Apply theme / Temayı uygula
         self._set_theme()
 
-        # Hidden files toggle / Gizli dosya göster/gizle
+        # Hidden files toggle and the extra hiding rules (see config.py)
+        # Gizli dosya göster/gizle ve ek gizleme kuralları (bkz. config.py)
         self.show_hidden = tk.BooleanVar(value=False)
+        self.hidden_rules = HiddenRules(config.HIDDEN_PATTERNS, config.HIDDEN_FILE_LISTS)
+
+        # Size/Modified/Type columns and the current sort order
+        # Boyut/Değiştirilme/Tür sütunları ve mevcut sıralama düzeni
+        self.show_details = tk.BooleanVar(value=config.SHOW_DETAIL_COLUMNS)
+        self.sort_column = "name"
+        self.sort_reverse = False
+
+        # Expander mode: "probe" or "optimistic" (see config.py)
+        # Genişletici modu: "probe" veya "optimistic" (bkz. config.py)
+        self.expander_mode = config.EXPANDER_MODE
+
+        # Background workers for file system calls
+        # Dosya sistemi çağrıları için arka plan işçileri
+        self.executor = ThreadPoolExecutor(max_workers=config.WORKER_COUNT)
+        self.insert_chunk_size = config.INSERT_CHUNK_SIZE
+
+        # Virtualized listing of huge folders / Çok büyük klasörlerin sanal listelenmesi
+        self.virtual_threshold = config.VIRTUAL_THRESHOLD
+        self.page_size = config.VIRTUAL_PAGE_SIZE
+
+        # Paged folders: Treeview ID -> index of the next row to insert
+        # Sayfalı klasörler: Treeview ID -> eklenecek sonraki satırın indeksi
+        self._page_next = {}
+
+        # "Show next N" rows: row ID -> parent Treeview ID
+        # "Sonraki N" satırları: satır ID -> ebeveyn Treeview ID
+        self._paging_rows = {}
+        self._page_check_scheduled = False
+
+        # "Yükleniyor..." and error rows: parent Treeview ID -> row IDs.
+        # Rows are never recognized by their text (a file may be named
+        # "Hata: ..."), and removing them needs no Treeview query.
+        # "Yükleniyor..." ve hata satırları: ebeveyn Treeview ID -> satır ID'leri.
+        # Satırlar asla metinlerinden tanınmaz (bir dosyanın adı "Hata: ..."
+        # olabilir) ve onları kaldırmak Treeview sorgusu gerektirmez.
+        self._status_rows = {}
+
+        # Node budget: loaded folders by last use (least recent first),
+        # Treeview ID -> time.monotonic(); see _evict_collapsed
+        # Düğüm bütçesi: son kullanıma göre yüklenmiş klasörler (en eski
+        # önce), Treeview ID -> time.monotonic(); bkz. _evict_collapsed
+        self.node_budget = config.NODE_BUDGET
+        self._touched = OrderedDict()
+        self._evict_scheduled = False
+
+        # Persistent listing cache (None if disabled or unavailable)
+        # Kalıcı listeleme önbelleği (kapalıysa veya kullanılamıyorsa None)
+        self.listing_cache = self._open_listing_cache()
+
+        # Headless core: folders are read through the file system and the
+        # loader (see explorer_core.py); this class only shows the result
+        # Arayüzsüz çekirdek: klasörler dosya sistemi ve yükleyici üzerinden
+        # okunur (bkz. explorer_core.py); bu sınıf sadece sonucu gösterir
+        self.file_system = LocalFileSystem(self.listing_cache, self.hidden_rules)
+        self.loader = Loader(self.file_system, self.executor, self.insert_chunk_size)
+        self.model = None
+
+        # Live watcher for loaded folders: path -> Treeview ID
+        # Yüklenmiş klasörler için canlı izleyici: yol -> Treeview ID
+        self.watcher = self._create_watcher()
+        self._watched = {}
+
+        # Finished jobs waiting for the UI thread / UI iş parçacığını bekleyen biten işler
+        self._ui_queue = queue.Queue()
+        self._background_count = 0
+        self._poll_scheduled = False
+
+        # Pending directory loads: Treeview ID -> _LoadJob
+        # Bekleyen dizin yüklemeleri: Treeview ID -> _LoadJob
+        self._loads = {}
+        self._refresh_done_message = ""
+
+        # Pending refresh rescans: Treeview ID -> _LoadJob
+        # Bekleyen yenileme taramaları: Treeview ID -> _LoadJob
+        self._rescans = {}
+        self._refresh_pending = 0
+
+        # Running Expand All crawl / Çalışan Tümünü Genişlet taraması
+        self._expand_job = None
+
+        # Back/Forward history (root paths) and trees of recently left
+        # roots: path -> _TreeSnapshot, least recently used first
+        # Geri/İleri geçmişi (kök yolları) ve yakın zamanda bırakılan
+        # köklerin ağaçları: yol -> _TreeSnapshot, en eski önce
+        self._back_history = []
+        self._forward_history = []
+        self._snapshots = OrderedDict()
+
+        # Search window and running search / Arama penceresi ve çalışan arama
+        self._search_window = None
+        self._search = None
+
+        # On-disk name index of root_dir and its running update
+        # root_dir'in diskteki ad indeksi ve çalışan güncellemesi
+        self.name_index = None
+        self._index_builder = None
+        self._index_root = None
+
+        # Subtree totals shared by folder size computations
+        # Klasör boyutu hesaplamalarının paylaştığı alt ağaç toplamları
+        self.dir_size_cache = DirSizeCache(max_age_s=config.DIR_SIZE_CACHE_MAX_AGE_S)
+
+        # Content sniffing of visible extensionless files (None if disabled)
+        # and the rows already handed to it
+        # Görünür uzantısız dosyaların içerik koklaması (kapalıysa None)
+        # ve ona zaten verilmiş satırlar
+        self.sniffer = None
+        if config.CONTENT_SNIFFING:
+            self.sniffer = ContentSniffer(max_entries=config.CONTENT_SNIFF_CACHE_SIZE)
+        self._sniffed = set()
+        self._sniff_scheduled = False
+
+        # Idle prefetch of likely next folders into the listing cache
+        # (None if disabled or there is no cache)
+        # Muhtemel sonraki klasörlerin boşta listeleme önbelleğine ön
+        # yüklenmesi (kapalıysa veya önbellek yoksa None)
+        self.prefetcher = None
+        if config.PREFETCH_ENABLED and self.listing_cache is not None:
+            self.prefetcher = Prefetcher(self.file_system, config.PREFETCH_MAX_ENTRIES)
+        self._prefetch_scheduled = False
+        self._prefetch_due = 0.0
+
+        # Hot path measurements, the running refresh and the debug panel
+        # Sık kullanılan yol ölçümleri, çalışan yenileme ve hata ayıklama paneli
+        self.profiler = Profiler(enabled=config.PROFILE_OPERATIONS or config.SHOW_DEBUG_PANEL,
+                                 trace_path=trace_path)
+        self.profiler.listeners.append(self._on_operation_finished)
+        self._refresh_op = NULL_OPERATION
+        self.show_debug_panel = tk.BooleanVar(value=config.SHOW_DEBUG_PANEL)
 
         # Build the UI / Arayüzü oluştur
         self._setup_ui()
@@ -64,6 +278,7 @@ class FileExplorerApp:
 
         # Load starting directory / Başlangıç dizinini yükle
         self._populate_root()
+        self._open_name_index()
 
     # =========================================================================
     # Theme / Tema
@@ -85,7 +300,7 @@ class FileExplorerApp:
         style.configure("Treeview",
                          background="#f5f5f5",
                          foreground="black",
-                         rowheight=25,
+                         rowheight=ROW_HEIGHT,
                          fieldbackground="#f5f5f5")
 
         # Selected item style / Seçili öğe stili
@@ -128,6 +343,24 @@ class FileExplorerApp:
         # Backspace = go to parent directory / Backspace = üst dizine git
         self.root.bind("<BackSpace>", self._on_backspace)
 
+        # Alt+Left / Alt+Right = back / forward. Also bound on the tree, so
+        # its Left/Right keys do not close or open the selected row as well.
+        # Alt+Sol / Alt+Sağ = geri / ileri. Ağaca da bağlanır; böylece onun
+        # Sol/Sağ tuşları seçili satırı ayrıca kapatıp açmaz.
+        for widget in (self.root, self.treeview):
+            widget.bind("<Alt-Left>", self._on_alt_left)
+            widget.bind("<Alt-Right>", self._on_alt_right)
+
+        # Escape = stop Expand All / Escape = Tümünü Genişlet'i durdur
+        self.root.bind("<Escape>", lambda event: self.cancel_expand())
+
+        # Ctrl+F = search / Ctrl+F = ara
+        self.root.bind("<Control-f>", lambda event: self.open_search())
+
+        # Stop background work when the window is closed
+        # Pencere kapatılınca arka plan işlerini durdur
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _on_backspace(self, event):
         """
         Handles Backspace key press: navigates to parent directory.
@@ -135,6 +368,20 @@ class FileExplorerApp:
         """
         self.go_up_directory()
 
+    def _on_alt_left(self, event):
+        """
+        Handles Alt+Left: goes back. / Alt+Sol: geri gider.
+        """
+        self.go_back()
+        return "break"
+
+    def _on_alt_right(self, event):
+        """
+        Handles Alt+Right: goes forward. / Alt+Sağ: ileri gider.
+        """
+        self.go_forward()
+        return "break"
+
     def _create_menu(self):
         """
         Creates the menu bar.
@@ -148,18 +395,34 @@ class FileExplorerApp:
         menubar.add_cascade(label="Dosya", menu=file_menu)
         file_menu.add_command(label="Dizin Seç", command=self.select_directory)
         file_menu.add_command(label="Yenile", command=self.refresh_view)
+        file_menu.add_command(label="Ara...", accelerator="Ctrl+F",
+                              command=self.open_search)
+        file_menu.add_command(label="Arama İndeksini Güncelle",
+                              command=self.update_name_index)
         file_menu.add_separator()
-        file_menu.add_command(label="Çıkış", command=self.root.quit)
+        file_menu.add_command(label="Çıkış", command=self._on_close)
 
         # View menu / Görünüm menüsü
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Görünüm", menu=view_menu)
         view_menu.add_checkbutton(label="Gizli Dosyaları Göster",
                                    variable=self.show_hidden,
-                                   command=self.refresh_view)
+                                   command=self._toggle_hidden)
+        view_menu.add_checkbutton(label="Boyut, Tarih ve Tür Sütunları",
+                                  variable=self.show_details,
+                                  command=self._toggle_detail_columns)
         view_menu.add_separator()
         view_menu.add_command(label="Tümünü Genişlet", command=self.expand_all)
+        view_menu.add_command(label="Genişletmeyi Durdur", command=self.cancel_expand)
         view_menu.add_command(label="Tümünü Daralt", command=self.collapse_all)
+        view_menu.add_separator()
+        view_menu.add_command(label="Önbellek İstatistikleri",
+                              command=self._show_cache_stats)
+        view_menu.add_command(label="Önbelleği Temizle", command=self._clear_cache)
+        view_menu.add_separator()
+        view_menu.add_checkbutton(label="Performans Paneli",
+                                  variable=self.show_debug_panel,
+                                  command=self._toggle_debug_panel)
 
         # Help menu / Yardım menüsü
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -178,6 +441,15 @@ class FileExplorerApp:
                                      style="Status.TLabel")
         self.status_bar.pack(side="bottom", fill="x")
 
+        # Debug panel above the status bar (View menu) / Durum çubuğunun üstünde hata ayıklama paneli (Görünüm menüsü)
+        self.debug_panel = ttk.Label(self.root,
+                                     text="Performans: henüz ölçülen işlem yok",
+                                     relief="groove",
+                                     anchor="w",
+                                     style="Status.TLabel")
+        if self.show_debug_panel.get():
+            self.debug_panel.pack(side="bottom", fill="x", after=self.status_bar)
+
     def _create_toolbar(self):
         """
         Creates the toolbar with buttons.
@@ -187,6 +459,17 @@ class FileExplorerApp:
         self.toolbar.pack(side="top", fill="x", padx=5, pady=5)
 
         # Navigation buttons / Gezinme butonları
+        self.back_button = ttk.Button(self.toolbar,
+                                      text="◀ Geri",
+                                      command=self.go_back)
+        self.back_button.pack(side="left", padx=5, pady=5)
+
+        self.forward_button = ttk.Button(self.toolbar,
+                                         text="İleri ▶",
+                                         command=self.go_forward)
+        self.forward_button.pack(side="left", padx=5, pady=5)
+        self._update_history_buttons()
+
         up_button = ttk.Button(self.toolbar,
                                 text="⬆ Üst Dizin",
                                 command=self.go_up_directory)
@@ -206,7 +489,7 @@ class FileExplorerApp:
         hidden_check = ttk.Checkbutton(self.toolbar,
                                         text="Gizli Dosyaları Göster",
                                         variable=self.show_hidden,
-                                        command=self.refresh_view)
+                                        command=self._toggle_hidden)
         hidden_check.pack(side="left", padx=10, pady=5)
 
         # Current path display / Mevcut yol gösterimi
@@ -240,13 +523,20 @@ class FileExplorerApp:
         tree_frame = ttk.Frame(self.main_frame)
         tree_frame.pack(fill="both", expand=True)
 
-        # Treeview widget
-        self.treeview = ttk.Treeview(tree_frame, show="tree")
+        # Treeview widget with optional detail columns
+        # İsteğe bağlı ayrıntı sütunlarıyla Treeview
+        self.treeview = ttk.Treeview(tree_frame, show="tree",
+                                      columns=("size", "modified", "type"))
+
+        # Rows of loaded folders go in one Tcl call per chunk
+        # Yüklenen klasörlerin satırları parça başına bir Tcl çağrısıyla eklenir
+        self.bulk_inserter = BulkInserter(self.treeview)
 
         # Vertical scrollbar / Dikey kaydırma
         y_scroll = ttk.Scrollbar(tree_frame, orient="vertical",
                                   command=self.treeview.yview)
         y_scroll.pack(side="right", fill="y")
+        self.y_scroll = y_scroll
 
         # Horizontal scrollbar / Yatay kaydırma
         x_scroll = ttk.Scrollbar(tree_frame, orient="horizontal",
@@ -254,17 +544,29 @@ class FileExplorerApp:
         x_scroll.pack(side="bottom", fill="x")
 
         # Connect scrollbars / Kaydırma çubuklarını bağla
-        self.treeview.configure(yscrollcommand=y_scroll.set,
+        self.treeview.configure(yscrollcommand=self._on_tree_scrolled,
                                  xscrollcommand=x_scroll.set)
         self.treeview.pack(side="left", fill="both", expand=True)
 
         # Column width / Sütun genişliği
         self.treeview.column("#0", width=300, minwidth=150, stretch=True)
+        self.treeview.column("size", width=90, minwidth=60, stretch=False, anchor="e")
+        self.treeview.column("modified", width=130, minwidth=90, stretch=False)
+        self.treeview.column("type", width=110, minwidth=60, stretch=False)
+
+        # Click on a heading = sort / Başlığa tıklama = sırala
+        self.treeview.heading("#0", command=lambda: self.sort_by("name"))
+        self.treeview.heading("size", command=lambda: self.sort_by("size"))
+        self.treeview.heading("modified", command=lambda: self.sort_by("modified"))
+        self.treeview.heading("type", command=lambda: self.sort_by("type"))
+        self._update_sort_headings()
+        self._apply_detail_columns()
 
         # Bind events / Olayları bağla
         self.treeview.bind("<Double-1>", self._on_double_click)
         self.treeview.bind("<Button-3>", self._on_right_click)
         self.treeview.bind("<<TreeviewOpen>>", self._on_treeview_open)
+        self.treeview.bind("<<TreeviewClose>>", self._on_treeview_close)
 
     # =========================================================================
     # Directory Operations / Dizin İşlemleri
@@ -282,9 +584,7 @@ class FileExplorerApp:
             self._show_status("Kök dizindesiniz.")
             return
 
-        self.root_dir = parent_dir
-        self.current_dir_var.set(self.root_dir)
-        self.refresh_view()
+        self.change_root(parent_dir)
         self._show_status("Üst dizine gidildi: " + self.root_dir)
 
     def select_directory(self):
@@ -295,316 +595,2767 @@ class FileExplorerApp:
         directory = filedialog.askdirectory(initialdir=self.root_dir)
 
         if directory:
-            self.root_dir = directory
-            self.current_dir_var.set(directory)
-            self.refresh_view()
+            self.change_root(directory)
 
-    def refresh_view(self):
+    def change_root(self, new_dir, record=True):
         """
-        Refreshes the tree view.
-        Ağaç görünümünü yeniler.
+        Makes new_dir the root folder. Going to the parent of the root, or
+        to a loaded folder inside the tree, keeps the loaded nodes, their
+        rows and their expanded state; only the new parent is read. A
+        recently left folder is restored from its snapshot. Any other
+        folder is loaded from scratch.
+        new_dir'i kök klasör yapar. Kökün üst klasörüne veya ağaçtaki
+        yüklenmiş bir klasöre gitmek yüklenmiş düğümleri, satırlarını ve
+        açık durumlarını korur; sadece yeni üst klasör okunur. Yakın zamanda
+        ayrılınan bir klasör anlık görüntüsünden geri yüklenir. Diğer
+        klasörler baştan yüklenir.
+
+        Args:
+            new_dir (str): New root folder. / Yeni kök klasör.
+            record (bool): Add the old root to the Back history.
+                           Eski kökü Geri geçmişine ekle.
         """
-        self._show_status("Görünüm yenileniyor...")
+        new_dir = os.path.abspath(new_dir)
 
-        # Delete all items / Tüm öğeleri sil
-        all_items = self.treeview.get_children()
-        for item in all_items:
-            self.treeview.delete(item)
+        old_dir = os.path.abspath(self.root_dir)
+        if record and new_dir != old_dir:
+            self._back_history.append(old_dir)
+            del self._back_history[:-config.HISTORY_MAX]
+            self._forward_history = []
+            self._update_history_buttons()
 
-        # Clear node dictionary / Düğüm sözlüğünü temizle
-        self.nodes.clear()
+        top_items = self.treeview.get_children("")
+        top_node = None
+        if top_items:
+            top_node = self.nodes.get(top_items[0])
+
+        if top_node is not None:
+            top_path = os.path.abspath(top_node.path)
+            if new_dir == top_path:
+                self.refresh_view()
+                return
+            if new_dir == os.path.dirname(top_path):
+                self._reroot_up(top_items[0], new_dir)
+                return
 
-        # Reload / Yeniden yükle
-        self._populate_root()
-        self._show_status("Görünüm yenilendi.")
+            item_id = self._find_loaded_item(new_dir)
+            if item_id is not None:
+                self._reroot_down(item_id)
+                return
+
+        self.root_dir = new_dir
+        self.current_dir_var.set(new_dir)
 
-    def _populate_root(self):
+        # Snapshots taken with other view settings are not used
+        # Başka görünüm ayarlarıyla alınan anlık görüntüler kullanılmaz
+        snapshot = self._snapshots.pop(new_dir, None)
+        if snapshot is not None and snapshot.settings == self._view_settings():
+            self._restore_snapshot(snapshot)
+            return
+
+        self._rebuild_view()
+
+    def go_back(self):
         """
-        Loads the root directory into the tree.
-        Kök dizini ağaca yükler.
+        Goes back to the previous root folder.
+        Önceki kök klasöre geri döner.
         """
-        try:
-            # Get directory name / Dizin adını al
-            root_name = os.path.basename(self.root_dir)
-            if root_name == "":
-                root_name = self.root_dir
+        if not self._back_history:
+            self._show_status("Geri gidilecek dizin yok.")
+            return
 
-            # Create root node / Kök düğüm oluştur
-            root_node = TreeNode(root_name, self.root_dir, True)
-            icon = get_file_icon(self.root_dir)
+        target = self._back_history.pop()
+        self._forward_history.append(os.path.abspath(self.root_dir))
+        self._update_history_buttons()
+        self.change_root(target, record=False)
 
-            # Insert into treeview / Treeview'a ekle
-            display_text = icon + " " + root_name
-            root_id = self.treeview.insert("", "end", text=display_text, open=False)
-            self.nodes[root_id] = root_node
+    def go_forward(self):
+        """
+        Goes forward to the root folder left by go_back.
+        go_back ile bırakılan kök klasöre ileri gider.
+        """
+        if not self._forward_history:
+            self._show_status("İleri gidilecek dizin yok.")
+            return
 
-            # Load children / Alt öğeleri yükle
-            self._load_children(root_id)
+        target = self._forward_history.pop()
+        self._back_history.append(os.path.abspath(self.root_dir))
+        self._update_history_buttons()
+        self.change_root(target, record=False)
 
-            # Open root by default / Kökü varsayılan olarak aç
-            self.treeview.item(root_id, open=True)
+    def _update_history_buttons(self):
+        """
+        Enables the Back/Forward buttons when there is somewhere to go.
+        Gidilecek bir yer varsa Geri/İleri butonlarını etkinleştirir.
+        """
+        for button, history in ((self.back_button, self._back_history),
+                                (self.forward_button, self._forward_history)):
+            if history:
+                button.state(["!disabled"])
+            else:
+                button.state(["disabled"])
 
-        except Exception as error:
-            self._show_status("Hata: Dizin yüklenemedi - " + str(error))
-            messagebox.showerror("Hata", "Dizin yüklenemedi: " + str(error))
+    def _find_loaded_item(self, path):
+        """
+        Returns the row of a folder under the root whose ancestors are all
+        loaded, or None. Nothing is read from disk.
+        Ataları yüklenmiş olan, kökün altındaki bir klasörün satırını veya
+        None döndürür. Diskten hiçbir şey okunmaz.
+        """
+        relative = self._relative_to_root(path)
+        if not relative:
+            return None
+
+        item_id = self.treeview.get_children("")[0]
+        for part in relative.split(os.sep):
+            if not part:
+                continue
+            node = self.nodes.get(item_id)
+            if node is None or not node.loaded:
+                return None
+            item_id = self._find_child_item(item_id, part)
+            if item_id is None:
+                return None
+
+        node = self.nodes.get(item_id)
+        if node is None or not node.is_dir:
+            return None
+        return item_id
 
-    def _load_children(self, parent_id):
+    def _reroot_up(self, old_id, new_dir):
         """
-        Loads child items for a parent node.
-        Bir ebeveyn düğümün alt öğelerini yükler.
+        Puts a new root row above the current root and reads only its
+        listing; the old root row is then moved to its sorted place.
+        Mevcut kökün üstüne yeni bir kök satırı koyar ve sadece onun
+        listesini okur; eski kök satırı sonra sıralı yerine taşınır.
 
         Args:
-            parent_id (str): Treeview item ID. / Treeview öğe ID'si.
+            old_id (str): Current root row. / Mevcut kök satırı.
+            new_dir (str): Parent folder of the current root. / Mevcut kökün üst klasörü.
         """
-        parent_node = self.nodes.get(parent_id)
+        old_node = self.nodes[old_id]
 
-        # Skip if not valid / Geçerli değilse atla
-        if parent_node is None:
-            return
-        if not parent_node.is_dir:
-            return
-        if parent_node.loaded:
-            return
+        self.root_dir = new_dir
+        self.current_dir_var.set(new_dir)
+        self._on_root_changed()
 
-        try:
-            # List directory contents / Dizin içeriğini listele
-            items = os.listdir(parent_node.path)
+        # Until the listing arrives the old root is the first child
+        # Liste gelene kadar eski kök ilk alt öğedir
+        self.model = TreeModel(new_dir, self.loader)
+        root_node = self.model.root
+        root_id = self.treeview.insert("", 0, text=root_node.icon + " " + root_node.name,
+                                       open=True)
+        self.nodes[root_id] = root_node
+        self.treeview.move(old_id, root_id, 0)
 
-            # Filter hidden files if needed / Gerekirse gizli dosyaları filtrele
-            if not self.show_hidden.get():
-                items = filter_hidden_items(items, parent_node.path)
+        operation = self.profiler.begin("reroot_up", new_dir)
 
-            # Sort: directories first, then files / Sırala: önce klasörler, sonra dosyalar
-            items = sort_items_by_type(items, parent_node.path)
+        def root_loaded():
+            self._adopt_subtree(root_id, old_id, old_node)
+            self.profiler.finish(operation)
 
-            # Add each item to the tree / Her öğeyi ağaca ekle
-            for item_name in items:
-                item_path = os.path.join(parent_node.path, item_name)
-                item_is_dir = os.path.isdir(item_path)
+        self._load_children(root_id, on_done=root_loaded, parent_op=operation)
 
-                # Create node / Düğüm oluştur
-                node = TreeNode(item_name, item_path, item_is_dir)
-                parent_node.add_child(node)
+    def _adopt_subtree(self, parent_id, old_id, old_node):
+        """
+        Replaces the freshly listed row of the old root with the old root
+        row, so its loaded children are kept.
+        Eski kökün yeni listelenen satırını eski kök satırıyla değiştirir;
+        böylece yüklenmiş alt öğeleri korunur.
+        """
+        parent_node = self.nodes.get(parent_id)
+        if parent_node is None or not parent_node.loaded:
+            return
+        if self.nodes.get(old_id) is not old_node:
+            return
 
-                # Get icon / İkon al
-                icon = get_file_icon(item_path)
+        fresh_id = self._find_child_item(parent_id, old_node.name, exclude_id=old_id)
 
-                # Insert into treeview / Treeview'a ekle
-                display_text = icon + " " + item_name
-                item_id = self.treeview.insert(parent_id, "end",
-                                                text=display_text, open=False)
-                self.nodes[item_id] = node
+        # Hidden now, or gone: drop the old subtree
+        # Artık gizli veya yok: eski alt ağacı bırak
+        if fresh_id is None:
+            self._cancel_load(old_id, force=True)
+            self._forget_subtree(old_id)
+            self.treeview.delete(old_id)
+            return
 
-                # If directory, add a placeholder for lazy loading
-                # Klasörse, tembel yükleme için yer tutucu ekle
-                if item_is_dir:
-                    self._add_placeholder_if_not_empty(item_id, item_path)
+        fresh_node = self.nodes[fresh_id]
+        old_node.hidden = fresh_node.hidden
+        old_node.size = fresh_node.size
+        old_node.mtime = fresh_node.mtime
 
-            # Mark as loaded / Yüklenmiş olarak işaretle
-            parent_node.loaded = True
+        children = []
+        for child_node in parent_node.children:
+            if child_node is fresh_node:
+                children.append(old_node)
+            else:
+                children.append(child_node)
+        parent_node.set_children(children)
+
+        index = self.treeview.index(fresh_id)
+        if self.treeview.index(old_id) < index:
+            index -= 1
+        self._forget_subtree(fresh_id)
+        self.treeview.delete(fresh_id)
+        self.treeview.move(old_id, parent_id, index)
+        self.treeview.item(old_id, values=self._row_values(old_node))
+
+    def _reroot_down(self, item_id):
+        """
+        Makes a folder row of the tree the root row and drops the rows
+        outside it. Nothing is read if the folder is loaded.
+        Ağaçtaki bir klasör satırını kök satırı yapar ve onun dışındaki
+        satırları bırakır. Klasör yüklüyse hiçbir şey okunmaz.
 
-        except PermissionError:
-            self._show_status("Erişim izni yok: " + parent_node.path)
-            self.treeview.insert(parent_id, "end", text="⚠️ Erişim izni yok")
+        Args:
+            item_id (str): Folder row below the root. / Kökün altındaki klasör satırı.
+        """
+        node = self.nodes[item_id]
+        old_top = self.treeview.get_children("")[0]
+        self.cancel_expand()
+
+        # Loads outside the kept folder are dropped (checked before the move)
+        # Tutulan klasörün dışındaki yüklemeler bırakılır (taşımadan önce kontrol edilir)
+        for job_id in list(self._loads):
+            if not self._is_same_or_descendant(job_id, item_id):
+                self._loads.pop(job_id).cancel_event.set()
+        for job_id, job in self._rescans.items():
+            if not self._is_same_or_descendant(job_id, item_id):
+                job.cancel_event.set()
+
+        self.treeview.move(item_id, "", 0)
+        self._forget_subtree(old_top)
+        self.treeview.delete(old_top)
+
+        self.root_dir = node.path
+        self.model = TreeModel(self.root_dir, self.loader, root_node=node)
+        self.current_dir_var.set(self.root_dir)
+        self._on_root_changed()
 
-        except Exception as error:
-            error_msg = "Hata: " + parent_node.path + " yüklenirken - " + str(error)
-            self._show_status(error_msg)
-            self.treeview.insert(parent_id, "end", text="❌ Hata: " + str(error))
+        self.treeview.item(item_id, open=True)
+        if not node.loaded:
+            self._load_children(item_id)
+        elif node.stale:
+            self._refresh_subtree(item_id, "'" + node.name + "' yenilendi.")
+        else:
+            self._show_status("Dizine gidildi: " + self.root_dir)
 
-    def _add_placeholder_if_not_empty(self, item_id, dir_path):
+    def _on_root_changed(self):
         """
-        Adds a 'Loading...' placeholder if the directory is not empty.
-        Klasör boş değilse 'Yükleniyor...' yer tutucusu ekler.
-
-        Args:
-            item_id (str): Treeview item ID. / Treeview öğe ID'si.
-            dir_path (str): Directory path. / Dizin yolu.
+        Updates what depends on root_dir after the tree was re-rooted.
+        Ağacın kökü değiştikten sonra root_dir'e bağlı olanları günceller.
         """
-        try:
-            contents = os.listdir(dir_path)
+        if self.prefetcher is not None:
+            self.prefetcher.reset()
+        if self._index_root != os.path.abspath(self.root_dir):
+            self._open_name_index()
 
-            # Filter hidden files if needed / Gerekirse gizli dosyaları filtrele
-            if not self.show_hidden.get():
-                contents = filter_hidden_items(contents, dir_path)
+    def refresh_view(self):
+        """
+        Refreshes the tree view. Only expanded folders are read again and
+        only the differences are applied, so the expanded state is kept.
+        Ağaç görünümünü yeniler. Sadece açık klasörler yeniden okunur ve
+        sadece farklar uygulanır, böylece açık klasörler korunur.
+        """
+        top_items = self.treeview.get_children("")
+        if self.prefetcher is not None:
+            self.prefetcher.reset()
 
-            # Only add placeholder if directory has items
-            # Sadece klasör öğe içeriyorsa yer tutucu ekle
-            if len(contents) > 0:
-                self.treeview.insert(item_id, "end", text="Yükleniyor...")
+        # Different root (or empty tree): build from scratch
+        # Farklı kök (veya boş ağaç): baştan oluştur
+        if len(top_items) == 0:
+            self._rebuild_view()
+            return
+        root_node = self.nodes.get(top_items[0])
+        if root_node is None or root_node.path != self.root_dir:
+            self._rebuild_view()
+            return
 
-        except (PermissionError, OSError):
-            # Cannot access directory, skip / Dizine erişilemedi, atla
-            pass
+        self._show_status("Görünüm yenileniyor...")
+        self._refresh_subtree(top_items[0], "Görünüm yenilendi.", "refresh_view")
 
-    def _remove_dummy_nodes(self, parent_id):
+    def _rebuild_view(self):
+        """
+        Deletes the whole tree and loads the root directory again.
+        Tüm ağacı siler ve kök dizini yeniden yükler.
         """
-        Removes placeholder nodes when a folder is expanded.
-        Klasör açıldığında yer tutucu düğümleri kaldırır.
+        self._show_status("Görünüm yenileniyor...")
+        self._save_snapshot()
+        self._clear_tree()
 
-        Args:
-            parent_id (str): Treeview item ID. / Treeview öğe ID'si.
+        # Reload / Yeniden yükle
+        self._populate_root(on_done=lambda: self._show_status("Görünüm yenilendi."))
+
+        # Name index of the new root / Yeni kökün ad indeksi
+        if self._index_root != os.path.abspath(self.root_dir):
+            self._open_name_index()
+
+    def _clear_tree(self):
         """
-        children = self.treeview.get_children(parent_id)
+        Stops the loads of the tree and deletes all rows and nodes.
+        Ağacın yüklemelerini durdurur ve tüm satırları ve düğümleri siler.
+        """
+        # Stop loads of the old tree / Eski ağacın yüklemelerini durdur
+        self._expand_job = None
+        self._cancel_all_loads()
+        if self.prefetcher is not None:
+            self.prefetcher.reset()
 
-        for child_id in children:
-            item_text = self.treeview.item(child_id, "text")
+        # Delete all items / Tüm öğeleri sil
+        all_items = self.treeview.get_children()
+        for item in all_items:
+            self.treeview.delete(item)
 
-            # Check if it is a placeholder / Yer tutucu mu kontrol et
-            if "Yükleniyor..." in item_text:
-                self.treeview.delete(child_id)
-            elif "Hata:" in item_text:
-                self.treeview.delete(child_id)
-            elif "Erişim izni yok" in item_text:
-                self.treeview.delete(child_id)
+        # Clear node dictionary / Düğüm sözlüğünü temizle
+        self.nodes.clear()
+        self._sniffed.clear()
+        self._page_next.clear()
+        self._paging_rows.clear()
+        self._status_rows.clear()
+        self._touched.clear()
+        if self.watcher is not None:
+            self.watcher.clear()
+        self._watched.clear()
 
     # =========================================================================
-    # Event Handlers / Olay Yöneticileri
+    # Tree Snapshots / Ağaç Anlık Görüntüleri
     # =========================================================================
 
-    def _on_treeview_open(self, event):
+    def _view_settings(self):
         """
-        Called when a folder is expanded.
-        Klasör açıldığında çağrılır.
+        Returns the settings a snapshot's rows depend on.
+        Bir anlık görüntünün satırlarının bağlı olduğu ayarları döndürür.
         """
-        item_id = self.treeview.focus()
-
-        if item_id:
-            self._remove_dummy_nodes(item_id)
-            self._load_children(item_id)
+        return (self.show_hidden.get(), self._current_sort(), self.show_details.get())
 
-    def _on_double_click(self, event):
+    def _save_snapshot(self):
         """
-        Called when an item is double-clicked.
-        Bir öğeye çift tıklandığında çağrılır.
+        Keeps the current tree (nodes, open folders, selection and scroll
+        position) before it is deleted, up to config.HISTORY_SNAPSHOTS trees
+        of at most config.HISTORY_SNAPSHOT_MAX_NODES items.
+        Mevcut ağacı (düğümler, açık klasörler, seçim ve kaydırma konumu)
+        silinmeden önce tutar; en fazla config.HISTORY_SNAPSHOT_MAX_NODES
+        öğeli config.HISTORY_SNAPSHOTS ağaç.
         """
-        item_id = self.treeview.identify_row(event.y)
-
-        # Clicked on empty area / Boş alana tıklandı
-        if not item_id:
+        if config.HISTORY_SNAPSHOTS <= 0:
             return
-
-        node = self.nodes.get(item_id)
-        if node is None:
+        if len(self.nodes) > config.HISTORY_SNAPSHOT_MAX_NODES:
             return
 
-        if node.is_dir:
-            # Toggle folder open/close / Klasörü aç/kapat
-            is_open = self.treeview.item(item_id, "open")
-            self.treeview.item(item_id, open=not is_open)
-        else:
-            # Open the file / Dosyayı aç
-            self._show_status("Dosya açılıyor: " + node.path)
-            self._open_file(node.path)
+        top_items = self.treeview.get_children("")
+        if not top_items:
+            return
+        root_node = self.nodes.get(top_items[0])
+        if root_node is None or not root_node.loaded:
+            return
 
-    def _open_file(self, file_path):
+        snapshot = _TreeSnapshot(root_node, self._view_settings(), len(self.nodes))
+        for item_id, node in self.nodes.items():
+            if node.is_dir and node.loaded and self.treeview.item(item_id, "open"):
+                snapshot.expanded.add(node)
+        for item_id in self.treeview.selection():
+            if item_id in self.nodes:
+                snapshot.selection.append(self.nodes[item_id])
+        snapshot.focus = self.nodes.get(self.treeview.focus())
+        snapshot.scroll = self.treeview.yview()[0]
+
+        path = os.path.abspath(root_node.path)
+        self._snapshots[path] = snapshot
+        self._snapshots.move_to_end(path)
+        while len(self._snapshots) > config.HISTORY_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
+
+    def _restore_snapshot(self, snapshot):
         """
-        Opens a file with the default system application.
-        Dosyayı varsayılan sistem uygulamasıyla açar.
+        Shows a snapshot without reading the disk, then rescans its open
+        folders in the background and applies the differences (the listing
+        cache answers for folders whose mtime did not change).
+        Bir anlık görüntüyü diski okumadan gösterir, sonra açık klasörlerini
+        arka planda yeniden tarar ve farkları uygular (mtime'ı değişmeyen
+        klasörler için listeleme önbelleği yanıt verir).
 
         Args:
-            file_path (str): Path to the file. / Dosya yolu.
+            snapshot (_TreeSnapshot): Snapshot of root_dir. / root_dir'in anlık görüntüsü.
         """
-        try:
-            # Windows
-            if sys.platform == "win32":
-                os.startfile(file_path)
+        self._show_status("Görünüm geri yükleniyor...")
+        self._save_snapshot()
+        self._clear_tree()
+
+        operation = self.profiler.begin("restore_snapshot", self.root_dir)
+        with self.profiler.ui_block(operation):
+            self.model = TreeModel(self.root_dir, self.loader, root_node=snapshot.root_node)
+            root_node = self.model.root
+            root_id = self.treeview.insert("", "end", text=root_node.icon + " " + root_node.name,
+                                           open=True)
+            self.nodes[root_id] = root_node
+            item_of = {root_node: root_id}
+
+            # Loaded folders get their rows back, parents first
+            # Yüklenmiş klasörler satırlarını geri alır, önce ebeveynler
+            stack = [root_id]
+            while stack:
+                item_id = stack.pop()
+                node = self.nodes[item_id]
+                self._touch_folder(item_id)
+                self._remove_dummy_nodes(item_id)
+
+                for child_node in node.children:
+                    if child_node.is_dir and not child_node.loaded:
+                        # Rows of an interrupted load / Yarıda kalmış bir yüklemenin satırları
+                        child_node.set_children([])
+                        child_node.set_hidden_children([])
+
+                # Huge folder: first page only, its subfolders load again
+                # Çok büyük klasör: sadece ilk sayfa, alt klasörleri yeniden yüklenir
+                if len(node.children) > self.virtual_threshold:
+                    for child_node in node.children:
+                        if child_node.is_dir and child_node.loaded:
+                            child_node.set_children([])
+                            child_node.set_hidden_children([])
+                            child_node.loaded = False
+                    self._page_next[item_id] = 0
+                    self._insert_next_page(item_id)
+                    continue
+
+                self._insert_rows(item_id, node.children)
+                for child_id, child_node in zip(self.treeview.get_children(item_id),
+                                                node.children):
+                    item_of[child_node] = child_id
+                    if child_node in snapshot.expanded:
+                        self.treeview.item(child_id, open=True)
+                    if child_node.is_dir and child_node.loaded:
+                        stack.append(child_id)
+
+            # Selection, focus and scroll position / Seçim, odak ve kaydırma konumu
+            selected = []
+            for node in snapshot.selection:
+                if node in item_of:
+                    selected.append(item_of[node])
+            if selected:
+                self.treeview.selection_set(*selected)
+            if snapshot.focus in item_of:
+                self.treeview.focus(item_of[snapshot.focus])
+            self.root.after_idle(self.treeview.yview_moveto, snapshot.scroll)
+
+        self.profiler.finish(operation, items=len(self.nodes))
+        self._on_root_changed()
+
+        # Check for changes in the background / Değişiklikleri arka planda kontrol et
+        self._refresh_subtree(root_id, "Görünüm geri yüklendi: " + self.root_dir,
+                              "revalidate")
+
+    def _refresh_subtree(self, top_id, done_message, operation_name="refresh"):
+        """
+        Rescans the loaded, expanded folders under top_id (top_id included)
+        in the background and applies the differences. Loaded but collapsed
+        folders are only marked stale and rescanned when opened.
+        top_id altındaki yüklenmiş ve açık klasörleri (top_id dahil) arka
+        planda yeniden tarar ve farkları uygular. Yüklenmiş ama kapalı
+        klasörler sadece eski olarak işaretlenir ve açılınca taranır.
 
-            # macOS
-            elif sys.platform == "darwin":
-                subprocess.run(["open", file_path], check=True)
+        Args:
+            top_id (str): Treeview item ID. / Treeview öğe ID'si.
+            done_message (str): Status text when finished. / Bitince durum metni.
+            operation_name (str): Name in the profiler. / Profilleyicideki ad.
+        """
+        # Rescans started while a refresh runs join its measurement
+        # Bir yenileme sürerken başlayan taramalar onun ölçümüne katılır
+        if self._refresh_op is NULL_OPERATION:
+            top_node = self.nodes.get(top_id)
+            target = ""
+            if top_node is not None:
+                target = top_node.path
+            self._refresh_op = self.profiler.begin(operation_name, target)
+
+        targets = []
+        stack = [top_id]
+
+        while stack:
+            item_id = stack.pop()
+            node = self.nodes.get(item_id)
+            if node is None or not node.is_dir or not node.loaded:
+                continue
 
-            # Linux
+            if item_id == top_id or self.treeview.item(item_id, "open"):
+                targets.append(item_id)
             else:
-                subprocess.run(["xdg-open", file_path], check=True)
+                node.stale = True
+            stack.extend(self.treeview.get_children(item_id))
 
-            self._show_status("Dosya açıldı: " + file_path)
+        self._refresh_done_message = done_message
+        for item_id in targets:
+            self._rescan_folder(item_id)
 
-        except Exception as error:
-            self._show_status("Dosya açılamadı: " + str(error))
-            messagebox.showerror("Hata", "Dosya açılamadı: " + str(error))
+        self._check_refresh_finished()
 
-    def _on_right_click(self, event):
+    def _rescan_folder(self, item_id):
         """
-        Called when right-clicking an item. Shows context menu.
-        Sağ tıklandığında çağrılır. Bağlam menüsü gösterir.
+        Starts a background rescan of a loaded folder.
+        Yüklenmiş bir klasörün arka planda yeniden taranmasını başlatır.
         """
-        item_id = self.treeview.identify_row(event.y)
-        if not item_id:
+        if item_id in self._rescans:
             return
 
-        self.treeview.selection_set(item_id)
-        self._show_context_menu(event, item_id)
-
-    def _show_context_menu(self, event, item_id):
+        node = self.nodes[item_id]
+        job = _LoadJob(item_id, node)
+        self._rescans[item_id] = job
+        self._refresh_pending += 1
+        self._cancel_prefetch()
+
+        probe = self.expander_mode == "probe"
+        job.sort = self._current_sort()
+        job.op = self.profiler.begin("rescan", node.path, self._refresh_op)
+        self._run_in_background(self._on_folder_rescanned, job,
+                                self.loader.load, node.path,
+                                self.show_hidden.get(), probe, job.cancel_event,
+                                self.show_details.get(), job.sort, job.op)
+
+    def _on_folder_rescanned(self, job, future):
         """
-        Creates and shows the right-click context menu.
-        Sağ tıklama bağlam menüsünü oluşturur ve gösterir.
+        Applies the result of a rescan (UI thread).
+        Bir yeniden taramanın sonucunu uygular (UI iş parçacığı).
         """
-        node = self.nodes.get(item_id)
-        if node is None:
+        if self._rescans.get(job.parent_id) is not job:
+            self.profiler.finish(job.op, "cancelled")
             return
+        del self._rescans[job.parent_id]
+        self._refresh_pending -= 1
 
-        menu = tk.Menu(self.root, tearoff=0)
+        # The item was deleted or reused meanwhile / Öğe bu arada silindi veya değişti
+        if job.cancel_event.is_set() or self.nodes.get(job.parent_id) is not job.parent_node:
+            self.profiler.finish(job.op, "cancelled")
+            self._check_refresh_finished()
+            return
 
-        # Directory options / Klasör seçenekleri
-        if node.is_dir:
-            menu.add_command(label="🔍 Aç",
-                              command=lambda: self.treeview.item(item_id, open=True))
-            menu.add_command(label="🔄 Bu Klasörü Yenile",
-                              command=lambda: self._refresh_node(item_id))
-            menu.add_separator()
+        try:
+            new_children = future.result()
+        except ScanCancelled:
+            self.profiler.finish(job.op, "cancelled")
+            self._check_refresh_finished()
+            return
+        except Exception as error:
+            self.profiler.finish(job.op, "error")
+            self._show_status("Hata: " + job.parent_node.path + " yenilenirken - " + str(error))
+            self._check_refresh_finished()
+            return
 
-        # Common options / Ortak seçenekler
-        menu.add_command(label="📋 Yolu Kopyala",
-                          command=lambda: self._copy_path(node.path))
-        menu.add_command(label="ℹ️ Bilgileri Göster",
-                          command=lambda: self._show_file_info(node.path))
+        # The sort order changed while scanning / Tarama sırasında sıralama değişti
+        if job.sort != self._current_sort():
+            with job.op.phase("sort"):
+                sort_nodes(new_children, self.sort_column, self.sort_reverse)
 
-        # File option / Dosya seçeneği
-        if not node.is_dir:
-            menu.add_command(label="📄 Dosyayı Aç",
-                              command=lambda: self._open_file(node.path))
+        with job.op.phase("filter"):
+            new_children = self._split_hidden(job.parent_node, new_children)
+        with job.op.phase("insert"):
+            self._apply_listing(job.parent_id, new_children)
+        self.profiler.finish(job.op, items=len(new_children))
+        self._check_refresh_finished()
 
-        # Show menu at cursor / Menüyü imleçte göster
-        menu.tk_popup(event.x_root, event.y_root)
+    def _apply_listing(self, parent_id, new_children):
+        """
+        Applies a fresh listing to a loaded folder with minimal Treeview
+        changes: deletes removed rows, updates changed rows and inserts new
+        rows at their sorted position. Existing rows keep their state.
+        A paged folder keeps its page: only the part that already had rows
+        is rendered again.
+        Yeni bir listeyi yüklenmiş bir klasöre en az Treeview değişikliğiyle
+        uygular: silinen satırları kaldırır, değişenleri günceller ve yenileri
+        sıralı konumlarına ekler. Mevcut satırlar durumlarını korur.
+        Sayfalı bir klasör sayfasını korur: sadece zaten satırı olan kısım
+        yeniden çizilir.
 
-    def _refresh_node(self, item_id):
+        Args:
+            parent_id (str): Folder's Treeview item ID. / Klasörün Treeview öğe ID'si.
+            new_children (list): Freshly scanned TreeNodes. / Yeni taranmış TreeNode'lar.
         """
-        Refreshes a single folder node.
-        Tek bir klasör düğümünü yeniler.
+        parent_node = self.nodes[parent_id]
+        parent_node.stale = False
+        self._watch_folder(parent_id, parent_node)
+        self._touch_folder(parent_id)
+
+        paged = parent_id in self._page_next or len(new_children) > self.virtual_threshold
+        merged, added, removed, changed = merge_listing(parent_node.children,
+                                                        new_children)
+
+        # Map nodes to their rows; sniffed files are checked again (the
+        # sniffer's cache answers for files that did not change)
+        # Düğümleri satırlarına eşle; koklanmış dosyalar tekrar kontrol edilir
+        # (değişmeyen dosyalar için koklayıcının önbelleği yanıt verir)
+        item_of = {}
+        for child_id in self.treeview.get_children(parent_id):
+            child_node = self.nodes.get(child_id)
+            if child_node is not None:
+                item_of[child_node] = child_id
+                self._sniffed.discard(child_id)
+        rows_before = len(item_of)
+
+        # Delete rows of removed entries / Silinen öğelerin satırlarını sil
+        for node in removed:
+            child_id = item_of.pop(node, None)
+            if child_id is not None:
+                self._cancel_load(child_id, force=True)
+                self._forget_subtree(child_id)
+                self.treeview.delete(child_id)
+
+        # Update changed rows / Değişen satırları güncelle
+        for node in changed:
+            child_id = item_of.get(node)
+            if child_id is None:
+                continue
+            self.treeview.item(child_id, text=node.icon + " " + node.name,
+                               values=self._row_values(node))
+            if node.is_dir and not node.loaded:
+                self._update_expander(child_id, node)
+
+        parent_node.set_children(merged)
+        shown = len(merged)
+        if paged:
+            shown = self._rows_to_keep(merged, item_of, rows_before)
+
+            # Rows that fall after the shown part / Gösterilen kısmın sonrasına düşen satırlar
+            for node in merged[shown:]:
+                child_id = item_of.pop(node, None)
+                if child_id is not None:
+                    self._cancel_load(child_id, force=True)
+                    self._forget_subtree(child_id)
+                    self.treeview.delete(child_id)
+
+        # Insert new rows at their sorted index / Yeni satırları sıralı indekslerine ekle
+        for index in range(shown):
+            node = merged[index]
+            if node in item_of:
+                continue
+
+            display_text = node.icon + " " + node.name
+            child_id = self.treeview.insert(parent_id, index,
+                                             text=display_text, open=False,
+                                             values=self._row_values(node))
+            self.nodes[child_id] = node
+            if node.is_dir:
+                self._add_placeholder_if_not_empty(child_id, node)
+
+        # Changed sizes or dates can move kept rows / Değişen boyut veya tarihler satırları taşıyabilir
+        if changed and self.sort_column in ("size", "modified"):
+            self._reorder_rows(parent_id)
+
+        if paged:
+            self._page_next[parent_id] = shown
+            self._show_paging_row(parent_id)
+
+        self._schedule_sniff()
+
+    def _rows_to_keep(self, merged, item_of, rows_before):
         """
-        node = self.nodes.get(item_id)
-        if node is None:
-            return
-        if not node.is_dir:
-            return
+        Returns how many entries of a paged folder stay rendered after a
+        rescan: up to its last row that is kept, but at most one page more
+        than before (new entries in between get rows).
+        Bir yeniden taramadan sonra sayfalı bir klasörün kaç öğesinin çizili
+        kalacağını döndürür: tutulan son satırına kadar, ama öncekinden en
+        fazla bir sayfa fazla (aradaki yeni öğeler satır alır).
 
-        # Delete current children / Mevcut alt öğeleri sil
-        children = self.treeview.get_children(item_id)
-        for child_id in children:
-            if child_id in self.nodes:
-                del self.nodes[child_id]
-            self.treeview.delete(child_id)
+        Args:
+            merged (list): New children list. / Yeni alt öğe listesi.
+            item_of (dict): Kept node -> row. / Tutulan düğüm -> satır.
+            rows_before (int): Rows before the rescan. / Yeniden taramadan önceki satırlar.
+        """
+        last_row = -1
+        for index, node in enumerate(merged):
+            if node in item_of:
+                last_row = index
 
-        # Reset and reload / Sıfırla ve yeniden yükle
-        node.children.clear()
-        node.loaded = False
-        self._remove_dummy_nodes(item_id)
-        self._load_children(item_id)
-        self.treeview.item(item_id, open=True)
-        self._show_status("'" + node.name + "' yenilendi.")
+        if last_row < 0:
+            return min(rows_before, len(merged))
+        return min(last_row + 1, rows_before + self.page_size)
 
-    def _copy_path(self, file_path):
+    def _update_expander(self, item_id, node):
         """
-        Copies a path to the clipboard.
-        Yolu panoya kopyalar.
+        Adds or removes the placeholder of an unloaded folder after a rescan.
+        Bir yeniden taramadan sonra yüklenmemiş bir klasörün yer tutucusunu ekler veya kaldırır.
+        """
+        # An unloaded folder has no rows but its placeholder
+        # Yüklenmemiş bir klasörün yer tutucusundan başka satırı yoktur
+        has_rows = item_id in self._status_rows
+
+        if node.has_children is False and has_rows:
+            self._remove_dummy_nodes(item_id)
+        elif node.has_children is not False and not has_rows:
+            self._add_status_row(item_id, "Yükleniyor...")
+
+    def _check_refresh_finished(self):
+        """
+        Shows the final status when every rescan has been applied.
+        Tüm yeniden taramalar uygulanınca son durumu gösterir.
+        """
+        if self._refresh_pending == 0:
+            self.profiler.finish(self._refresh_op)
+            self._refresh_op = NULL_OPERATION
+            self._show_status(self._refresh_done_message)
+
+    def _populate_root(self, on_done=None):
+        """
+        Loads the root directory into the tree.
+        Kök dizini ağaca yükler.
+
+        Args:
+            on_done (callable, optional): Called when the root is loaded.
+                                          Kök yüklenince çağrılır.
+        """
+        try:
+            # Create the tree model and its root node / Ağaç modelini ve kök düğümünü oluştur
+            self.model = TreeModel(self.root_dir, self.loader)
+            root_node = self.model.root
+
+            # Insert into treeview / Treeview'a ekle
+            display_text = root_node.icon + " " + root_node.name
+            root_id = self.treeview.insert("", "end", text=display_text, open=False)
+            self.nodes[root_id] = root_node
+
+            # Open root by default / Kökü varsayılan olarak aç
+            self.treeview.item(root_id, open=True)
+
+            # Load children in the background / Alt öğeleri arka planda yükle
+            operation = self.profiler.begin("populate_root", self.root_dir)
+
+            def root_loaded():
+                self.profiler.finish(operation)
+                if on_done is not None:
+                    on_done()
+
+            self._load_children(root_id, on_done=root_loaded, parent_op=operation)
+
+        except Exception as error:
+            self._show_status("Hata: Dizin yüklenemedi - " + str(error))
+            messagebox.showerror("Hata", "Dizin yüklenemedi: " + str(error))
+
+    def _load_children(self, parent_id, on_done=None, parent_op=None):
+        """
+        Starts loading child items for a parent node in the background.
+        Rows are inserted in chunks when the scan finishes.
+        Bir ebeveyn düğümün alt öğelerini arka planda yüklemeye başlar.
+        Tarama bitince satırlar parça parça eklenir.
+
+        Args:
+            parent_id (str): Treeview item ID. / Treeview öğe ID'si.
+            on_done (callable, optional): Called on the UI thread when loading ends.
+                                          Yükleme bitince UI iş parçacığında çağrılır.
+            parent_op (Operation, optional): Profiler operation this load is part of.
+                                             Bu yüklemenin parçası olduğu profilleyici işlemi.
+        """
+        parent_node = self.nodes.get(parent_id)
+
+        # Skip if not valid / Geçerli değilse atla
+        if parent_node is None:
+            return
+        if not parent_node.is_dir:
+            return
+        if parent_node.loaded:
+            if on_done is not None:
+                on_done()
+            return
+
+        # Already loading: wait for the same job / Zaten yükleniyor: aynı işi bekle
+        job = self._loads.get(parent_id)
+        if job is not None:
+            if on_done is not None:
+                job.callbacks.append(on_done)
+            return
+
+        job = _LoadJob(parent_id, parent_node)
+        if on_done is not None:
+            job.callbacks.append(on_done)
+        self._loads[parent_id] = job
+        self._cancel_prefetch()
+
+        self._show_status("Yükleniyor: " + parent_node.path)
+        probe = self.expander_mode == "probe"
+        job.sort = self._current_sort()
+        job.op = self.profiler.begin("load_children", parent_node.path, parent_op)
+        self._run_in_background(self._on_children_scanned, job,
+                                self.loader.load, parent_node.path,
+                                self.show_hidden.get(), probe, job.cancel_event,
+                                self.show_details.get(), job.sort, job.op)
+
+    def _on_children_scanned(self, job, future):
+        """
+        Called on the UI thread when a directory scan has finished.
+        Bir dizin taraması bittiğinde UI iş parçacığında çağrılır.
+        """
+        # Ignore cancelled or outdated jobs / İptal edilmiş veya eski işleri yok say
+        if self._loads.get(job.parent_id) is not job or job.cancel_event.is_set():
+            self.profiler.finish(job.op, "cancelled")
+            return
+
+        parent_id = job.parent_id
+        parent_node = job.parent_node
+
+        try:
+            children = future.result()
+
+        except ScanCancelled:
+            self.profiler.finish(job.op, "cancelled")
+            return
+
+        except PermissionError:
+            del self._loads[parent_id]
+            self.profiler.finish(job.op, "error")
+            self._remove_dummy_nodes(parent_id)
+            self._show_status("Erişim izni yok: " + parent_node.path)
+            self._add_status_row(parent_id, "⚠️ Erişim izni yok")
+            self._run_load_callbacks(job)
+            return
+
+        except Exception as error:
+            del self._loads[parent_id]
+            self.profiler.finish(job.op, "error")
+            self._remove_dummy_nodes(parent_id)
+            error_msg = "Hata: " + parent_node.path + " yüklenirken - " + str(error)
+            self._show_status(error_msg)
+            self._add_status_row(parent_id, "❌ Hata: " + str(error))
+            self._run_load_callbacks(job)
+            return
+
+        # The sort order changed while scanning / Tarama sırasında sıralama değişti
+        if job.sort != self._current_sort():
+            with job.op.phase("sort"):
+                sort_nodes(children, self.sort_column, self.sort_reverse)
+
+        with job.op.phase("filter"):
+            children = self._split_hidden(parent_node, children)
+
+        # Replace the placeholder with real rows / Yer tutucuyu gerçek satırlarla değiştir
+        job.inserting = True
+        self._remove_dummy_nodes(parent_id)
+
+        # Huge folder: keep every node, insert only the first page
+        # Çok büyük klasör: tüm düğümleri tut, sadece ilk sayfayı ekle
+        if len(children) > self.virtual_threshold:
+            parent_node.add_children(children)
+            self._page_next[parent_id] = 0
+            with job.op.phase("insert"):
+                self._insert_next_page(parent_id)
+            self._finish_load(job, len(children))
+            return
+
+        self._insert_children_chunk(job, children, 0)
+
+    def _insert_children_chunk(self, job, children, start):
+        """
+        Inserts the next chunk of rows, then yields to the event loop.
+        Sonraki satır parçasını ekler, ardından olay döngüsüne döner.
+
+        Args:
+            job (_LoadJob): Load job. / Yükleme işi.
+            children (list): Scanned TreeNode objects. / Taranan TreeNode nesneleri.
+            start (int): Index of the first row to insert. / Eklenecek ilk satırın indeksi.
+        """
+        # Stop if the job was cancelled or the item is gone
+        # İş iptal edildiyse veya öğe silindiyse dur
+        if job.cancel_event.is_set():
+            return
+        if not self.treeview.exists(job.parent_id):
+            self._loads.pop(job.parent_id, None)
+            return
+
+        end = min(start + self.insert_chunk_size, len(children))
+        chunk = children[start:end]
+
+        with self.profiler.ui_block(job.op), job.op.phase("insert"):
+            job.parent_node.add_children(chunk)
+            self._insert_rows(job.parent_id, chunk)
+
+        # More rows left: continue after pending UI events
+        # Satır kaldıysa: bekleyen UI olaylarından sonra devam et
+        if end < len(children):
+            self.root.after(1, self._insert_children_chunk, job, children, end)
+            return
+
+        self._finish_load(job, len(children))
+
+    def _insert_rows(self, parent_id, nodes):
+        """
+        Inserts Treeview rows for already created nodes.
+        Zaten oluşturulmuş düğümler için Treeview satırları ekler.
+
+        Args:
+            parent_id (str): Parent Treeview item ID. / Ebeveyn Treeview öğe ID'si.
+            nodes (list): TreeNode objects in display order. / Gösterim sırasında TreeNode nesneleri.
+        """
+        # Build every row first, then insert them in one Tcl call; folders
+        # get a placeholder for lazy loading unless they are known to be
+        # empty (same rule as _add_placeholder_if_not_empty)
+        # Önce tüm satırları oluştur, sonra tek Tcl çağrısıyla ekle; boş
+        # oldukları bilinmedikçe klasörler tembel yükleme için yer tutucu
+        # alır (_add_placeholder_if_not_empty ile aynı kural)
+        texts = []
+        folder_rows = []
+        for index, node in enumerate(nodes):
+            texts.append(node.icon + " " + node.name)
+            if node.is_dir and node.has_children is not False:
+                folder_rows.append(index)
+
+        values = None
+        if self.show_details.get():
+            values = [self._row_values(node) for node in nodes]
+
+        item_ids, placeholder_ids = self.bulk_inserter.insert_rows(
+            parent_id, texts, values, folder_rows, "Yükleniyor...")
+        self.nodes.update(zip(item_ids, nodes))
+        for index, placeholder_id in zip(folder_rows, placeholder_ids):
+            self._status_rows[item_ids[index]] = [placeholder_id]
+
+        self._schedule_sniff()
+
+    def _finish_load(self, job, item_count):
+        """
+        Marks a load job as done and runs its callbacks.
+        Bir yükleme işini bitmiş olarak işaretler ve geri çağrılarını çalıştırır.
+        """
+        # Mark as loaded / Yüklenmiş olarak işaretle
+        job.parent_node.loaded = True
+        del self._loads[job.parent_id]
+        self.profiler.finish(job.op, items=item_count)
+        self._watch_folder(job.parent_id, job.parent_node)
+        self._touch_folder(job.parent_id)
+        self._show_status("'" + job.parent_node.name + "' yüklendi ("
+                          + str(item_count) + " öğe).")
+        self._run_load_callbacks(job)
+        self._schedule_eviction()
+        self._schedule_prefetch()
+
+    def _run_load_callbacks(self, job):
+        """
+        Runs the on_done callbacks of a finished load job.
+        Biten bir yükleme işinin on_done geri çağrılarını çalıştırır.
+        """
+        for callback in job.callbacks:
+            callback()
+
+    def _cancel_load(self, item_id, force=False):
+        """
+        Cancels pending loads of an item and its descendants.
+        Loads already inserting rows are only stopped with force=True.
+        Bir öğenin ve alt öğelerinin bekleyen yüklemelerini iptal eder.
+        Satır eklemekte olan yüklemeler sadece force=True ile durdurulur.
+
+        Args:
+            item_id (str): Treeview item ID. / Treeview öğe ID'si.
+            force (bool): Also stop jobs that are inserting. / Ekleme yapan işleri de durdur.
+        """
+        for job_id in list(self._loads):
+            if not self._is_same_or_descendant(job_id, item_id):
+                continue
+
+            job = self._loads[job_id]
+            if job.inserting and not force:
+                continue
+
+            job.cancel_event.set()
+            del self._loads[job_id]
+
+    def _cancel_all_loads(self):
+        """
+        Cancels every pending directory load.
+        Bekleyen tüm dizin yüklemelerini iptal eder.
+        """
+        for job in self._loads.values():
+            job.cancel_event.set()
+        self._loads.clear()
+
+        for job in self._rescans.values():
+            job.cancel_event.set()
+        self._rescans.clear()
+        self._refresh_pending = 0
+        self.profiler.finish(self._refresh_op, "cancelled")
+        self._refresh_op = NULL_OPERATION
+
+    def _is_same_or_descendant(self, item_id, ancestor_id):
+        """
+        Checks if item_id is ancestor_id or one of its descendants.
+        item_id'nin ancestor_id veya onun alt öğelerinden biri olup olmadığını kontrol eder.
+        """
+        while item_id:
+            if item_id == ancestor_id:
+                return True
+            if not self.treeview.exists(item_id):
+                return False
+            item_id = self.treeview.parent(item_id)
+        return False
+
+    def _add_placeholder_if_not_empty(self, item_id, node):
+        """
+        Adds a 'Loading...' placeholder if the directory is not empty.
+        The emptiness probe runs in the worker thread (see
+        explorer_core.load_listing); in "optimistic" mode it is skipped,
+        has_children stays None and the placeholder disappears when an
+        empty folder is opened.
+        Klasör boş değilse 'Yükleniyor...' yer tutucusu ekler.
+        Boşluk yoklaması işçi iş parçacığında çalışır (bkz.
+        explorer_core.load_listing); "optimistic" modunda atlanır,
+        has_children None kalır ve boş bir klasör açıldığında yer tutucu
+        kaybolur.
+
+        Args:
+            item_id (str): Treeview item ID. / Treeview öğe ID'si.
+            node (TreeNode): Directory node. / Klasör düğümü.
+        """
+        if node.has_children is False:
+            return
+
+        self._add_status_row(item_id, "Yükleniyor...")
+
+    def _add_status_row(self, parent_id, text):
+        """
+        Adds a placeholder or error row under a folder and remembers it.
+        Bir klasörün altına yer tutucu veya hata satırı ekler ve onu hatırlar.
+        """
+        row_id = self.treeview.insert(parent_id, "end", text=text)
+        self._status_rows.setdefault(parent_id, []).append(row_id)
+
+    def _delete_children(self, parent_id):
+        """
+        Deletes all child items of a Treeview item and forgets their nodes.
+        Bir Treeview öğesinin tüm alt öğelerini siler ve düğümlerini unutur.
+
+        Args:
+            parent_id (str): Treeview item ID. / Treeview öğe ID'si.
+        """
+        for child_id in self.treeview.get_children(parent_id):
+            self._forget_subtree(child_id)
+            self.treeview.delete(child_id)
+
+        self._page_next.pop(parent_id, None)
+        self._status_rows.pop(parent_id, None)
+
+    def _forget_subtree(self, item_id):
+        """
+        Removes an item and all its descendants from self.nodes.
+        Bir öğeyi ve tüm alt öğelerini self.nodes'tan kaldırır.
+        """
+        for child_id in self.treeview.get_children(item_id):
+            self._forget_subtree(child_id)
+
+        node = self.nodes.pop(item_id, None)
+        if node is not None:
+            self._unwatch_folder(item_id, node)
+        self._sniffed.discard(item_id)
+        self._page_next.pop(item_id, None)
+        self._paging_rows.pop(item_id, None)
+        self._status_rows.pop(item_id, None)
+        self._touched.pop(item_id, None)
+
+    # =========================================================================
+    # Node Budget / Düğüm Bütçesi
+    # =========================================================================
+
+    def _touch_folder(self, item_id):
+        """
+        Marks a loaded folder as just used (it is evicted last).
+        Yüklenmiş bir klasörü az önce kullanılmış olarak işaretler (en son boşaltılır).
+        """
+        if self.node_budget <= 0:
+            return
+
+        self._touched[item_id] = time.monotonic()
+        self._touched.move_to_end(item_id)
+
+    def _schedule_eviction(self, delay_ms=1000):
+        """
+        Schedules _evict_collapsed if the tree holds more items than the budget.
+        Ağaç bütçeden fazla öğe tutuyorsa _evict_collapsed'ı zamanlar.
+        """
+        if self.node_budget <= 0 or self._evict_scheduled:
+            return
+        if len(self.nodes) <= self.node_budget:
+            return
+
+        self._evict_scheduled = True
+        self.root.after(delay_ms, self._evict_collapsed)
+
+    def _evict_collapsed(self):
+        """
+        Unloads collapsed folders, least recently used first, until the tree
+        is within config.NODE_BUDGET. Folders used in the last
+        config.EVICT_IDLE_S seconds are kept; the check runs again when the
+        oldest of them gets old enough.
+        Ağaç config.NODE_BUDGET içine girene kadar daraltılmış klasörleri en
+        uzun süredir kullanılmayandan başlayarak boşaltır. Son
+        config.EVICT_IDLE_S saniyede kullanılan klasörler tutulur; en eskisi
+        yeterince eskiyince kontrol tekrar çalışır.
+        """
+        self._evict_scheduled = False
+        if len(self.nodes) <= self.node_budget:
+            return
+
+        operation = self.profiler.begin("evict", self.root_dir)
+        now = time.monotonic()
+        freed_count = 0
+        retry_ms = None
+
+        with self.profiler.ui_block(operation):
+            for item_id, touched in list(self._touched.items()):
+                if len(self.nodes) <= self.node_budget:
+                    break
+
+                # Ordered by use: every later folder is newer too
+                # Kullanıma göre sıralı: sonraki her klasör de daha yeni
+                idle_s = now - touched
+                if idle_s < config.EVICT_IDLE_S:
+                    retry_ms = int((config.EVICT_IDLE_S - idle_s) * 1000) + 1
+                    break
+
+                if not self._can_evict(item_id):
+                    continue
+
+                count_before = len(self.nodes)
+                self._evict_folder(item_id)
+                freed_count += count_before - len(self.nodes)
+                operation.count("evicted_folders")
+
+        self.profiler.finish(operation, items=freed_count)
+
+        if retry_ms is not None:
+            self._schedule_eviction(retry_ms)
+
+    def _can_evict(self, item_id):
+        """
+        Checks if a loaded folder can be unloaded: not the root, not shown
+        open, and no focus, load or rescan inside it.
+        Yüklenmiş bir klasörün boşaltılıp boşaltılamayacağını kontrol eder:
+        kök değil, açık gösterilmiyor ve içinde odak, yükleme veya yeniden
+        tarama yok.
+        """
+        node = self.nodes.get(item_id)
+        if node is None or not node.loaded:
+            return False
+        if not self.treeview.parent(item_id):
+            return False
+
+        # Open with every ancestor open: its rows are on screen
+        # Kendisi ve tüm ataları açık: satırları ekranda
+        current_id = item_id
+        while current_id and self.treeview.item(current_id, "open"):
+            current_id = self.treeview.parent(current_id)
+        if not current_id:
+            return False
+
+        focus_id = self.treeview.focus()
+        if focus_id and focus_id != item_id and self._is_same_or_descendant(focus_id, item_id):
+            return False
+
+        for job_id in list(self._loads) + list(self._rescans):
+            if self._is_same_or_descendant(job_id, item_id):
+                return False
+
+        return True
+
+    def _evict_folder(self, item_id):
+        """
+        Unloads a folder: deletes its rows and nodes and restores its
+        placeholder. Opening it again reads the folder (or its cached
+        listing) like the first time.
+        Bir klasörü boşaltır: satırlarını ve düğümlerini siler ve yer
+        tutucusunu geri koyar. Tekrar açmak klasörü (veya önbellekteki
+        listesini) ilk seferdeki gibi okur.
+
+        Args:
+            item_id (str): Folder's Treeview item ID. / Klasörün Treeview öğe ID'si.
+        """
+        node = self.nodes[item_id]
+
+        self._delete_children(item_id)
+        self._unwatch_folder(item_id, node)
+        self._touched.pop(item_id, None)
+
+        node.has_children = len(node.children) > 0
+        node.set_children([])
+        node.set_hidden_children([])
+        node.loaded = False
+        node.stale = False
+
+        self.treeview.item(item_id, open=False)
+        self._add_placeholder_if_not_empty(item_id, node)
+
+    # =========================================================================
+    # Virtualized Listing / Sanal Listeleme
+    # =========================================================================
+
+    def _insert_next_page(self, parent_id):
+        """
+        Inserts the next page of a huge folder and moves the
+        "show next" row to the end.
+        Çok büyük bir klasörün sonraki sayfasını ekler ve "sonrakini göster"
+        satırını sona taşır.
+
+        Args:
+            parent_id (str): Paged folder's Treeview item ID.
+                             Sayfalı klasörün Treeview öğe ID'si.
+        """
+        parent_node = self.nodes.get(parent_id)
+        start = self._page_next.get(parent_id)
+        if parent_node is None or start is None:
+            return
+
+        # Remove the old paging row / Eski sayfalama satırını kaldır
+        for row_id, row_parent in list(self._paging_rows.items()):
+            if row_parent == parent_id:
+                del self._paging_rows[row_id]
+                self.treeview.delete(row_id)
+
+        children = parent_node.children
+        end = min(start + self.page_size, len(children))
+        self._insert_rows(parent_id, children[start:end])
+
+        self._page_next[parent_id] = end
+        self._show_paging_row(parent_id)
+
+    def _show_paging_row(self, parent_id):
+        """
+        Puts the "show next" row at the end of a paged folder, or ends
+        paging when every row is shown.
+        Sayfalı bir klasörün sonuna "sonrakini göster" satırını koyar veya
+        tüm satırlar gösterildiyse sayfalamayı bitirir.
+        """
+        for row_id, row_parent in list(self._paging_rows.items()):
+            if row_parent == parent_id:
+                del self._paging_rows[row_id]
+                self.treeview.delete(row_id)
+
+        children = self.nodes[parent_id].children
+        end = self._page_next[parent_id]
+
+        # All rows shown: paging is over / Tüm satırlar gösterildi: sayfalama bitti
+        if end >= len(children):
+            del self._page_next[parent_id]
+            return
+
+        remaining = len(children) - end
+        next_count = min(self.page_size, remaining)
+        row_text = ("⏬ Sonraki " + str(next_count) + " öğeyi göster ("
+                    + str(remaining) + " kaldı)")
+        row_id = self.treeview.insert(parent_id, "end", text=row_text)
+        self._paging_rows[row_id] = parent_id
+
+    def _on_tree_scrolled(self, first, last):
+        """
+        Treeview scroll callback: updates the scrollbar and loads the next
+        page when a "show next" row scrolls into view.
+        Treeview kaydırma geri çağrısı: kaydırma çubuğunu günceller ve bir
+        "sonrakini göster" satırı görünür olunca sonraki sayfayı yükler.
+        """
+        self.y_scroll.set(first, last)
+        self._schedule_sniff()
+        self._schedule_prefetch()
+
+        if self._paging_rows and not self._page_check_scheduled:
+            self._page_check_scheduled = True
+            self.root.after_idle(self._load_visible_pages)
+
+    def _load_visible_pages(self):
+        """
+        Inserts the next page for every visible "show next" row.
+        Görünür her "sonrakini göster" satırı için sonraki sayfayı ekler.
+        """
+        self._page_check_scheduled = False
+
+        for row_id, parent_id in list(self._paging_rows.items()):
+            if row_id not in self._paging_rows:
+                continue
+
+            # bbox is empty for rows outside the visible area
+            # Görünür alanın dışındaki satırlar için bbox boştur
+            if self.treeview.bbox(row_id):
+                self._insert_next_page(parent_id)
+
+    # =========================================================================
+    # Content Sniffing / İçerik Koklama
+    # =========================================================================
+
+    def _schedule_sniff(self):
+        """
+        Classifies the visible extensionless files shortly, once scrolling
+        and inserting have settled.
+        Kaydırma ve ekleme durulunca görünür uzantısız dosyaları kısa süre
+        sonra sınıflandırır.
+        """
+        if self.sniffer is None or self._sniff_scheduled:
+            return
+        self._sniff_scheduled = True
+        self.root.after(config.CONTENT_SNIFF_DELAY_MS, self._sniff_visible_rows)
+
+    def _visible_items(self):
+        """
+        Returns the Treeview items currently on screen, top to bottom.
+        Şu anda ekranda olan Treeview öğelerini yukarıdan aşağıya döndürür.
+        """
+        items = []
+        height = self.treeview.winfo_height()
+
+        # One probe per row; the heading row has no item
+        # Satır başına bir yoklama; başlık satırında öğe yoktur
+        for y in range(ROW_HEIGHT // 2, height, ROW_HEIGHT):
+            item_id = self.treeview.identify_row(y)
+            if item_id and (not items or items[-1] != item_id):
+                items.append(item_id)
+        return items
+
+    def _sniff_visible_rows(self):
+        """
+        Hands visible files without a known extension to the sniffer
+        (one background job per call).
+        Bilinen bir uzantısı olmayan görünür dosyaları koklayıcıya verir
+        (çağrı başına bir arka plan işi).
+        """
+        self._sniff_scheduled = False
+
+        rows = []
+        paths = []
+        for item_id in self._visible_items():
+            if item_id in self._sniffed:
+                continue
+            node = self.nodes.get(item_id)
+            if node is None or node.is_dir or node.category == "unknown":
+                continue
+            if get_file_category(node.name) != "file":
+                continue
+
+            self._sniffed.add(item_id)
+            rows.append((item_id, node))
+            paths.append(node.path)
+
+        if rows:
+            self._run_in_background(self._on_rows_sniffed, rows,
+                                    self.sniffer.sniff_many, paths)
+
+    def _on_rows_sniffed(self, rows, future):
+        """
+        Updates the icons of sniffed rows in place (UI thread).
+        Koklanan satırların ikonlarını yerinde günceller (UI iş parçacığı).
+        """
+        try:
+            categories = future.result()
+        except Exception as error:
+            # Icons stay as they are / İkonlar olduğu gibi kalır
+            self._show_status("Hata: Dosya türleri belirlenemedi - " + str(error))
+            return
+
+        for (item_id, node), category in zip(rows, categories):
+            if category is None:
+                category = "file"
+
+            # The row may be gone, or show another node after a refresh
+            # Satır gitmiş olabilir veya yenilemeden sonra başka bir düğüm gösterebilir
+            if self.nodes.get(item_id) is not node or node.category == category:
+                continue
+
+            node.category = category
+            self.treeview.item(item_id, text=node.icon + " " + node.name,
+                               values=self._row_values(node))
+
+    # =========================================================================
+    # Idle Prefetch / Boşta Ön Yükleme
+    # =========================================================================
+
+    def _schedule_prefetch(self):
+        """
+        Prefetches likely next folders once the explorer has been quiet for
+        config.PREFETCH_IDLE_MS; every call starts the quiet time again.
+        Gezgin config.PREFETCH_IDLE_MS boyunca sessiz kalınca muhtemel
+        sonraki klasörleri ön yükler; her çağrı sessiz süreyi yeniden başlatır.
+        """
+        if self.prefetcher is None:
+            return
+
+        self._prefetch_due = time.monotonic() + config.PREFETCH_IDLE_MS / 1000.0
+        if not self._prefetch_scheduled:
+            self._prefetch_scheduled = True
+            self.root.after(config.PREFETCH_IDLE_MS, self._prefetch_when_idle)
+
+    def _prefetch_when_idle(self):
+        """
+        Starts a prefetch if nothing else is running, otherwise waits for
+        another quiet period.
+        Başka bir şey çalışmıyorsa ön yüklemeyi başlatır, yoksa başka bir
+        sessiz süre bekler.
+        """
+        self._prefetch_scheduled = False
+
+        # Activity since scheduling: wait for the rest of the quiet time
+        # Zamanlamadan beri etkinlik var: sessiz sürenin kalanını bekle
+        remaining_s = self._prefetch_due - time.monotonic()
+        if remaining_s > 0:
+            self._prefetch_scheduled = True
+            self.root.after(int(remaining_s * 1000) + 1, self._prefetch_when_idle)
+            return
+
+        # Back off while real work runs (its end schedules us again)
+        # Gerçek iş sürerken geri çekil (bitişi bizi tekrar zamanlar)
+        if (self._loads or self._rescans or self._expand_job is not None
+                or self._search is not None or self._background_count > 0):
+            return
+
+        paths = self._prefetch_targets()
+        if not paths:
+            return
+
+        operation = self.profiler.begin("prefetch", self.root_dir)
+        future = self.prefetcher.start(paths, self.show_details.get(), operation)
+        self._deliver_on_ui_thread(future, self._on_prefetched, operation)
+
+    def _prefetch_targets(self):
+        """
+        Returns the folders to prefetch: the parent of the root (for going
+        up), then visible folders that are not loaded, top to bottom.
+        Ön yüklenecek klasörleri döndürür: kökün üst klasörü (yukarı çıkmak
+        için), sonra yüklenmemiş görünür klasörler, yukarıdan aşağıya.
+        """
+        paths = []
+
+        parent_dir = os.path.dirname(self.root_dir)
+        if parent_dir != self.root_dir and self.prefetcher.wants(parent_dir):
+            paths.append(parent_dir)
+
+        for item_id in self._visible_items():
+            if len(paths) >= config.PREFETCH_MAX_FOLDERS:
+                break
+
+            node = self.nodes.get(item_id)
+            if node is None or not node.is_dir or node.loaded:
+                continue
+            if node.has_children is False:
+                continue
+
+            path = node.path
+            if self.prefetcher.wants(path):
+                paths.append(path)
+
+        return paths
+
+    def _on_prefetched(self, operation, future):
+        """
+        Records a finished prefetch (UI thread).
+        Biten bir ön yüklemeyi kaydeder (UI iş parçacığı).
+        """
+        try:
+            staged = future.result()
+        except Exception:
+            self.profiler.finish(operation, "error")
+            return
+        self.profiler.finish(operation, items=staged)
+
+    def _cancel_prefetch(self):
+        """
+        Stops a running prefetch so it does not compete with a real load.
+        Gerçek bir yüklemeyle yarışmaması için çalışan ön yüklemeyi durdurur.
+        """
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+
+    # =========================================================================
+    # Hidden Entries / Gizli Öğeler
+    # =========================================================================
+
+    def _split_hidden(self, parent_node, children):
+        """
+        Returns the children to show. While hidden entries are not shown
+        they are kept on the node, so the toggle can show them without
+        reading the folder again.
+        Gösterilecek alt öğeleri döndürür. Gizli öğeler gösterilmezken
+        düğümde tutulur; böylece seçenek klasörü tekrar okumadan onları
+        gösterebilir.
+
+        Args:
+            parent_node (TreeNode): Folder node. / Klasör düğümü.
+            children (list): Sorted entries, hidden ones included.
+                             Gizliler dahil sıralı öğeler.
+        """
+        shown, hidden = split_hidden(children, self.show_hidden.get())
+        parent_node.set_hidden_children(hidden)
+        return shown
+
+    def _toggle_hidden(self):
+        """
+        Shows or hides hidden entries in every loaded folder from memory
+        (no folder is read again) and re-checks the folder expanders.
+        Yüklenmiş her klasörde gizli öğeleri bellekten gösterir veya gizler
+        (hiçbir klasör tekrar okunmaz) ve klasör genişleticilerini yeniden
+        kontrol eder.
+        """
+        show_hidden = self.show_hidden.get()
+
+        folders = []
+        for item_id, node in self.nodes.items():
+            if node.is_dir and node.loaded:
+                folders.append((item_id, node))
+
+        for item_id, node in folders:
+            # Deleted together with a hidden parent / Gizli bir ebeveynle birlikte silindi
+            if self.nodes.get(item_id) is not node:
+                continue
+
+            if show_hidden:
+                if not node.hidden_children:
+                    continue
+                children = list(node.children) + list(node.hidden_children)
+                sort_nodes(children, self.sort_column, self.sort_reverse)
+                node.set_hidden_children(NO_CHILDREN)
+            else:
+                children = self._split_hidden(node, list(node.children))
+                if not node.hidden_children:
+                    continue
+
+                # Hidden folders lose their rows: forget their contents
+                # Gizli klasörler satırlarını kaybeder: içeriklerini unut
+                for hidden_node in node.hidden_children:
+                    if hidden_node.loaded:
+                        hidden_node.loaded = False
+                        hidden_node.stale = False
+                        hidden_node.set_children([])
+                        hidden_node.set_hidden_children([])
+
+            self._apply_listing(item_id, children)
+
+        self._reprobe_expanders()
+        if show_hidden:
+            self._show_status("Gizli dosyalar gösteriliyor.")
+        else:
+            self._show_status("Gizli dosyalar gizlendi.")
+
+    def _reprobe_expanders(self):
+        """
+        Re-checks the expanders of unloaded folders in the background:
+        whether a folder looks empty depends on the hidden toggle.
+        Yüklenmemiş klasörlerin genişleticilerini arka planda yeniden
+        kontrol eder: bir klasörün boş görünmesi gizli seçeneğine bağlıdır.
+        """
+        if self.expander_mode != "probe":
+            return
+
+        show_hidden = self.show_hidden.get()
+        rows = []
+        paths = []
+        for item_id, node in self.nodes.items():
+            if not node.is_dir or node.loaded or item_id in self._loads:
+                continue
+
+            # Showing more can only fill empty folders, hiding can only empty them
+            # Daha fazla göstermek sadece boş klasörleri doldurabilir, gizlemek sadece boşaltabilir
+            if show_hidden and node.has_children is True:
+                continue
+            if not show_hidden and node.has_children is False:
+                continue
+
+            rows.append((item_id, node))
+            paths.append(node.path)
+
+        if rows:
+            self._run_in_background(self._on_expanders_probed, (rows, show_hidden),
+                                    self._probe_folders, paths, show_hidden)
+
+    def _probe_folders(self, paths, show_hidden):
+        """
+        Worker thread job: has_visible_children for each folder.
+        İşçi iş parçacığı görevi: her klasör için has_visible_children.
+        """
+        results = []
+        for path in paths:
+            results.append(self.file_system.has_visible_children(path, show_hidden))
+        return results
+
+    def _on_expanders_probed(self, context, future):
+        """
+        Adds or removes expanders after a re-probe (UI thread).
+        Yeniden yoklamadan sonra genişleticileri ekler veya kaldırır (UI iş parçacığı).
+        """
+        rows, show_hidden = context
+        if show_hidden != self.show_hidden.get():
+            return
+
+        for (item_id, node), has_children in zip(rows, future.result()):
+            if self.nodes.get(item_id) is not node or node.loaded or item_id in self._loads:
+                continue
+            node.has_children = has_children
+            self._update_expander(item_id, node)
+
+    # =========================================================================
+    # Columns and Sorting / Sütunlar ve Sıralama
+    # =========================================================================
+
+    def _current_sort(self):
+        """
+        Returns (column, reverse), or None for the default name order.
+        (sütun, ters) döndürür; varsayılan ad sırası için None.
+        """
+        if self.sort_column == "name" and not self.sort_reverse:
+            return None
+        return (self.sort_column, self.sort_reverse)
+
+    def _row_values(self, node):
+        """
+        Returns the Size, Modified and Type cells of a row.
+        Bir satırın Boyut, Değiştirilme ve Tür hücrelerini döndürür.
+        """
+        if not self.show_details.get():
+            return ()
+
+        # Folder sizes are shown in the info window / Klasör boyutları bilgi penceresinde gösterilir
+        size_text = ""
+        if node.size is not None and not node.is_dir:
+            size_text = format_size(node.size)
+
+        modified_text = ""
+        if node.mtime:
+            modified_text = time.strftime("%d-%m-%Y %H:%M", time.localtime(node.mtime))
+
+        type_text = CATEGORY_NAMES.get(node.category, "Dosya")
+        extension = os.path.splitext(node.name)[1]
+        if extension and not node.is_dir:
+            type_text = type_text + " (" + extension[1:].upper() + ")"
+
+        return (size_text, modified_text, type_text)
+
+    def _apply_detail_columns(self):
+        """
+        Shows or hides the detail columns and the heading row.
+        Ayrıntı sütunlarını ve başlık satırını gösterir veya gizler.
+        """
+        if self.show_details.get():
+            self.treeview.configure(show="tree headings",
+                                    displaycolumns=("size", "modified", "type"))
+        else:
+            self.treeview.configure(show="tree", displaycolumns=())
+
+    def _toggle_detail_columns(self):
+        """
+        Handles the detail columns menu item. Turning them on rescans the
+        loaded folders once to read sizes and dates.
+        Ayrıntı sütunları menü öğesini işler. Açmak, boyut ve tarihleri
+        okumak için yüklü klasörleri bir kez yeniden tarar.
+        """
+        self._apply_detail_columns()
+
+        if self.show_details.get():
+            for item_id, node in self.nodes.items():
+                self.treeview.item(item_id, values=self._row_values(node))
+            self.refresh_view()
+            return
+
+        # Without the columns only the name order is available
+        # Sütunlar olmadan sadece ad sırası kullanılabilir
+        if self.sort_column != "name":
+            self.sort_column = "name"
+            self.sort_reverse = False
+            self._update_sort_headings()
+            self._resort_loaded_folders()
+
+    def sort_by(self, column):
+        """
+        Sorts every loaded folder by a column (clicking again reverses it).
+        Only the nodes in memory are reordered; the disk is not read.
+        Tüm yüklü klasörleri bir sütuna göre sıralar (tekrar tıklamak ters
+        çevirir). Sadece bellekteki düğümler yeniden sıralanır; disk okunmaz.
+
+        Args:
+            column (str): "name", "size", "modified" or "type".
+        """
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+
+        self._update_sort_headings()
+        self._resort_loaded_folders()
+
+    def _update_sort_headings(self):
+        """
+        Writes the heading texts with an arrow on the sorted column.
+        Başlık metinlerini sıralanan sütunda bir okla yazar.
+        """
+        titles = (("#0", "name", "Ad"), ("size", "size", "Boyut"),
+                  ("modified", "modified", "Değiştirilme"), ("type", "type", "Tür"))
+
+        for heading_id, column, title in titles:
+            if column == self.sort_column:
+                if self.sort_reverse:
+                    title = title + " ▼"
+                else:
+                    title = title + " ▲"
+            self.treeview.heading(heading_id, text=title)
+
+    def _resort_loaded_folders(self):
+        """
+        Sorts the children of every loaded folder and moves their rows.
+        Her yüklü klasörün alt öğelerini sıralar ve satırlarını taşır.
+        """
+        for item_id, node in list(self.nodes.items()):
+            if not node.is_dir or not node.loaded or len(node.children) < 2:
+                continue
+
+            sort_nodes(node.children, self.sort_column, self.sort_reverse)
+
+            # Paged folder: show the first page of the new order
+            # Sayfalı klasör: yeni sıranın ilk sayfasını göster
+            if item_id in self._page_next:
+                self._delete_children(item_id)
+                for child_node in node.children:
+                    if child_node.loaded:
+                        child_node.set_children([])
+                        child_node.loaded = False
+                self._page_next[item_id] = 0
+                self._insert_next_page(item_id)
+                continue
+
+            self._reorder_rows(item_id)
+
+        self._show_status("Sıralandı.")
+
+    def _reorder_rows(self, parent_id):
+        """
+        Moves the rows of a folder into the order of its children list
+        with a single Treeview call. Other rows (placeholders, errors)
+        stay at the end.
+        Bir klasörün satırlarını tek bir Treeview çağrısıyla alt öğe
+        listesinin sırasına taşır. Diğer satırlar (yer tutucular, hatalar)
+        sonda kalır.
+        """
+        parent_node = self.nodes[parent_id]
+
+        item_of = {}
+        other_rows = []
+        for child_id in self.treeview.get_children(parent_id):
+            child_node = self.nodes.get(child_id)
+            if child_node is None:
+                other_rows.append(child_id)
+            else:
+                item_of[child_node] = child_id
+
+        ordered = []
+        for child_node in parent_node.children:
+            child_id = item_of.get(child_node)
+            if child_id is not None:
+                ordered.append(child_id)
+
+        self.treeview.set_children(parent_id, *(ordered + other_rows))
+        self._schedule_sniff()
+
+    # =========================================================================
+    # Debug Panel / Hata Ayıklama Paneli
+    # =========================================================================
+
+    def _toggle_debug_panel(self):
+        """
+        Shows or hides the performance panel. Profiling runs while it is
+        shown (or when it was turned on by config or a trace file).
+        Performans panelini gösterir veya gizler. Panel görünürken (veya
+        ayar ya da iz dosyasıyla açıldıysa) profilleme çalışır.
+        """
+        if self.show_debug_panel.get():
+            self.profiler.enabled = True
+            self.debug_panel.pack(side="bottom", fill="x", after=self.status_bar)
+            return
+
+        self.debug_panel.pack_forget()
+        self.profiler.enabled = (config.PROFILE_OPERATIONS
+                                 or self.profiler.trace_path is not None)
+
+    def _on_operation_finished(self, operation):
+        """
+        Shows a finished top-level operation in the debug panel.
+        Biten üst düzey bir işlemi hata ayıklama panelinde gösterir.
+        """
+        if operation.parent is not None or not self.show_debug_panel.get():
+            return
+
+        totals = (" | UI toplam %.0f ms, en uzun blok %.1f ms"
+                  % (self.profiler.ui_seconds * 1000.0,
+                     self.profiler.longest_ui_block * 1000.0))
+        self.debug_panel.config(text=format_operation(operation) + totals)
+
+    # =========================================================================
+    # Background Jobs / Arka Plan İşleri
+    # =========================================================================
+
+    def _run_in_background(self, callback, context, func, *args):
+        """
+        Runs func(*args) in the worker pool. When it finishes,
+        callback(context, future) is called on the UI thread.
+        func(*args) fonksiyonunu işçi havuzunda çalıştırır. Bitince
+        callback(context, future) UI iş parçacığında çağrılır.
+
+        Returns:
+            Future: The submitted job. / Gönderilen iş.
+        """
+        future = self.executor.submit(func, *args)
+        self._deliver_on_ui_thread(future, callback, context)
+        return future
+
+    def _deliver_on_ui_thread(self, future, callback, context):
+        """
+        Calls callback(context, future) on the UI thread when a job of any
+        executor finishes.
+        Herhangi bir yürütücünün işi bitince callback(context, future)
+        fonksiyonunu UI iş parçacığında çağırır.
+        """
+        self._background_count += 1
+
+        # Runs in the worker thread: only hand the result over
+        # İşçi iş parçacığında çalışır: sadece sonucu teslim et
+        def hand_over(done_future):
+            self._ui_queue.put((callback, context, done_future))
+
+        future.add_done_callback(hand_over)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        """
+        Makes sure the result queue is being polled.
+        Sonuç kuyruğunun yoklandığından emin olur.
+        """
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.root.after(config.POLL_INTERVAL_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """
+        Delivers finished background jobs to their callbacks (UI thread).
+        Biten arka plan işlerini geri çağrılarına iletir (UI iş parçacığı).
+        """
+        self._poll_scheduled = False
+
+        try:
+            while True:
+                try:
+                    callback, context, future = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                self._background_count -= 1
+                with self.profiler.ui_block(getattr(context, "op", NULL_OPERATION)):
+                    callback(context, future)
+        finally:
+            # Keep polling while jobs are running / İşler sürerken yoklamaya devam et
+            if self._background_count > 0:
+                self._schedule_poll()
+
+    def _on_close(self):
+        """
+        Stops background work and closes the window.
+        Arka plan işlerini durdurur ve pencereyi kapatır.
+        """
+        self._cancel_all_loads()
+        if self._search is not None:
+            self._search.cancel()
+        if self._index_builder is not None:
+            self._index_builder.cancel()
+        self.executor.shutdown(wait=False)
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if self.watcher is not None:
+            self.watcher.close()
+        if self.listing_cache is not None:
+            self.listing_cache.close()
+        self.profiler.close()
+        self.root.destroy()
+
+    # =========================================================================
+    # Live Watcher / Canlı İzleyici
+    # =========================================================================
+
+    def _create_watcher(self):
+        """
+        Creates the folder watcher and starts polling it.
+        Klasör izleyicisini oluşturur ve yoklamaya başlar.
+
+        Returns:
+            FolderWatcher: The watcher, or None if disabled. / İzleyici veya kapalıysa None.
+        """
+        if config.WATCHER_MODE == "off":
+            return None
+
+        try:
+            watcher = FolderWatcher(config.WATCHER_MODE, config.WATCH_QUIET_MS,
+                                    config.WATCH_MAX_DELAY_MS,
+                                    config.WATCH_POLL_INTERVAL_MS)
+        except Exception:
+            return None
+
+        self.root.after(config.WATCH_QUIET_MS, self._apply_watched_changes)
+        return watcher
+
+    def _watch_folder(self, item_id, node):
+        """
+        Starts watching a loaded folder (up to config.MAX_WATCHES).
+        Yüklenmiş bir klasörü izlemeye başlar (config.MAX_WATCHES'a kadar).
+        """
+        if self.watcher is None:
+            return
+
+        path = node.path
+        if path in self._watched:
+            self._watched[path] = item_id
+            return
+        if len(self._watched) >= config.MAX_WATCHES:
+            return
+
+        self.watcher.add(path)
+        self._watched[path] = item_id
+
+    def _unwatch_folder(self, item_id, node):
+        """
+        Stops watching a folder if this item owns the watch.
+        Bu öğe izlemenin sahibiyse klasörü izlemeyi bırakır.
+        """
+        path = node.path
+        if self._watched.get(path) != item_id:
+            return
+
+        del self._watched[path]
+        self.watcher.remove(path)
+
+    def _unwatch_subtree(self, item_id):
+        """
+        Drops the watches of a collapsed item and its loaded descendants.
+        They are marked stale, so they are diffed when opened again.
+        Daraltılmış bir öğenin ve yüklenmiş alt öğelerinin izlemelerini
+        bırakır. Eski olarak işaretlenirler, böylece tekrar açılınca
+        farkları uygulanır.
+        """
+        if not self._watched:
+            return
+
+        stack = [item_id]
+        while stack:
+            current_id = stack.pop()
+            node = self.nodes.get(current_id)
+            if node is None or not node.loaded:
+                continue
+
+            if node.path in self._watched:
+                node.stale = True
+                self._unwatch_folder(current_id, node)
+            stack.extend(self.treeview.get_children(current_id))
+
+    def _apply_watched_changes(self):
+        """
+        Rescans folders reported by the watcher, then schedules itself again.
+        İzleyicinin bildirdiği klasörleri yeniden tarar, sonra kendini tekrar zamanlar.
+        """
+        changed_paths = self.watcher.drain()
+
+        rescanned = False
+        for path in changed_paths:
+            item_id = self._watched.get(path)
+            if item_id is None:
+                continue
+            node = self.nodes.get(item_id)
+            if node is None or not node.loaded:
+                continue
+
+            self._rescan_folder(item_id)
+            rescanned = True
+
+        if rescanned:
+            self._refresh_done_message = "Klasör değişiklikleri uygulandı."
+
+        self.root.after(config.WATCH_QUIET_MS, self._apply_watched_changes)
+
+    # =========================================================================
+    # Listing Cache / Listeleme Önbelleği
+    # =========================================================================
+
+    def _open_listing_cache(self):
+        """
+        Opens the persistent listing cache if it is enabled, otherwise an
+        in-memory one (config.MEMORY_CACHE_MAX_DIRECTORIES).
+        Etkinse kalıcı listeleme önbelleğini, değilse bellekteki önbelleği
+        açar (config.MEMORY_CACHE_MAX_DIRECTORIES).
+
+        Returns:
+            ListingCache: The cache, or None. / Önbellek veya None.
+        """
+        if config.CACHE_ENABLED:
+            cache_path = config.CACHE_PATH
+            if cache_path is None:
+                cache_path = default_cache_path()
+
+            try:
+                return ListingCache(cache_path, config.CACHE_MAX_DIRECTORIES)
+            except Exception:
+                # Cache is optional: fall back to memory / Önbellek isteğe bağlı: belleğe geç
+                pass
+
+        if config.MEMORY_CACHE_MAX_DIRECTORIES > 0:
+            return MemoryListingCache(config.MEMORY_CACHE_MAX_DIRECTORIES)
+        return None
+
+    def _show_cache_stats(self):
+        """
+        Shows listing cache statistics.
+        Listeleme önbelleği istatistiklerini gösterir.
+        """
+        if self.listing_cache is None:
+            messagebox.showinfo("Önbellek", "Önbellek kapalı.")
+            return
+
+        stats = self.listing_cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        if lookups > 0:
+            hit_rate = str(round(100.0 * stats["hits"] / lookups)) + "%"
+        else:
+            hit_rate = "-"
+
+        message = ("İsabet: " + str(stats["hits"]) + "\n"
+                   + "Iska: " + str(stats["misses"]) + "\n"
+                   + "İsabet oranı: " + hit_rate + "\n"
+                   + "Dizin sayısı: " + str(stats["directories"])
+                   + " / " + str(stats["max_directories"]))
+        messagebox.showinfo("Önbellek İstatistikleri", message)
+
+    def _clear_cache(self):
+        """
+        Empties the listing cache.
+        Listeleme önbelleğini boşaltır.
+        """
+        if self.listing_cache is not None:
+            self.listing_cache.clear()
+        if self.prefetcher is not None:
+            self.prefetcher.reset()
+        self._show_status("Önbellek temizlendi.")
+
+    def _remove_dummy_nodes(self, parent_id):
+        """
+        Removes the placeholder and error rows of a folder (one Treeview
+        call, no matter how many children it has).
+        Bir klasörün yer tutucu ve hata satırlarını kaldırır (kaç alt öğesi
+        olursa olsun tek bir Treeview çağrısı).
+
+        Args:
+            parent_id (str): Treeview item ID. / Treeview öğe ID'si.
+        """
+        rows = self._status_rows.pop(parent_id, None)
+        if rows:
+            self.treeview.delete(*rows)
+
+    # =========================================================================
+    # Event Handlers / Olay Yöneticileri
+    # =========================================================================
+
+    def _on_treeview_open(self, event):
+        """
+        Called when a folder is expanded.
+        Klasör açıldığında çağrılır.
+        """
+        item_id = self.treeview.focus()
+
+        if item_id:
+            # Loaded before the last refresh: apply the differences
+            # Son yenilemeden önce yüklenmiş: farkları uygula
+            node = self.nodes.get(item_id)
+            if node is not None and node.loaded:
+                self._touch_folder(item_id)
+            if node is not None and node.loaded and node.stale:
+                self._refresh_subtree(item_id, "'" + node.name + "' yenilendi.")
+                return
+
+            self._load_children(item_id)
+
+    def _on_treeview_close(self, event):
+        """
+        Called when a folder is collapsed. Cancels its pending scans.
+        Klasör daraltıldığında çağrılır. Bekleyen taramalarını iptal eder.
+        """
+        item_id = self.treeview.focus()
+
+        if item_id:
+            self._cancel_load(item_id)
+            self._unwatch_subtree(item_id)
+            if item_id in self._touched:
+                self._touch_folder(item_id)
+            self._schedule_eviction()
+            self._schedule_prefetch()
+
+    def _on_double_click(self, event):
+        """
+        Called when an item is double-clicked.
+        Bir öğeye çift tıklandığında çağrılır.
+        """
+        item_id = self.treeview.identify_row(event.y)
+
+        # Clicked on empty area / Boş alana tıklandı
+        if not item_id:
+            return
+
+        # "Show next N" row of a huge folder / Çok büyük klasörün "sonraki N" satırı
+        if item_id in self._paging_rows:
+            self._insert_next_page(self._paging_rows[item_id])
+            return
+
+        node = self.nodes.get(item_id)
+        if node is None:
+            return
+
+        if node.is_dir:
+            # Toggle folder open/close / Klasörü aç/kapat
+            is_open = self.treeview.item(item_id, "open")
+            self.treeview.item(item_id, open=not is_open)
+        else:
+            # Open the file / Dosyayı aç
+            self._show_status("Dosya açılıyor: " + node.path)
+            self._open_file(node.path)
+
+    def _open_file(self, file_path):
+        """
+        Opens a file with the default system application.
+        Dosyayı varsayılan sistem uygulamasıyla açar.
+
+        Args:
+            file_path (str): Path to the file. / Dosya yolu.
+        """
+        try:
+            # Windows
+            if sys.platform == "win32":
+                os.startfile(file_path)
+
+            # macOS
+            elif sys.platform == "darwin":
+                subprocess.run(["open", file_path], check=True)
+
+            # Linux
+            else:
+                subprocess.run(["xdg-open", file_path], check=True)
+
+            self._show_status("Dosya açıldı: " + file_path)
+
+        except Exception as error:
+            self._show_status("Dosya açılamadı: " + str(error))
+            messagebox.showerror("Hata", "Dosya açılamadı: " + str(error))
+
+    def _on_right_click(self, event):
+        """
+        Called when right-clicking an item. Shows context menu.
+        Sağ tıklandığında çağrılır. Bağlam menüsü gösterir.
+        """
+        item_id = self.treeview.identify_row(event.y)
+        if not item_id:
+            return
+
+        self.treeview.selection_set(item_id)
+        self._show_context_menu(event, item_id)
+
+    def _show_context_menu(self, event, item_id):
+        """
+        Creates and shows the right-click context menu.
+        Sağ tıklama bağlam menüsünü oluşturur ve gösterir.
+        """
+        node = self.nodes.get(item_id)
+        if node is None:
+            return
+
+        menu = tk.Menu(self.root, tearoff=0)
+
+        # Directory options / Klasör seçenekleri
+        if node.is_dir:
+            menu.add_command(label="🔍 Aç",
+                              command=lambda: self.treeview.item(item_id, open=True))
+            menu.add_command(label="🔄 Bu Klasörü Yenile",
+                              command=lambda: self._refresh_node(item_id))
+            if self.treeview.parent(item_id):
+                menu.add_command(label="📌 Buraya Git",
+                                  command=lambda: self.change_root(node.path))
+            menu.add_separator()
+
+        # Common options / Ortak seçenekler
+        menu.add_command(label="📋 Yolu Kopyala",
+                          command=lambda: self._copy_path(node.path))
+        menu.add_command(label="ℹ️ Bilgileri Göster",
+                          command=lambda: self._show_file_info(node.path))
+
+        # File option / Dosya seçeneği
+        if not node.is_dir:
+            menu.add_command(label="📄 Dosyayı Aç",
+                              command=lambda: self._open_file(node.path))
+
+        # Show menu at cursor / Menüyü imleçte göster
+        menu.tk_popup(event.x_root, event.y_root)
+
+    def _refresh_node(self, item_id):
+        """
+        Refreshes a single folder node.
+        Tek bir klasör düğümünü yeniler.
+        """
+        node = self.nodes.get(item_id)
+        if node is None:
+            return
+        if not node.is_dir:
+            return
+
+        self.treeview.item(item_id, open=True)
+
+        # Not loaded yet: a normal load reads it / Henüz yüklenmedi: normal yükleme okur
+        if not node.loaded:
+            self._load_children(
+                item_id,
+                on_done=lambda: self._show_status("'" + node.name + "' yenilendi."))
+            return
+
+        # Apply only the differences / Sadece farkları uygula
+        self._refresh_subtree(item_id, "'" + node.name + "' yenilendi.")
+
+    def _copy_path(self, file_path):
+        """
+        Copies a path to the clipboard.
+        Yolu panoya kopyalar.
         """
         self.root.clipboard_clear()
         self.root.clipboard_append(file_path)
         self.root.update()
         self._show_status("Yol panoya kopyalandı: " + file_path)
 
+    # =========================================================================
+    # Search Window / Arama Penceresi
+    # =========================================================================
+
+    def open_search(self):
+        """
+        Opens the search window (or brings it to the front).
+        Arama penceresini açar (veya öne getirir).
+        """
+        if self._search_window is not None:
+            self._search_window.lift()
+            self._search_entry.focus_set()
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Ara")
+        window.geometry("650x450")
+        window.protocol("WM_DELETE_WINDOW", self._close_search_window)
+        self._search_window = window
+
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill="both", expand=True)
+
+        # Pattern, mode and options / Desen, mod ve seçenekler
+        options_frame = ttk.Frame(frame)
+        options_frame.pack(side="top", fill="x")
+
+        self._search_text = tk.StringVar()
+        self._search_entry = ttk.Entry(options_frame, textvariable=self._search_text)
+        self._search_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        self._search_entry.bind("<Return>", lambda event: self._start_search())
+        self._search_entry.bind("<KeyRelease>", self._on_search_typed)
+
+        self._search_mode = tk.StringVar(value=SEARCH_MODE_LABELS[0][0])
+        mode_box = ttk.Combobox(options_frame,
+                                textvariable=self._search_mode,
+                                values=[label for label, mode in SEARCH_MODE_LABELS],
+                                state="readonly",
+                                width=14)
+        mode_box.pack(side="left", padx=5)
+
+        self._search_case = tk.BooleanVar(value=False)
+        case_check = ttk.Checkbutton(options_frame,
+                                     text="Büyük/küçük harf",
+                                     variable=self._search_case)
+        case_check.pack(side="left", padx=5)
+
+        search_button = ttk.Button(options_frame, text="🔍 Ara",
+                                   command=self._start_search)
+        search_button.pack(side="left", padx=5)
+
+        stop_button = ttk.Button(options_frame, text="⏹ Durdur",
+                                 command=self._stop_search)
+        stop_button.pack(side="left")
+
+        # Result actions / Sonuç işlemleri
+        actions_frame = ttk.Frame(frame)
+        actions_frame.pack(side="bottom", fill="x", pady=(5, 0))
+
+        reveal_button = ttk.Button(actions_frame, text="🌲 Ağaçta Göster",
+                                   command=self._on_search_result_open)
+        reveal_button.pack(side="left")
+
+        info_button = ttk.Button(actions_frame, text="ℹ️ Bilgi",
+                                 command=self._on_search_result_info)
+        info_button.pack(side="left", padx=5)
+
+        # Result list / Sonuç listesi
+        list_frame = ttk.Frame(frame)
+        list_frame.pack(side="top", fill="both", expand=True, pady=(10, 5))
+
+        scroll = ttk.Scrollbar(list_frame, orient="vertical")
+        scroll.pack(side="right", fill="y")
+
+        self._search_list = tk.Listbox(list_frame, yscrollcommand=scroll.set,
+                                       activestyle="none")
+        self._search_list.pack(side="left", fill="both", expand=True)
+        scroll.config(command=self._search_list.yview)
+        self._search_list.bind("<Double-1>", self._on_search_result_open)
+
+        # Full paths of the listed results / Listelenen sonuçların tam yolları
+        self._search_paths = []
+
+        self._search_status = ttk.Label(frame, text="Konum: " + self.root_dir,
+                                        anchor="w")
+        self._search_status.pack(side="bottom", fill="x")
+
+        self._search_entry.focus_set()
+
+    def _start_search(self):
+        """
+        Starts a new search under the current directory.
+        Mevcut dizin altında yeni bir arama başlatır.
+        """
+        pattern = self._search_text.get()
+        if not pattern:
+            return
+
+        mode = self._selected_search_mode()
+
+        try:
+            matcher = make_matcher(pattern, mode, self._search_case.get())
+        except re.error as error:
+            self._search_status.config(text="Geçersiz düzenli ifade: " + str(error))
+            return
+
+        # Only one search at a time / Aynı anda tek arama
+        if self._search is not None:
+            self._search.cancel()
+            self._search = None
+
+        self._search_list.delete(0, "end")
+        self._search_paths = []
+
+        # Name and prefix searches are answered by the index when there is one
+        # Ad ve önek aramaları, varsa indeks tarafından yanıtlanır
+        if self._index_can_answer(mode):
+            self._search_in_index(pattern, mode, matcher)
+            return
+
+        # Loaded folders are not read again, unless a refresh is still
+        # updating them
+        # Yüklenmiş klasörler tekrar okunmaz; bir yenileme onları hâlâ
+        # güncelliyorsa okunur
+        loaded_nodes = {}
+        if not self._rescans:
+            for node in self.nodes.values():
+                if node.is_dir and node.loaded:
+                    loaded_nodes[node.path] = node
+
+        search = FileSearch(self.root_dir, matcher,
+                            show_hidden=self.show_hidden.get(),
+                            loaded_nodes=loaded_nodes,
+                            workers=config.SEARCH_WORKERS,
+                            max_results=config.SEARCH_MAX_RESULTS,
+                            hidden_rules=self.hidden_rules)
+        self._search = search
+        search.start()
+
+        self._search_status.config(text="Aranıyor...")
+        self.root.after(50, self._poll_search, search)
+
+    def _stop_search(self):
+        """
+        Cancels the running search.
+        Çalışan aramayı iptal eder.
+        """
+        if self._search is not None:
+            self._search.cancel()
+
+    def _poll_search(self, search):
+        """
+        Moves new results into the list (UI thread, repeats until done).
+        Yeni sonuçları listeye taşır (UI iş parçacığı, bitene kadar tekrarlanır).
+        """
+        # Replaced by a newer search or window closed
+        # Daha yeni bir aramayla değiştirildi veya pencere kapandı
+        if search is not self._search:
+            return
+
+        # Read before draining: results are queued before "done" is set
+        # Boşaltmadan önce oku: sonuçlar "done" ayarlanmadan önce kuyruğa konur
+        finished = search.done
+
+        paths = []
+        while len(paths) < config.SEARCH_RESULTS_PER_TICK:
+            try:
+                paths.append(search.results.get_nowait())
+            except queue.Empty:
+                break
+
+        if paths:
+            self._add_search_results(paths)
+
+        counts = (str(len(self._search_paths)) + " sonuç, "
+                  + str(search.folder_count) + " klasör")
+
+        if not finished or not search.results.empty():
+            self._search_status.config(text="Aranıyor... " + counts)
+            self.root.after(100, self._poll_search, search)
+            return
+
+        self._search = None
+        if search.result_count >= search.max_results:
+            self._search_status.config(text="Sonuç sınırına ulaşıldı (" + counts + ").")
+        elif search.cancel_event.is_set():
+            self._search_status.config(text="Arama durduruldu (" + counts + ").")
+        else:
+            self._search_status.config(text="Arama bitti (" + counts + ").")
+
+    def _add_search_results(self, paths):
+        """
+        Appends results to the list, shown relative to the current directory.
+        Sonuçları listeye ekler; mevcut dizine göreli gösterilir.
+        """
+        labels = []
+        for path in paths:
+            relative = self._relative_to_root(path)
+            if relative:
+                labels.append(relative)
+            else:
+                labels.append(path)
+        self._search_paths.extend(paths)
+        self._search_list.insert("end", *labels)
+
+    def _on_search_typed(self, event):
+        """
+        Searches on every keystroke when the index can answer instantly.
+        İndeks anında yanıt verebiliyorsa her tuş vuruşunda arar.
+        """
+        if self._index_can_answer(self._selected_search_mode()):
+            self._start_search()
+
+    def _selected_search_mode(self):
+        """
+        Returns the mode of the selected search mode label.
+        Seçili arama modu etiketinin modunu döndürür.
+        """
+        for label, mode in SEARCH_MODE_LABELS:
+            if label == self._search_mode.get():
+                return mode
+        return "substring"
+
+    def _index_can_answer(self, mode):
+        """
+        Checks if the name index can answer a search of this mode.
+        Ad indeksinin bu moddaki bir aramayı yanıtlayıp yanıtlayamayacağını kontrol eder.
+        """
+        return self.name_index is not None and mode in ("substring", "prefix")
+
+    def _search_in_index(self, pattern, mode, matcher):
+        """
+        Answers a search from the name index (UI thread, milliseconds).
+        Bir aramayı ad indeksinden yanıtlar (UI iş parçacığı, milisaniyeler).
+        """
+        started = time.perf_counter()
+        hits = self.name_index.search(pattern,
+                                      prefix=(mode == "prefix"),
+                                      show_hidden=self.show_hidden.get(),
+                                      limit=config.NAME_INDEX_MAX_RESULTS)
+
+        # The index only knows dot files and the hidden attribute: ".hidden"
+        # files and patterns are applied to the hits and their folders
+        # İndeks sadece nokta dosyalarını ve gizli özniteliğini bilir: ".hidden"
+        # dosyaları ve desenler isabetlere ve klasörlerine uygulanır
+        check_rules = not self.show_hidden.get() and (self.hidden_rules.patterns
+                                                      or self.hidden_rules.use_hidden_lists)
+        hidden_lists = {}
+        folder_hidden = {}
+
+        # The index ignores case: the matcher applies the case option
+        # İndeks büyük/küçük harfi yok sayar: seçeneği eşleştirici uygular
+        paths = []
+        for path, path_is_dir in hits:
+            if not matcher(os.path.basename(path)):
+                continue
+            if check_rules and self._hidden_by_rules(path, path_is_dir, self.name_index.root_dir,
+                                                     hidden_lists, folder_hidden):
+                continue
+            paths.append(path)
+
+        self._add_search_results(paths)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._search_status.config(text="İndeksten " + str(len(paths)) + " sonuç ("
+                                   + str(round(elapsed_ms, 1)) + " ms).")
+
+    def _hidden_by_rules(self, path, is_dir, root_dir, hidden_lists, folder_hidden):
+        """
+        True if a path, or a folder between root_dir and it, is hidden by a
+        ".hidden" file or a hidden pattern.
+        Bir yol veya root_dir ile arasındaki bir klasör bir ".hidden" dosyası
+        veya gizli desen tarafından gizleniyorsa True.
+
+        Args:
+            path (str): Path under root_dir. / root_dir altındaki yol.
+            is_dir (bool): True for folders. / Klasörler için True.
+            root_dir (str): Folder the rules are checked up to. / Kuralların kontrol edildiği üst klasör.
+            hidden_lists (dict): Folder -> ".hidden" names, shared between calls.
+                                 Klasör -> ".hidden" adları, çağrılar arasında paylaşılır.
+            folder_hidden (dict): Folder -> result, shared between calls.
+                                  Klasör -> sonuç, çağrılar arasında paylaşılır.
+        """
+        parent_path, name = os.path.split(path)
+
+        if parent_path != root_dir and len(parent_path) > len(root_dir):
+            parent_hidden = folder_hidden.get(parent_path)
+            if parent_hidden is None:
+                parent_hidden = self._hidden_by_rules(parent_path, True, root_dir,
+                                                      hidden_lists, folder_hidden)
+                folder_hidden[parent_path] = parent_hidden
+            if parent_hidden:
+                return True
+
+        return self.hidden_rules.hides(parent_path, name, is_dir, hidden_lists)
+
+    def _selected_search_path(self):
+        """
+        Returns the full path of the selected result, or None.
+        Seçili sonucun tam yolunu döndürür, yoksa None.
+        """
+        selection = self._search_list.curselection()
+        if not selection:
+            return None
+        return self._search_paths[selection[0]]
+
+    def _on_search_result_open(self, event=None):
+        """
+        Handles double-click on a result: shows it in the tree.
+        Bir sonuca çift tıklamayı işler: onu ağaçta gösterir.
+        """
+        path = self._selected_search_path()
+        if path is not None:
+            self.reveal_path(path)
+
+    def _on_search_result_info(self):
+        """
+        Shows the info window of the selected result.
+        Seçili sonucun bilgi penceresini gösterir.
+        """
+        path = self._selected_search_path()
+        if path is not None:
+            self._show_file_info(path)
+
+    def _close_search_window(self):
+        """
+        Cancels the search and closes the search window.
+        Aramayı iptal eder ve arama penceresini kapatır.
+        """
+        self._stop_search()
+        self._search = None
+        self._search_window.destroy()
+        self._search_window = None
+
+    # =========================================================================
+    # Name Index / Ad İndeksi
+    # =========================================================================
+
+    def _open_name_index(self):
+        """
+        Opens the name index of root_dir (if built before) and starts its update.
+        root_dir'in ad indeksini açar (daha önce oluşturulduysa) ve güncellemesini başlatır.
+        """
+        # The old index is closed when its running update ends
+        # Eski indeks, çalışan güncellemesi bitince kapatılır
+        if self._index_builder is not None:
+            self._index_builder.cancel()
+        elif self.name_index is not None:
+            self.name_index.close()
+        self._index_builder = None
+        self.name_index = None
+        self._index_root = os.path.abspath(self.root_dir)
+
+        if not config.NAME_INDEX_ENABLED:
+            return
+
+        self.name_index = open_index(self.root_dir)
+        if self.name_index is not None and config.NAME_INDEX_AUTO_UPDATE:
+            self.update_name_index()
+
+    def update_name_index(self):
+        """
+        Builds or updates the name index of root_dir in the background.
+        Unchanged folders are taken from the old index.
+        root_dir'in ad indeksini arka planda oluşturur veya günceller.
+        Değişmeyen klasörler eski indeksten alınır.
+        """
+        if self._index_builder is not None:
+            self._show_status("Arama indeksi zaten güncelleniyor...")
+            return
+
+        builder = IndexBuilder(self.root_dir, self.name_index)
+        self._index_builder = builder
+        self._show_status("Arama indeksi güncelleniyor: " + self.root_dir)
+        self._run_in_background(self._on_name_index_built, builder, builder.run)
+
+    def _on_name_index_built(self, builder, future):
+        """
+        Switches to the new index file when an update has finished (UI thread).
+        Bir güncelleme bitince yeni indeks dosyasına geçer (UI iş parçacığı).
+        """
+        current = builder is self._index_builder
+        if current:
+            self._index_builder = None
+
+        try:
+            future.result()
+            built = True
+        except ScanCancelled:
+            built = False
+        except OSError as error:
+            built = False
+            if current:
+                self._show_status("Arama indeksi yazılamadı: " + str(error))
+
+        # The builder no longer reads the old index / Oluşturucu artık eski indeksi okumuyor
+        if builder.old_index is not None and builder.old_index is not self.name_index:
+            builder.old_index.close()
+
+        if not current or not built:
+            builder.discard()
+            return
+
+        # The old file is unmapped before it is replaced (required on Windows)
+        # Eski dosyanın eşlemesi, yerine yenisi konmadan önce kaldırılır (Windows'ta gerekli)
+        if self.name_index is not None:
+            self.name_index.close()
+            self.name_index = None
+        try:
+            builder.install()
+        except OSError as error:
+            self._show_status("Arama indeksi yazılamadı: " + str(error))
+            self.name_index = open_index(self.root_dir)
+            return
+
+        self.name_index = open_index(self.root_dir)
+        if self.name_index is None:
+            return
+
+        self._show_status("Arama indeksi güncellendi: " + str(builder.entry_count)
+                          + " öğe, " + str(builder.listed_count) + " klasör okundu.")
+
+    # =========================================================================
+    # Reveal in Tree / Ağaçta Göster
+    # =========================================================================
+
+    def _relative_to_root(self, path):
+        """
+        Returns path relative to root_dir, "" for root_dir itself, or None
+        if the path is outside it.
+        Yolu root_dir'e göreli döndürür; root_dir'in kendisi için "", dışındaysa None.
+        """
+        root_dir = os.path.abspath(self.root_dir)
+        path = os.path.abspath(path)
+        if path == root_dir:
+            return ""
+
+        root_prefix = os.path.join(root_dir, "")
+        if path.startswith(root_prefix):
+            return path[len(root_prefix):]
+        return None
+
+    def reveal_path(self, path):
+        """
+        Selects a path in the tree, loading and opening only its ancestors.
+        Bir yolu ağaçta seçer; sadece üst klasörlerini yükler ve açar.
+
+        Args:
+            path (str): File or folder under root_dir. / root_dir altındaki dosya veya klasör.
+        """
+        relative = self._relative_to_root(path)
+        if relative is None:
+            self._show_status("Mevcut dizinin dışında: " + path)
+            return
+
+        top_items = self.treeview.get_children("")
+        if not top_items:
+            return
+
+        parts = []
+        for part in relative.split(os.sep):
+            if part:
+                parts.append(part)
+
+        self._reveal_step(top_items[0], parts, 0, path)
+
+    def _reveal_step(self, item_id, parts, index, path, waited=False):
+        """
+        Opens item_id and continues with the next path component.
+        item_id'yi açar ve sonraki yol bileşeniyle devam eder.
+
+        Args:
+            item_id (str): Folder reached so far. / Şu ana kadar ulaşılan klasör.
+            parts (list): Path components under root_dir. / root_dir altındaki yol bileşenleri.
+            index (int): Next component to find. / Bulunacak sonraki bileşen.
+            path (str): Full target path. / Tam hedef yolu.
+            waited (bool): item_id was just loaded. / item_id az önce yüklendi.
+        """
+        if not self.treeview.exists(item_id):
+            return
+
+        # Target reached / Hedefe ulaşıldı
+        if index == len(parts):
+            self.treeview.selection_set(item_id)
+            self.treeview.focus(item_id)
+            self.treeview.see(item_id)
+            self._show_status("Gösteriliyor: " + path)
+            return
+
+        node = self.nodes.get(item_id)
+        if node is None or not node.is_dir:
+            self._show_status("Ağaçta bulunamadı: " + path)
+            return
+
+        # Load the folder first (only once) / Önce klasörü yükle (sadece bir kez)
+        if not node.loaded:
+            if waited:
+                self._show_status("Ağaçta bulunamadı: " + path)
+                return
+            self.treeview.item(item_id, open=True)
+            self._load_children(item_id, on_done=lambda: self._reveal_step(
+                item_id, parts, index, path, waited=True))
+            return
+
+        self.treeview.item(item_id, open=True)
+
+        child_id = self._find_child_item(item_id, parts[index])
+        if child_id is None:
+            self._show_status("Ağaçta bulunamadı: " + path)
+            return
+
+        self._reveal_step(child_id, parts, index + 1, path)
+
+    def _find_child_item(self, parent_id, name, exclude_id=None):
+        """
+        Returns the Treeview ID of a child row by name. In a paged folder,
+        pages are inserted until the row exists.
+        Bir alt satırın Treeview ID'sini ada göre döndürür. Sayfalı bir
+        klasörde satır oluşana kadar sayfalar eklenir.
+
+        Args:
+            parent_id (str): Folder row. / Klasör satırı.
+            name (str): Child name. / Alt öğe adı.
+            exclude_id (str, optional): Row to skip. / Atlanacak satır.
+        """
+        # Not in the folder at all / Klasörde hiç yok
+        parent_node = self.nodes.get(parent_id)
+        names = []
+        for child_node in parent_node.children:
+            names.append(child_node.name)
+        if name not in names:
+            return None
+
+        while True:
+            for child_id in self.treeview.get_children(parent_id):
+                if child_id == exclude_id:
+                    continue
+                child_node = self.nodes.get(child_id)
+                if child_node is not None and child_node.name == name:
+                    return child_id
+
+            if parent_id not in self._page_next:
+                return None
+            self._insert_next_page(parent_id)
+
     # =========================================================================
     # File Info Window / Dosya Bilgi Penceresi
     # =========================================================================
@@ -612,32 +3363,77 @@ class FileExplorerApp:
     def _show_file_info(self, file_path):
         """
         Shows file/directory info in a new window.
+        The file system is read in the background first.
         Dosya/klasör bilgisini yeni pencerede gösterir.
+        Dosya sistemi önce arka planda okunur.
         """
-        try:
-            # Check if exists / Var mı kontrol et
-            if not os.path.exists(file_path):
-                messagebox.showerror("Hata", "Dosya veya klasör bulunamadı.")
-                return
+        self._show_status("Bilgiler alınıyor: " + file_path)
+        self._run_in_background(self._on_file_info_ready, file_path,
+                                self._collect_file_info, file_path,
+                                self.show_hidden.get(), self.file_system)
 
-            # Get file size / Boyut al
-            file_size = os.path.getsize(file_path)
-            size_text = format_size(file_size)
+    @staticmethod
+    def _collect_file_info(file_path, show_hidden, file_system):
+        """
+        Worker thread job: reads the values shown in the info window.
+        İşçi iş parçacığı görevi: bilgi penceresinde gösterilen değerleri okur.
 
-            # Get file type info / Dosya türü bilgisi al
-            type_text = self._get_type_info(file_path)
+        Args:
+            file_path (str): File or folder path. / Dosya veya klasör yolu.
+            show_hidden (bool): Count hidden items. / Gizli öğeleri say.
+            file_system (LocalFileSystem): Reads folders with the hiding rules.
+                                           Klasörleri gizleme kurallarıyla okur.
 
-            # Get timestamps / Zaman damgaları al
-            mod_time = os.path.getmtime(file_path)
-            create_time = os.path.getctime(file_path)
-            mod_text = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(mod_time))
-            create_text = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(create_time))
+        Returns:
+            dict: Info texts, or None if the path does not exist.
+                  Bilgi metinleri, yol yoksa None.
+        """
+        # Check if exists / Var mı kontrol et
+        if not os.path.exists(file_path):
+            return None
+
+        # Get file size; folders are summed later / Boyut al; klasörler sonra toplanır
+        is_dir = os.path.isdir(file_path)
+        if is_dir:
+            size_text = "Hesaplanıyor..."
+        else:
+            size_text = format_size(os.path.getsize(file_path))
+
+        # Get timestamps / Zaman damgaları al
+        mod_time = os.path.getmtime(file_path)
+        create_time = os.path.getctime(file_path)
+
+        # Hidden status, ".hidden" files and patterns included
+        # Gizli durumu, ".hidden" dosyaları ve desenler dahil
+        hidden = is_hidden(file_path)
+        if not hidden and file_system.rules is not None:
+            parent_path, name = os.path.split(file_path)
+            hidden = file_system.rules.hides(parent_path, name, is_dir)
+        if hidden:
+            hidden_text = "Evet"
+        else:
+            hidden_text = "Hayır"
+
+        return {
+            "is_dir": is_dir,
+            "size": size_text,
+            "type": FileExplorerApp._get_type_info(file_path, show_hidden, file_system),
+            "modified": time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(mod_time)),
+            "created": time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(create_time)),
+            "hidden": hidden_text,
+        }
+
+    def _on_file_info_ready(self, file_path, future):
+        """
+        Opens the info window with the collected values (UI thread).
+        Toplanan değerlerle bilgi penceresini açar (UI iş parçacığı).
+        """
+        try:
+            info = future.result()
 
-            # Hidden status / Gizli durumu
-            if is_hidden(file_path):
-                hidden_text = "Evet"
-            else:
-                hidden_text = "Hayır"
+            if info is None:
+                messagebox.showerror("Hata", "Dosya veya klasör bulunamadı.")
+                return
 
             # Create info window / Bilgi penceresi oluştur
             info_window = tk.Toplevel(self.root)
@@ -651,35 +3447,60 @@ class FileExplorerApp:
             # Add info rows / Bilgi satırları ekle
             self._add_info_row(frame, "Ad:", os.path.basename(file_path), 0)
             self._add_info_row(frame, "Tam Yol:", file_path, 1)
-            self._add_info_row(frame, "Tür:", type_text, 2)
-            self._add_info_row(frame, "Boyut:", size_text, 3)
-            self._add_info_row(frame, "Oluşturulma Tarihi:", create_text, 4)
-            self._add_info_row(frame, "Değiştirilme Tarihi:", mod_text, 5)
-            self._add_info_row(frame, "Gizli mi?:", hidden_text, 6)
+            self._add_info_row(frame, "Tür:", info["type"], 2)
+            size_label = self._add_info_row(frame, "Boyut:", info["size"], 3)
+            self._add_info_row(frame, "Oluşturulma Tarihi:", info["created"], 4)
+            self._add_info_row(frame, "Değiştirilme Tarihi:", info["modified"], 5)
+            self._add_info_row(frame, "Gizli mi?:", info["hidden"], 6)
+
+            # Buttons / Butonlar
+            button_frame = ttk.Frame(frame)
+            button_frame.grid(row=7, column=0, columnspan=2, pady=15)
+
+            reveal_btn = ttk.Button(button_frame, text="🌲 Ağaçta Göster",
+                                    command=lambda: self.reveal_path(file_path))
+            reveal_btn.pack(side="left", padx=5)
+
+            close_btn = ttk.Button(button_frame, text="Kapat", command=info_window.destroy)
+            close_btn.pack(side="left", padx=5)
 
-            # Close button / Kapat butonu
-            close_btn = ttk.Button(frame, text="Kapat", command=info_window.destroy)
-            close_btn.grid(row=7, column=0, columnspan=2, pady=15)
+            # Folder: sum the contents in the background, the row shows progress
+            # Klasör: içeriği arka planda topla, satır ilerlemeyi gösterir
+            if info["is_dir"]:
+                job = DirSizeJob(file_path, self.dir_size_cache, config.DIR_SIZE_WORKERS)
+                job.start()
+                self._poll_dir_size(job, info_window, size_label)
+
+            self._show_status("Hazır")
 
         except Exception as error:
             messagebox.showerror("Hata", "Dosya bilgileri alınamadı: " + str(error))
 
-    def _get_type_info(self, file_path):
+    @staticmethod
+    def _get_type_info(file_path, show_hidden, file_system):
         """
         Returns a description string for the file/directory type.
+        Folder items are counted like the tree shows them (listing cache,
+        ".hidden" files and hidden patterns).
         Dosya/klasör türü için açıklama metni döndürür.
+        Klasör öğeleri ağacın gösterdiği gibi sayılır (listeleme önbelleği,
+        ".hidden" dosyaları ve gizli desenler).
 
         Args:
             file_path (str): File path. / Dosya yolu.
+            show_hidden (bool): Count hidden items. / Gizli öğeleri say.
+            file_system (LocalFileSystem): Reads folders with the hiding rules.
+                                           Klasörleri gizleme kurallarıyla okur.
         Returns:
             str: Type description. / Tür açıklaması.
         """
         if os.path.isdir(file_path):
             try:
-                dir_items = os.listdir(file_path)
-                if not self.show_hidden.get():
-                    dir_items = filter_hidden_items(dir_items, file_path)
-                item_count = len(dir_items)
+                dir_nodes = file_system.list_directory(file_path)
+                if show_hidden:
+                    item_count = len(dir_nodes)
+                else:
+                    item_count = sum(1 for node in dir_nodes if not node.hidden)
                 return "Klasör (" + str(item_count) + " öğe)"
             except PermissionError:
                 return "Klasör (İçerik okunamadı)"
@@ -696,6 +3517,9 @@ class FileExplorerApp:
         """
         Adds a label-value pair to the info window.
         Bilgi penceresine etiket-değer satırı ekler.
+
+        Returns:
+            ttk.Label: Value label, for later updates. / Sonraki güncellemeler için değer etiketi.
         """
         # Label (bold, right-aligned) / Etiket (kalın, sağa yaslı)
         label = ttk.Label(parent_frame,
@@ -710,6 +3534,36 @@ class FileExplorerApp:
                            anchor="w",
                            wraplength=300)
         value.grid(row=row_number, column=1, sticky="w", padx=5, pady=3)
+        return value
+
+    def _poll_dir_size(self, job, info_window, size_label):
+        """
+        Shows the running folder size in the info window until the job ends.
+        Closing the window cancels the job.
+        İş bitene kadar bilgi penceresinde ara klasör boyutunu gösterir.
+        Pencereyi kapatmak işi iptal eder.
+        """
+        if not info_window.winfo_exists():
+            job.cancel()
+            return
+
+        # Read before the totals: they are final once "done" is set
+        # Toplamlardan önce oku: "done" ayarlanınca kesinleşirler
+        finished = job.done
+
+        counts = (str(job.file_count) + " dosya, "
+                  + str(job.folder_count) + " klasör")
+        size_text = format_size(job.total_bytes) + " (" + counts
+
+        if not finished:
+            size_label.config(text=size_text + ", hesaplanıyor...)")
+            self.root.after(200, self._poll_dir_size, job, info_window, size_label)
+            return
+
+        if job.error_count > 0:
+            size_label.config(text=size_text + ", bazı klasörler okunamadı)")
+        else:
+            size_label.config(text=size_text + ")")
 
     # =========================================================================
     # Expand / Collapse / Genişlet / Daralt
@@ -717,56 +3571,150 @@ class FileExplorerApp:
 
     def expand_all(self):
         """
-        Expands all folders (up to depth 3).
-        Tüm klasörleri genişletir (maksimum derinlik 3).
+        Expands all folders breadth-first in the background, up to
+        config.EXPAND_MAX_DEPTH levels and config.EXPAND_MAX_NODES items.
+        Sibling folders are read in parallel; Escape cancels.
+        Tüm klasörleri arka planda genişlik öncelikli genişletir; en fazla
+        config.EXPAND_MAX_DEPTH seviye ve config.EXPAND_MAX_NODES öğe.
+        Kardeş klasörler paralel okunur; Escape iptal eder.
         """
-        self._show_status("Tüm klasörler genişletiliyor...")
+        if self._expand_job is not None:
+            self.cancel_expand()
+
+        job = _ExpandJob(config.EXPAND_MAX_DEPTH, config.EXPAND_MAX_NODES)
+        job.op = self.profiler.begin("expand_all", self.root_dir)
+        self._expand_job = job
 
         top_items = self.treeview.get_children("")
         for item_id in top_items:
-            self._expand_recursive(item_id, 0, 3)
+            job.pending.append((item_id, 0))
+
+        self._expand_step(job)
+        self.root.after(200, self._expand_tick, job)
+
+    def cancel_expand(self):
+        """
+        Stops a running Expand All. Folders already opened stay open.
+        Çalışan Tümünü Genişlet'i durdurur. Zaten açılan klasörler açık kalır.
+        """
+        job = self._expand_job
+        if job is None:
+            return
+
+        self._expand_job = None
+        self.profiler.finish(job.op, "cancelled")
+        for item_id in job.in_flight:
+            self._cancel_load(item_id)
+        self._show_status("Genişletme iptal edildi (" + str(job.folder_count)
+                          + " klasör, " + str(job.node_count) + " öğe).")
 
-        self._show_status("Tüm klasörler genişletildi.")
+    def _expand_step(self, job):
+        """
+        Starts loads from the queue until the parallel limit or a budget is reached.
+        Paralel sınıra veya bir bütçeye ulaşılana kadar kuyruktan yüklemeler başlatır.
+        """
+        if job is not self._expand_job:
+            return
+
+        while (job.pending
+               and len(job.in_flight) < config.EXPAND_PARALLEL_LOADS
+               and job.node_count < job.max_nodes):
+            item_id, depth = job.pending.popleft()
+
+            node = self.nodes.get(item_id)
+            if node is None or not node.is_dir:
+                continue
+            if not self.treeview.exists(item_id):
+                continue
+
+            # Open this folder / Bu klasörü aç
+            self.treeview.item(item_id, open=True)
+            job.depth = max(job.depth, depth)
 
-    def _expand_recursive(self, item_id, current_depth, max_depth):
+            # Already loaded: go straight to its children
+            # Zaten yüklü: doğrudan alt öğelerine geç
+            if node.loaded:
+                self._expand_enqueue_children(job, item_id, depth)
+                continue
+
+            job.in_flight.add(item_id)
+            self._load_children(
+                item_id,
+                on_done=lambda loaded_id=item_id, loaded_depth=depth:
+                    self._on_expand_loaded(job, loaded_id, loaded_depth),
+                parent_op=job.op)
+
+        self._show_expand_progress(job)
+
+    def _on_expand_loaded(self, job, item_id, depth):
         """
-        Recursively expands folders up to max_depth.
-        Klasörleri max_depth'e kadar rekürsif genişletir.
+        Called when one folder of the crawl has been loaded.
+        Taramadaki bir klasör yüklenince çağrılır.
         """
-        # Stop at max depth / Maksimum derinlikte dur
-        if current_depth >= max_depth:
+        job.in_flight.discard(item_id)
+        if job is not self._expand_job:
             return
 
         node = self.nodes.get(item_id)
+        if node is not None:
+            job.folder_count += 1
+            job.node_count += len(node.children)
 
-        # Only expand directories / Sadece klasörleri genişlet
-        if node is None:
+        self._expand_enqueue_children(job, item_id, depth)
+        self._expand_step(job)
+
+    def _expand_enqueue_children(self, job, item_id, depth):
+        """
+        Queues the child folders of an item for the next level.
+        Bir öğenin alt klasörlerini sonraki seviye için kuyruğa ekler.
+        """
+        if depth + 1 >= job.max_depth:
             return
-        if not node.is_dir:
+
+        for child_id in self.treeview.get_children(item_id):
+            child_node = self.nodes.get(child_id)
+            if child_node is not None and child_node.is_dir:
+                job.pending.append((child_id, depth + 1))
+
+    def _expand_tick(self, job):
+        """
+        Periodic check: drops loads that were cancelled elsewhere (e.g. the
+        user collapsed the folder) and updates the progress.
+        Düzenli kontrol: başka yerde iptal edilen yüklemeleri (ör. kullanıcı
+        klasörü daralttı) çıkarır ve ilerlemeyi günceller.
+        """
+        if job is not self._expand_job:
             return
 
-        # Load if not loaded / Yüklenmemişse yükle
-        if not node.loaded:
-            self._remove_dummy_nodes(item_id)
-            self._load_children(item_id)
+        for item_id in list(job.in_flight):
+            if item_id not in self._loads:
+                job.in_flight.discard(item_id)
 
-        # Open this folder / Bu klasörü aç
-        self.treeview.item(item_id, open=True)
+        self._expand_step(job)
+        if job is self._expand_job:
+            self.root.after(200, self._expand_tick, job)
 
-        # Expand children / Alt öğeleri genişlet
-        children = self.treeview.get_children(item_id)
-        for child_id in children:
-            child_text = self.treeview.item(child_id, "text")
+    def _show_expand_progress(self, job):
+        """
+        Shows the crawl progress, or the final status when it is done.
+        Tarama ilerlemesini veya bittiğinde son durumu gösterir.
+        """
+        counts = (str(job.folder_count) + " klasör, "
+                  + str(job.node_count) + " öğe")
 
-            # Skip placeholders / Yer tutucuları atla
-            if "Yükleniyor..." in child_text:
-                continue
-            if "Erişim izni yok" in child_text:
-                continue
-            if "Hata:" in child_text:
-                continue
+        if job.in_flight:
+            self._show_status("Tüm klasörler genişletiliyor... seviye "
+                              + str(job.depth + 1) + ", " + counts
+                              + " (Esc: iptal)")
+            return
 
-            self._expand_recursive(child_id, current_depth + 1, max_depth)
+        # Nothing loading any more: finished / Artık yüklenen yok: bitti
+        self._expand_job = None
+        self.profiler.finish(job.op)
+        if job.pending and job.node_count >= job.max_nodes:
+            self._show_status("Genişletme sınırına ulaşıldı (" + counts + ").")
+        else:
+            self._show_status("Tüm klasörler genişletildi (" + counts + ").")
 
     def collapse_all(self):
         """
@@ -778,7 +3726,9 @@ class FileExplorerApp:
         top_items = self.treeview.get_children("")
         for item_id in top_items:
             self.treeview.item(item_id, open=False)
+            self._unwatch_subtree(item_id)
 
+        self._schedule_eviction()
         self._show_status("Tüm klasörler daraltıldı.")
 
     # =========================================================================
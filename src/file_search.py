@@ -0,0 +1,219 @@
+# =============================================================================
+# file_search.py - Recursive File Search / Özyinelemeli Dosya Arama
+# =============================================================================
+# Searches file and folder names under a directory with a glob, substring
+# or regular expression pattern. Folders are read in parallel by a small
+# thread pool and every match is put into a queue as soon as it is found,
+# so the UI can show results while the search is still running.
+# Folders that are already loaded in the tree are not read again: their
+# TreeNode children are used instead.
+#
+# Bir dizin altındaki dosya ve klasör adlarını joker (glob), metin veya
+# düzenli ifade deseniyle arar. Klasörler küçük bir iş parçacığı havuzunda
+# paralel okunur ve her eşleşme bulunur bulunmaz bir kuyruğa konur; böylece
+# arayüz arama sürerken sonuçları gösterebilir. Ağaçta zaten yüklenmiş
+# klasörler yeniden okunmaz: onların TreeNode alt öğeleri kullanılır.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import re           # Regular expressions / Düzenli ifadeler
+import queue        # Result queue / Sonuç kuyruğu
+import fnmatch      # Glob patterns / Joker desenleri
+import threading    # Cancel event and coordinator / İptal olayı ve koordinatör
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .file_utils import is_hidden_entry
+
+
+# --- Search modes / Arama modları ---
+SEARCH_MODES = ("glob", "substring", "prefix", "regex")
+
+
+def make_matcher(pattern, mode="substring", case_sensitive=False):
+    """
+    Builds a name matching function.
+    Bir ad eşleştirme fonksiyonu oluşturur.
+
+    Args:
+        pattern (str): Search pattern. / Arama deseni.
+        mode (str): "glob", "substring", "prefix" or "regex".
+                    "glob", "substring", "prefix" veya "regex".
+        case_sensitive (bool): Match case. / Büyük/küçük harfe duyarlı.
+    Returns:
+        callable: matcher(name) -> bool
+    Raises:
+        re.error: If a regular expression is invalid. / Düzenli ifade geçersizse.
+        ValueError: If the mode is unknown. / Mod bilinmiyorsa.
+    """
+    flags = 0
+    if not case_sensitive:
+        flags = re.IGNORECASE
+
+    if mode == "glob":
+        return re.compile(fnmatch.translate(pattern), flags).match
+
+    if mode == "regex":
+        return re.compile(pattern, flags).search
+
+    if mode == "substring":
+        if case_sensitive:
+            return lambda name: pattern in name
+        lowered = pattern.lower()
+        return lambda name: lowered in name.lower()
+
+    if mode == "prefix":
+        if case_sensitive:
+            return lambda name: name.startswith(pattern)
+        lowered = pattern.lower()
+        return lambda name: name.lower().startswith(lowered)
+
+    raise ValueError("Unknown search mode: " + str(mode))
+
+
+class FileSearch:
+    """
+    One running search. Matches arrive in the `results` queue.
+    Çalışan tek bir arama. Eşleşmeler `results` kuyruğuna gelir.
+    """
+
+    def __init__(self, root_dir, matcher, show_hidden=False, loaded_nodes=None,
+                 workers=4, max_results=10000, hidden_rules=None):
+        """
+        Args:
+            root_dir (str): Directory to search under. / Altında aranacak dizin.
+            matcher (callable): From make_matcher. / make_matcher sonucu.
+            show_hidden (bool): Search hidden entries too. / Gizli öğelerde de ara.
+            loaded_nodes (dict, optional): path -> loaded TreeNode to reuse.
+                                           Tekrar kullanılacak yol -> yüklü TreeNode.
+            workers (int): Parallel folder readers. / Paralel klasör okuyucu sayısı.
+            max_results (int): Stop after this many matches. / Bu kadar eşleşmeden sonra dur.
+            hidden_rules (HiddenRules, optional): ".hidden" files and ignore patterns.
+                                                  ".hidden" dosyaları ve yoksayma desenleri.
+        """
+        self.root_dir = root_dir
+        self.matcher = matcher
+        self.show_hidden = show_hidden
+        self.loaded_nodes = loaded_nodes or {}
+        self.workers = workers
+        self.max_results = max_results
+        self.hidden_rules = hidden_rules
+
+        self.results = queue.Queue()        # Matching paths / Eşleşen yollar
+        self.cancel_event = threading.Event()
+        self.done = False                   # Finished or cancelled / Bitti veya iptal edildi
+        self.result_count = 0
+        self.folder_count = 0
+
+        self._count_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """
+        Starts the search in the background.
+        Aramayı arka planda başlatır.
+        """
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Stops the search. / Aramayı durdurur.
+        """
+        self.cancel_event.set()
+
+    def _run(self):
+        """
+        Coordinator thread: hands every found folder to the pool.
+        Koordinatör iş parçacığı: bulunan her klasörü havuza verir.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                running = {pool.submit(self._search_folder, self.root_dir)}
+
+                while running:
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in finished:
+                        try:
+                            subfolders = future.result()
+                        except OSError:
+                            # Unreadable folder: skip it / Okunamayan klasör: atla
+                            continue
+
+                        if self.cancel_event.is_set():
+                            continue
+
+                        for folder_path in subfolders:
+                            running.add(pool.submit(self._search_folder, folder_path))
+        finally:
+            self.done = True
+
+    def _list_folder(self, folder_path):
+        """
+        Returns (name, is_dir, hidden) tuples of a folder, from the loaded
+        tree when possible. Symbolic links to folders are not followed.
+        Bir klasörün (ad, klasör_mü, gizli) demetlerini döndürür; mümkünse
+        yüklü ağaçtan. Klasörlere giden sembolik bağlar takip edilmez.
+        """
+        node = self.loaded_nodes.get(folder_path)
+        if node is not None and node.loaded:
+            entries = []
+            for child in list(node.children):
+                entries.append((child.name, child.is_dir, child.hidden))
+            return entries
+
+        names = []
+        dir_flags = []
+        hidden_flags = []
+        with os.scandir(folder_path) as scan:
+            for entry in scan:
+                try:
+                    entry_is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    entry_is_dir = False
+                names.append(entry.name)
+                dir_flags.append(entry_is_dir)
+                hidden_flags.append(is_hidden_entry(entry))
+
+        if self.hidden_rules is not None:
+            hidden_flags = self.hidden_rules.hidden_flags(folder_path, names,
+                                                          dir_flags, hidden_flags)
+        return list(zip(names, dir_flags, hidden_flags))
+
+    def _search_folder(self, folder_path):
+        """
+        Worker job: matches the names in one folder.
+        İşçi görevi: bir klasördeki adları eşleştirir.
+
+        Returns:
+            list: Subfolders to search next. / Sonra aranacak alt klasörler.
+        """
+        if self.cancel_event.is_set():
+            return []
+
+        subfolders = []
+        for name, entry_is_dir, hidden in self._list_folder(folder_path):
+            if hidden and not self.show_hidden:
+                continue
+
+            entry_path = os.path.join(folder_path, name)
+            if self.matcher(name):
+                self._add_result(entry_path)
+            if entry_is_dir:
+                subfolders.append(entry_path)
+
+        with self._count_lock:
+            self.folder_count += 1
+        return subfolders
+
+    def _add_result(self, path):
+        """
+        Queues a match and stops the search at max_results.
+        Bir eşleşmeyi kuyruğa ekler ve max_results'ta aramayı durdurur.
+        """
+        with self._count_lock:
+            if self.result_count >= self.max_results:
+                self.cancel_event.set()
+                return
+            self.result_count += 1
+
+        self.results.put(path)
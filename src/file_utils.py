@@ -21,9 +21,25 @@ EMOJI_ICONS = {
     "video": "🎬",
     "audio": "🎵",
     "archive": "🗄️",
+    "executable": "⚙️",
     "unknown": "❓",
 }
 
+# --- Type names shown in the "Tür" column / "Tür" sütununda gösterilen tür adları ---
+CATEGORY_NAMES = {
+    "directory": "Klasör",
+    "file": "Dosya",
+    "text": "Metin",
+    "image": "Resim",
+    "code": "Kod",
+    "pdf": "PDF",
+    "video": "Video",
+    "audio": "Ses",
+    "archive": "Arşiv",
+    "executable": "Program",
+    "unknown": "Bilinmeyen",
+}
+
 # --- File extension categories / Dosya uzantısı kategorileri ---
 # Each list maps file extensions to a category name
 # Her liste, dosya uzantılarını bir kategori adına eşler
@@ -33,56 +49,138 @@ CODE_EXTENSIONS = [".py", ".js", ".html", ".css", ".java", ".c", ".cpp",
                    ".cs", ".php", ".rb", ".go", ".swift", ".kt"]
 VIDEO_EXTENSIONS = [".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv"]
 AUDIO_EXTENSIONS = [".mp3", ".wav", ".ogg", ".aac", ".flac"]
-ARCHIVE_EXTENSIONS = [".zip", ".rar", ".tar", ".gz", ".7z", ".bz2"]
+ARCHIVE_EXTENSIONS = [".zip", ".rar", ".tar", ".gz", ".7z", ".bz2",
+                      ".xz", ".zst", ".tgz", ".tbz2", ".txz"]
+
+# Two-part extensions, checked before the last part alone
+# İki parçalı uzantılar, tek başına son parçadan önce kontrol edilir
+COMPOUND_EXTENSIONS = {
+    ".tar.gz": "archive",
+    ".tar.bz2": "archive",
+    ".tar.xz": "archive",
+    ".tar.zst": "archive",
+}
 
 
-def get_file_icon(file_path):
+def _build_extension_table():
+    """
+    Builds the lowercase extension -> category lookup table once.
+    Küçük harfli uzantı -> kategori arama tablosunu bir kez oluşturur.
+    """
+    table = {".pdf": "pdf"}
+    for extensions, category in ((TEXT_EXTENSIONS, "text"),
+                                 (IMAGE_EXTENSIONS, "image"),
+                                 (CODE_EXTENSIONS, "code"),
+                                 (VIDEO_EXTENSIONS, "video"),
+                                 (AUDIO_EXTENSIONS, "audio"),
+                                 (ARCHIVE_EXTENSIONS, "archive")):
+        for extension in extensions:
+            table[extension] = category
+    return table
+
+
+# One dict lookup per file instead of scanning the lists
+# Listeleri taramak yerine dosya başına tek sözlük araması
+EXTENSION_CATEGORIES = _build_extension_table()
+
+
+def get_file_icon(file_path, is_dir=None):
     """
     Returns an emoji icon based on file type.
     Dosya türüne göre emoji ikon döndürür.
 
     Args:
         file_path (str): Path to the file. / Dosya yolu.
+        is_dir (bool, optional): Known entry type; when given, the file
+                                 system is not touched.
+                                 Bilinen öğe türü; verilirse dosya
+                                 sistemine erişilmez.
     Returns:
         str: Emoji icon. / Emoji ikon.
     """
-    # Check if file exists / Dosya var mı kontrol et
-    if not os.path.exists(file_path):
-        return EMOJI_ICONS["unknown"]
+    if is_dir is None:
+        # Check if file exists / Dosya var mı kontrol et
+        if not os.path.exists(file_path):
+            return EMOJI_ICONS["unknown"]
 
-    # Directory check / Klasör kontrolü
-    if os.path.isdir(file_path):
-        return EMOJI_ICONS["directory"]
+        # Directory check / Klasör kontrolü
+        is_dir = os.path.isdir(file_path)
 
-    # Get file extension and convert to lowercase
-    # Dosya uzantısını al ve küçük harfe çevir
-    file_name, extension = os.path.splitext(file_path)
-    extension = extension.lower()
+    category = get_file_category(os.path.basename(file_path), is_dir)
+    return EMOJI_ICONS[category]
 
-    # Match extension to category / Uzantıyı kategori ile eşleştir
-    if extension in TEXT_EXTENSIONS:
-        return EMOJI_ICONS["text"]
 
-    if extension in IMAGE_EXTENSIONS:
-        return EMOJI_ICONS["image"]
+def get_file_category(file_name, is_dir=False):
+    """
+    Returns the icon category for an entry whose type is already known.
+    Does not touch the file system.
+    Türü zaten bilinen bir öğenin ikon kategorisini döndürür.
+    Dosya sistemine erişmez.
 
-    if extension in CODE_EXTENSIONS:
-        return EMOJI_ICONS["code"]
+    Args:
+        file_name (str): File/directory name. / Dosya/klasör adı.
+        is_dir (bool): True = directory. / True = klasör.
+    Returns:
+        str: Category key in EMOJI_ICONS. / EMOJI_ICONS içindeki kategori anahtarı.
+    """
+    if is_dir:
+        return "directory"
+
+    # Last "." that is not part of the leading dots (like os.path.splitext)
+    # Baştaki noktalardan olmayan son "." (os.path.splitext gibi)
+    dot = file_name.rfind(".")
+    if dot <= 0:
+        return "file"
+    if file_name[0] == "." and not file_name[:dot].strip("."):
+        return "file"
+
+    # "name.tar.gz": try the two-part extension first
+    # "ad.tar.gz": önce iki parçalı uzantıyı dene
+    previous_dot = file_name.rfind(".", 0, dot)
+    if previous_dot > 0:
+        category = COMPOUND_EXTENSIONS.get(file_name[previous_dot:].lower())
+        if category is not None:
+            return category
+
+    return EXTENSION_CATEGORIES.get(file_name[dot:].lower(), "file")
 
-    if extension == ".pdf":
-        return EMOJI_ICONS["pdf"]
 
-    if extension in VIDEO_EXTENSIONS:
-        return EMOJI_ICONS["video"]
+def get_file_categories(file_names, dir_flags):
+    """
+    Classifies a whole directory listing at once (same rules as
+    get_file_category, without a function call per name).
+    Bütün bir dizin listesini tek seferde sınıflandırır (get_file_category
+    ile aynı kurallar, ad başına fonksiyon çağrısı olmadan).
+
+    Args:
+        file_names (list): Entry names. / Öğe adları.
+        dir_flags (list): True for directories, same order. / Klasörler için True, aynı sırada.
+    Returns:
+        list: Category keys in the same order. / Aynı sırada kategori anahtarları.
+    """
+    lookup = EXTENSION_CATEGORIES.get
+    compound_lookup = COMPOUND_EXTENSIONS.get
+    categories = []
 
-    if extension in AUDIO_EXTENSIONS:
-        return EMOJI_ICONS["audio"]
+    for file_name, entry_is_dir in zip(file_names, dir_flags):
+        if entry_is_dir:
+            categories.append("directory")
+            continue
 
-    if extension in ARCHIVE_EXTENSIONS:
-        return EMOJI_ICONS["archive"]
+        dot = file_name.rfind(".")
+        if dot <= 0 or (file_name[0] == "." and not file_name[:dot].strip(".")):
+            categories.append("file")
+            continue
 
-    # Default: generic file icon / Varsayılan: genel dosya ikonu
-    return EMOJI_ICONS["file"]
+        category = None
+        previous_dot = file_name.rfind(".", 0, dot)
+        if previous_dot > 0:
+            category = compound_lookup(file_name[previous_dot:].lower())
+        if category is None:
+            category = lookup(file_name[dot:].lower(), "file")
+        categories.append(category)
+
+    return categories
 
 
 def is_hidden(path):
@@ -116,6 +214,37 @@ def is_hidden(path):
     return False
 
 
+def is_hidden_entry(entry):
+    """
+    Checks if an os.scandir() entry is hidden.
+    Uses the attributes cached on the entry instead of a new stat call.
+    Bir os.scandir() öğesinin gizli olup olmadığını kontrol eder.
+    Yeni bir stat çağrısı yerine öğede önbelleklenmiş öznitelikleri kullanır.
+
+    Args:
+        entry (os.DirEntry): Directory entry. / Dizin öğesi.
+    Returns:
+        bool: True if hidden. / Gizli ise True.
+    """
+    # Unix/macOS: only the name is needed / Unix/macOS: sadece ad gerekir
+    if os.name == "posix":
+        return entry.name.startswith(".")
+
+    # Windows: scandir already filled in the attributes, so stat() is free.
+    # Links are followed like is_hidden() does (only they cost a stat call).
+    # Windows: scandir öznitelikleri zaten doldurdu, stat() maliyetsizdir.
+    # Bağlantılar is_hidden() gibi takip edilir (sadece onlar stat çağrısı yapar).
+    if os.name == "nt":
+        import stat
+        try:
+            file_attributes = entry.stat().st_file_attributes
+            return bool(file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+        except OSError:
+            return False
+
+    return False
+
+
 def format_size(size_bytes):
     """
     Converts bytes to human-readable format (KB, MB, GB...).
@@ -157,7 +286,13 @@ def format_size(size_bytes):
 def filter_hidden_items(items, parent_path):
     """
     Filters out hidden files from a list of file names.
+    On POSIX only the names are checked. On Windows the parent folder is
+    read once with os.scandir, whose entries already carry the hidden
+    attribute, instead of one os.stat per item.
     Dosya adları listesinden gizli dosyaları filtreler.
+    POSIX'te sadece adlar kontrol edilir. Windows'ta öğe başına bir os.stat
+    yerine üst klasör os.scandir ile bir kez okunur; öğeleri gizli
+    özniteliğini zaten taşır.
 
     Args:
         items (list): List of file/directory names. / Dosya/klasör adları listesi.
@@ -166,9 +301,28 @@ def filter_hidden_items(items, parent_path):
         list: Filtered list without hidden files. / Gizli dosyalar olmadan filtrelenmiş liste.
     """
     visible_items = []
+
+    if os.name == "posix":
+        for item in items:
+            if not item.startswith("."):
+                visible_items.append(item)
+        return visible_items
+
+    try:
+        hidden_names = set()
+        with os.scandir(parent_path) as entries:
+            for entry in entries:
+                if is_hidden_entry(entry):
+                    hidden_names.add(entry.name)
+    except OSError:
+        # Folder not readable: check item by item / Klasör okunamıyor: tek tek kontrol et
+        for item in items:
+            if not is_hidden(os.path.join(parent_path, item)):
+                visible_items.append(item)
+        return visible_items
+
     for item in items:
-        full_path = os.path.join(parent_path, item)
-        if not is_hidden(full_path):
+        if item not in hidden_names:
             visible_items.append(item)
     return visible_items
 
@@ -0,0 +1,412 @@
+# =============================================================================
+# fs_watcher.py - Live Folder Watcher / Canlı Klasör İzleyici
+# =============================================================================
+# Watches loaded folders for added, removed and renamed entries.
+# On Linux it uses inotify through ctypes; everywhere else, and for folders
+# on network file systems (where inotify does not see changes made by other
+# machines), it falls back to polling each folder's mtime.
+#
+# Changes are collected into a set of folder paths. drain() only hands them
+# out after a quiet period, so a burst of events (for example a build that
+# writes thousands of files) becomes a single batched update per folder.
+#
+# Yüklenmiş klasörlerde eklenen, silinen ve yeniden adlandırılan öğeleri
+# izler. Linux'ta ctypes üzerinden inotify kullanır; diğer sistemlerde ve
+# ağ dosya sistemlerindeki klasörlerde (inotify başka makinelerin yaptığı
+# değişiklikleri görmez) her klasörün mtime değerini yoklar.
+#
+# Değişiklikler bir klasör yolu kümesinde toplanır. drain() bunları sadece
+# sessiz bir süreden sonra verir; böylece bir olay patlaması (örneğin
+# binlerce dosya yazan bir derleme) klasör başına tek bir toplu güncellemeye
+# dönüşür.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import sys          # Platform check / Platform kontrolü
+import time         # Debounce timing / Gecikme zamanlaması
+import errno        # Error codes / Hata kodları
+import select       # Waiting for events / Olayları beklemek için
+import struct       # Parsing inotify events / inotify olaylarını ayrıştırma
+import threading    # Reader thread / Okuyucu iş parçacığı
+import ctypes       # inotify system calls / inotify sistem çağrıları
+import ctypes.util
+
+
+# --- inotify constants (linux/inotify.h) / inotify sabitleri ---
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_ONLYDIR = 0x01000000
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Only changes to the list of entries matter, not file contents
+# Sadece öğe listesindeki değişiklikler önemlidir, dosya içerikleri değil
+WATCH_MASK = (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# struct inotify_event header: wd, mask, cookie, len
+EVENT_HEADER = struct.Struct("iIII")
+
+# File systems where inotify misses remote changes / inotify'ın uzak değişiklikleri kaçırdığı dosya sistemleri
+NETWORK_FILE_SYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p",
+                        "fuse.sshfs", "afs", "ceph", "glusterfs", "lustre"}
+
+
+class _ChangeSet:
+    """
+    Thread-safe set of changed folders with debouncing.
+    Gecikmeli teslim eden, iş parçacığı güvenli değişen klasörler kümesi.
+    """
+
+    def __init__(self, quiet_seconds, max_delay_seconds):
+        self.quiet_seconds = quiet_seconds          # Wait for silence / Sessizlik bekle
+        self.max_delay_seconds = max_delay_seconds  # But never longer / Ama asla daha uzun değil
+        self._paths = set()
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, path):
+        now = time.monotonic()
+        with self._lock:
+            if not self._paths:
+                self._first_event = now
+            self._paths.add(path)
+            self._last_event = now
+
+    def drain(self):
+        now = time.monotonic()
+        with self._lock:
+            if not self._paths:
+                return set()
+
+            quiet = now - self._last_event >= self.quiet_seconds
+            overdue = now - self._first_event >= self.max_delay_seconds
+            if not quiet and not overdue:
+                return set()
+
+            paths = self._paths
+            self._paths = set()
+            return paths
+
+
+class PollingWatcher:
+    """
+    Detects folder changes by comparing st_mtime_ns and st_ino periodically.
+    Klasör değişikliklerini st_mtime_ns ve st_ino değerlerini düzenli
+    karşılaştırarak algılar.
+    """
+
+    def __init__(self, changes, interval_seconds=2.0):
+        """
+        Args:
+            changes (_ChangeSet): Where changed folders are collected. / Değişen klasörlerin toplandığı yer.
+            interval_seconds (float): Time between polls. / Yoklamalar arası süre.
+        """
+        self._changes = changes
+        self.interval_seconds = interval_seconds
+        self._stamps = {}                   # path -> (mtime_ns, ino)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, path):
+        stamp = self._read_stamp(path)
+        with self._lock:
+            self._stamps[path] = stamp
+
+    def remove(self, path):
+        with self._lock:
+            self._stamps.pop(path, None)
+
+    def clear(self):
+        with self._lock:
+            self._stamps.clear()
+
+    def count(self):
+        return len(self._stamps)
+
+    def close(self):
+        self._stop_event.set()
+
+    @staticmethod
+    def _read_stamp(path):
+        try:
+            dir_stat = os.stat(path)
+            return (dir_stat.st_mtime_ns, dir_stat.st_ino)
+        except OSError:
+            return None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval_seconds):
+            with self._lock:
+                watched = list(self._stamps.items())
+
+            for path, old_stamp in watched:
+                new_stamp = self._read_stamp(path)
+                if new_stamp == old_stamp:
+                    continue
+
+                with self._lock:
+                    # Skip folders removed meanwhile / Bu arada kaldırılan klasörleri atla
+                    if path not in self._stamps:
+                        continue
+                    self._stamps[path] = new_stamp
+                self._changes.add(path)
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watcher (through ctypes). Folders on network file systems
+    are handed to an internal PollingWatcher.
+    Linux inotify izleyicisi (ctypes ile). Ağ dosya sistemlerindeki klasörler
+    dahili bir PollingWatcher'a verilir.
+    """
+
+    def __init__(self, changes, poll_interval_seconds=2.0):
+        """
+        Args:
+            changes (_ChangeSet): Where changed folders are collected. / Değişen klasörlerin toplandığı yer.
+            poll_interval_seconds (float): Poll interval for network folders. / Ağ klasörleri için yoklama aralığı.
+        Raises:
+            OSError: If inotify is not available. / inotify kullanılamıyorsa.
+        """
+        self._changes = changes
+
+        library_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(library_name, use_errno=True)
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error_code = ctypes.get_errno()
+            raise OSError(error_code, os.strerror(error_code))
+
+        self._path_by_wd = {}
+        self._wd_by_path = {}
+        self._lock = threading.Lock()
+
+        # Network folders are polled instead / Ağ klasörleri bunun yerine yoklanır
+        self._poller = PollingWatcher(changes, poll_interval_seconds)
+        self._mounts = _read_mount_types()
+
+        # Pipe used to wake up the reader thread when closing
+        # Kapatırken okuyucu iş parçacığını uyandırmak için kullanılan boru
+        self._wake_read, self._wake_write = os.pipe()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, path):
+        if _is_network_path(path, self._mounts):
+            self._poller.add(path)
+            return
+
+        with self._lock:
+            if path in self._wd_by_path:
+                return
+
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if wd < 0:
+                # Limit reached or folder gone: fall back to polling
+                # Sınıra ulaşıldı veya klasör yok: yoklamaya geri dön
+                error_code = ctypes.get_errno()
+                if error_code == errno.ENOENT:
+                    return
+                self._poller.add(path)
+                return
+
+            self._path_by_wd[wd] = path
+            self._wd_by_path[path] = wd
+
+    def remove(self, path):
+        self._poller.remove(path)
+
+        with self._lock:
+            wd = self._wd_by_path.pop(path, None)
+            if wd is None:
+                return
+            self._path_by_wd.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def clear(self):
+        self._poller.clear()
+
+        with self._lock:
+            for wd in self._path_by_wd:
+                self._libc.inotify_rm_watch(self._fd, wd)
+            self._path_by_wd.clear()
+            self._wd_by_path.clear()
+
+    def count(self):
+        return len(self._wd_by_path) + self._poller.count()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._poller.close()
+        os.write(self._wake_write, b"x")
+
+    def _run(self):
+        """
+        Reader thread: turns inotify events into changed folder paths.
+        Okuyucu iş parçacığı: inotify olaylarını değişen klasör yollarına çevirir.
+        """
+        try:
+            while not self._closed:
+                readable, _, _ = select.select([self._fd, self._wake_read], [], [])
+                if self._wake_read in readable:
+                    break
+
+                try:
+                    data = os.read(self._fd, 65536)
+                except BlockingIOError:
+                    continue
+
+                self._handle_events(data)
+        finally:
+            os.close(self._fd)
+            os.close(self._wake_read)
+            os.close(self._wake_write)
+
+    def _handle_events(self, data):
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size + name_length
+
+            # Event queue overflowed: every watched folder may have changed
+            # Olay kuyruğu taştı: izlenen her klasör değişmiş olabilir
+            if mask & IN_Q_OVERFLOW:
+                with self._lock:
+                    watched = list(self._wd_by_path)
+                for path in watched:
+                    self._changes.add(path)
+                continue
+
+            with self._lock:
+                path = self._path_by_wd.get(wd)
+                # The kernel dropped this watch / Çekirdek bu izlemeyi bıraktı
+                if mask & IN_IGNORED and path is not None:
+                    del self._path_by_wd[wd]
+                    self._wd_by_path.pop(path, None)
+                    continue
+
+            # Folder itself deleted or moved: its parent reports the change
+            # Klasörün kendisi silindi veya taşındı: değişikliği ebeveyni bildirir
+            if path is None or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                continue
+
+            self._changes.add(path)
+
+
+def _read_mount_types():
+    """
+    Returns (mount point, file system type) pairs, longest path first.
+    (bağlama noktası, dosya sistemi türü) çiftlerini döndürür, en uzun yol önce.
+    """
+    mounts = []
+    try:
+        with open("/proc/self/mounts") as mounts_file:
+            for line in mounts_file:
+                fields = line.split()
+                if len(fields) >= 3:
+                    # Spaces in mount points are written as \040
+                    # Bağlama noktalarındaki boşluklar \040 olarak yazılır
+                    mount_point = fields[1].replace("\\040", " ")
+                    mounts.append((mount_point, fields[2]))
+    except OSError:
+        return []
+
+    mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+    return mounts
+
+
+def _is_network_path(path, mounts):
+    """
+    Checks if a path is on a network file system.
+    Bir yolun ağ dosya sisteminde olup olmadığını kontrol eder.
+    """
+    for mount_point, fs_type in mounts:
+        if path == mount_point or path.startswith(mount_point.rstrip("/") + "/"):
+            return fs_type in NETWORK_FILE_SYSTEMS
+    return False
+
+
+class FolderWatcher:
+    """
+    Public watcher: picks inotify or polling and debounces the changes.
+    Genel izleyici: inotify veya yoklamayı seçer ve değişiklikleri geciktirir.
+    """
+
+    def __init__(self, mode="auto", quiet_ms=300, max_delay_ms=2000, poll_interval_ms=2000):
+        """
+        Args:
+            mode (str): "auto", "inotify" or "poll". / "auto", "inotify" veya "poll".
+            quiet_ms (int): Deliver after this much silence. / Bu kadar sessizlikten sonra teslim et.
+            max_delay_ms (int): Deliver at the latest after this. / En geç bundan sonra teslim et.
+            poll_interval_ms (int): Polling interval. / Yoklama aralığı.
+        """
+        self._changes = _ChangeSet(quiet_ms / 1000.0, max_delay_ms / 1000.0)
+        poll_seconds = poll_interval_ms / 1000.0
+
+        self._backend = None
+        if mode in ("auto", "inotify") and sys.platform.startswith("linux"):
+            try:
+                self._backend = InotifyWatcher(self._changes, poll_seconds)
+            except (OSError, AttributeError):
+                # No inotify (e.g. missing symbol): use polling
+                # inotify yok (ör. eksik sembol): yoklama kullan
+                self._backend = None
+
+        if self._backend is None:
+            self._backend = PollingWatcher(self._changes, poll_seconds)
+
+        self.backend_name = type(self._backend).__name__
+
+    def add(self, path):
+        """
+        Starts watching a folder. / Bir klasörü izlemeye başlar.
+        """
+        self._backend.add(path)
+
+    def remove(self, path):
+        """
+        Stops watching a folder. / Bir klasörü izlemeyi bırakır.
+        """
+        self._backend.remove(path)
+
+    def clear(self):
+        """
+        Stops watching every folder. / Tüm klasörleri izlemeyi bırakır.
+        """
+        self._backend.clear()
+
+    def count(self):
+        """
+        Number of watched folders. / İzlenen klasör sayısı.
+        """
+        return self._backend.count()
+
+    def drain(self):
+        """
+        Returns the changed folders once the burst has settled.
+        Olay patlaması durulunca değişen klasörleri döndürür.
+
+        Returns:
+            set: Changed folder paths (may be empty). / Değişen klasör yolları (boş olabilir).
+        """
+        return self._changes.drain()
+
+    def close(self):
+        """
+        Stops the watcher threads. / İzleyici iş parçacıklarını durdurur.
+        """
+        self._backend.close()
@@ -0,0 +1,245 @@
+# =============================================================================
+# hidden_rules.py - Extra Hiding Rules / Ek Gizleme Kuralları
+# =============================================================================
+# Besides dot files (POSIX) and the hidden attribute (Windows), an entry
+# is treated as hidden when:
+#   - its name is listed in a ".hidden" file of its folder (one name per
+#     line, as used by GNOME Files and Dolphin), or
+#   - its name matches one of the configured ignore patterns.
+#
+# Patterns use a gitignore-style subset and are matched against entry
+# names (not paths): "*", "?" and "[...]" globs, a trailing "/" for
+# folders only, a leading "!" to show a name again, "#" for comments.
+# The last matching pattern wins, like in .gitignore.
+#
+# Rules work on a whole listing at once: the ".hidden" file is only read
+# when the listing contains one, so folders without it cost nothing.
+#
+# Nokta dosyalarının (POSIX) ve gizli özniteliğinin (Windows) yanında bir
+# öğe şu durumlarda gizli sayılır:
+#   - adı klasöründeki bir ".hidden" dosyasında listeleniyorsa (satır
+#     başına bir ad; GNOME Dosyalar ve Dolphin'in kullandığı gibi) veya
+#   - adı ayarlanan yoksayma desenlerinden biriyle eşleşiyorsa.
+#
+# Desenler gitignore'un bir alt kümesidir ve öğe adlarıyla (yollarla değil)
+# eşleştirilir: "*", "?" ve "[...]" jokerleri, sadece klasörler için sonda
+# "/", bir adı yeniden göstermek için başta "!", yorumlar için "#".
+# .gitignore'daki gibi son eşleşen desen kazanır.
+#
+# Kurallar tüm listeye tek seferde uygulanır: ".hidden" dosyası sadece
+# liste onu içeriyorsa okunur, bu yüzden onsuz klasörlerin maliyeti yoktur.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import re           # Compiled patterns / Derlenmiş desenler
+import fnmatch      # Glob to regex / Jokerden düzenli ifadeye
+
+from . import profiler
+
+
+# Name of the per-folder hidden list / Klasör başına gizli listesinin adı
+HIDDEN_LIST_NAME = ".hidden"
+
+# Larger ".hidden" files are ignored / Daha büyük ".hidden" dosyaları yok sayılır
+MAX_HIDDEN_LIST_BYTES = 1024 * 1024
+
+
+def compile_patterns(patterns):
+    """
+    Compiles gitignore-style name patterns.
+    gitignore tarzı ad desenlerini derler.
+
+    Args:
+        patterns (list): Pattern strings. / Desen metinleri.
+    Returns:
+        list: (regex, negate, dir_only) tuples. / (düzenli_ifade, tersi, sadece_klasör) demetleri.
+    """
+    # Names are case-insensitive on Windows / Windows'ta adlar büyük/küçük harfe duyarsızdır
+    flags = 0
+    if os.name == "nt":
+        flags = re.IGNORECASE
+
+    rules = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith("/")
+        pattern = pattern.strip("/")
+
+        # Only names are matched: "**" is the same as "*"
+        # Sadece adlar eşleştirilir: "**", "*" ile aynıdır
+        pattern = pattern.replace("**", "*")
+        if not pattern:
+            continue
+
+        regex = re.compile(fnmatch.translate(pattern), flags)
+        rules.append((regex, negate, dir_only))
+    return rules
+
+
+def _any_match(regexes):
+    """
+    One match function that succeeds if any of the regexes matches.
+    Düzenli ifadelerden herhangi biri eşleşirse başarılı olan tek bir eşleştirme fonksiyonu.
+
+    Returns:
+        function: regex.match of the combined regex, or None without regexes.
+                  Birleşik düzenli ifadenin regex.match'i veya ifade yoksa None.
+    """
+    if not regexes:
+        return None
+    combined = "|".join("(?:" + regex.pattern + ")" for regex in regexes)
+    return re.compile(combined, regexes[0].flags).match
+
+
+def read_hidden_list(dir_path):
+    """
+    Reads the names listed in a folder's ".hidden" file.
+    Bir klasörün ".hidden" dosyasında listelenen adları okur.
+
+    Returns:
+        set: Names (empty if the file is missing or unreadable).
+             Adlar (dosya yoksa veya okunamıyorsa boş).
+    """
+    profiler.count("open")
+    try:
+        with open(os.path.join(dir_path, HIDDEN_LIST_NAME), "rb") as hidden_file:
+            data = hidden_file.read(MAX_HIDDEN_LIST_BYTES + 1)
+    except OSError:
+        return set()
+
+    if len(data) > MAX_HIDDEN_LIST_BYTES:
+        return set()
+
+    names = set()
+    for line in data.decode("utf-8", "surrogateescape").splitlines():
+        name = line.strip().strip("/")
+        if name:
+            names.add(name)
+    return names
+
+
+class HiddenRules:
+    """
+    The ".hidden" files and ignore patterns in effect.
+    Geçerli ".hidden" dosyaları ve yoksayma desenleri.
+    """
+
+    def __init__(self, patterns=(), use_hidden_lists=True):
+        """
+        Args:
+            patterns (list): gitignore-style name patterns. / gitignore tarzı ad desenleri.
+            use_hidden_lists (bool): Read ".hidden" files. / ".hidden" dosyalarını oku.
+        """
+        self.patterns = compile_patterns(patterns)
+        self.use_hidden_lists = use_hidden_lists
+
+        # Most names match no pattern: one combined regex per entry type
+        # answers them with a single call
+        # Çoğu ad hiçbir desenle eşleşmez: öğe türü başına birleşik bir
+        # düzenli ifade onları tek çağrıyla cevaplar
+        self._any_file_match = _any_match([regex for regex, negate, dir_only
+                                           in self.patterns if not dir_only])
+        self._any_dir_match = _any_match([regex for regex, negate, dir_only
+                                          in self.patterns])
+
+    def is_ignored(self, name, is_dir):
+        """
+        True if the last pattern matching the name hides it.
+        Adla eşleşen son desen onu gizliyorsa True.
+        """
+        any_match = self._any_dir_match if is_dir else self._any_file_match
+        if any_match is None or not any_match(name):
+            return False
+
+        ignored = False
+        for regex, negate, dir_only in self.patterns:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(name):
+                ignored = not negate
+        return ignored
+
+    def hidden_flags(self, dir_path, names, dir_flags, hidden_flags):
+        """
+        Applies the rules to a whole listing.
+        Kuralları tüm bir listeye uygular.
+
+        Args:
+            dir_path (str): Folder of the listing. / Listenin klasörü.
+            names (list): Entry names. / Öğe adları.
+            dir_flags (list): True for folders. / Klasörler için True.
+            hidden_flags (list): Hidden by name or attribute. / Ada veya özniteliğe göre gizli.
+        Returns:
+            list: Final hidden flags (the input list when no rule applies).
+                  Son gizli bayrakları (hiçbir kural uygulanmıyorsa girdi listesi).
+        """
+        hidden_list = ()
+        if self.use_hidden_lists and HIDDEN_LIST_NAME in names:
+            hidden_list = read_hidden_list(dir_path)
+
+        if not self.patterns and not hidden_list:
+            return hidden_flags
+
+        flags = []
+        for name, is_dir, hidden in zip(names, dir_flags, hidden_flags):
+            if not hidden:
+                hidden = name in hidden_list or self.is_ignored(name, is_dir)
+            flags.append(hidden)
+        return flags
+
+    def hides(self, dir_path, name, is_dir, hidden_lists=None):
+        """
+        Applies the rules to a single entry (the hidden flag of its name or
+        attribute is not checked here).
+        Kuralları tek bir öğeye uygular (adının veya özniteliğinin gizli
+        bayrağı burada kontrol edilmez).
+
+        Args:
+            dir_path (str): Folder of the entry. / Öğenin klasörü.
+            name (str): Entry name. / Öğe adı.
+            is_dir (bool): True for folders. / Klasörler için True.
+            hidden_lists (dict, optional): Folder -> ".hidden" names, kept
+                                           between calls so each file is read once.
+                                           Klasör -> ".hidden" adları; her dosya bir
+                                           kez okunsun diye çağrılar arasında tutulur.
+        Returns:
+            bool: True if hidden by a ".hidden" file or a pattern.
+                  Bir ".hidden" dosyası veya desen tarafından gizliyse True.
+        """
+        if self.is_ignored(name, is_dir):
+            return True
+        if not self.use_hidden_lists:
+            return False
+
+        if hidden_lists is None:
+            return name in read_hidden_list(dir_path)
+        if dir_path not in hidden_lists:
+            hidden_lists[dir_path] = read_hidden_list(dir_path)
+        return name in hidden_lists[dir_path]
+
+    def apply(self, dir_path, nodes):
+        """
+        Sets the hidden flag of TreeNode objects of one folder.
+        Bir klasörün TreeNode nesnelerinin gizli bayrağını ayarlar.
+        """
+        names = []
+        dir_flags = []
+        hidden_flags = []
+        for node in nodes:
+            names.append(node.name)
+            dir_flags.append(node.is_dir)
+            hidden_flags.append(node.hidden)
+
+        flags = self.hidden_flags(dir_path, names, dir_flags, hidden_flags)
+        if flags is hidden_flags:
+            return
+
+        for node, hidden in zip(nodes, flags):
+            node.hidden = hidden
@@ -0,0 +1,350 @@
+# =============================================================================
+# listing_cache.py - Persistent Directory Listing Cache / Kalıcı Dizin Önbelleği
+# =============================================================================
+# Stores the entries of each scanned directory in a local SQLite file.
+# A stored listing is only used while the directory's own st_mtime_ns and
+# st_ino are unchanged, so adding, removing or renaming an entry always
+# causes a fresh scan. The cache has a size cap with least-recently-used
+# eviction and counts hits and misses.
+#
+# Note: a directory's mtime does not change when a file inside it is only
+# modified, so cached sizes and modification times of entries can be older
+# than the files themselves. Names, types and hidden flags are always exact.
+#
+# Taranan her dizinin öğelerini yerel bir SQLite dosyasında saklar.
+# Saklanan liste sadece dizinin kendi st_mtime_ns ve st_ino değerleri
+# değişmediği sürece kullanılır; bu yüzden bir öğe eklemek, silmek veya
+# yeniden adlandırmak her zaman yeni bir tarama yapılmasına neden olur.
+# Önbelleğin bir boyut sınırı vardır, en uzun süredir kullanılmayanlar
+# atılır (LRU) ve isabet/ıska sayıları tutulur.
+#
+# Not: bir dosya sadece değiştirildiğinde klasörün mtime değeri değişmez;
+# bu yüzden öğelerin önbellekteki boyut ve tarihleri eski olabilir.
+# Adlar, türler ve gizli bayrakları her zaman doğrudur.
+#
+# MemoryListingCache keeps the same listings in memory, one compact JSON
+# string per directory, for when the SQLite file is disabled or cannot be
+# opened. It lets folders unloaded by node eviction open again without a
+# directory scan.
+#
+# MemoryListingCache aynı listeleri bellekte, dizin başına tek bir kompakt
+# JSON metni olarak tutar; SQLite dosyası kapalıysa veya açılamıyorsa
+# kullanılır. Düğüm boşaltmasıyla kaldırılan klasörlerin dizin taraması
+# olmadan yeniden açılmasını sağlar.
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import json         # Entry encoding / Öğe kodlaması
+import time         # Usage timestamps / Kullanım zaman damgaları
+import sqlite3      # Cache storage / Önbellek depolaması
+import threading    # Lock for worker threads / İşçi iş parçacıkları için kilit
+from collections import OrderedDict  # LRU order / LRU sırası
+
+
+# A listing is not stored if the directory changed this recently (ns):
+# a change in the same timestamp tick would otherwise go unnoticed.
+# Dizin bu kadar yakın zamanda değiştiyse (ns) liste saklanmaz:
+# aynı zaman damgası aralığındaki bir değişiklik fark edilmeyebilirdi.
+RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+
+
+class ListingCache:
+    """
+    SQLite-backed cache of directory listings, validated by mtime and inode.
+    mtime ve inode ile doğrulanan, SQLite tabanlı dizin listesi önbelleği.
+    """
+
+    def __init__(self, db_path, max_directories=20000):
+        """
+        Opens (or creates) the cache file.
+        Önbellek dosyasını açar (veya oluşturur).
+
+        Args:
+            db_path (str): SQLite file path. / SQLite dosya yolu.
+            max_directories (int): Size cap in directories. / Dizin cinsinden boyut sınırı.
+        Raises:
+            sqlite3.Error, OSError: If the file cannot be opened.
+                                    Dosya açılamazsa.
+        """
+        self.db_path = db_path
+        self.max_directories = max_directories
+
+        # Hit/miss counters / İsabet/ıska sayaçları
+        self.hits = 0
+        self.misses = 0
+
+        # The connection is shared by worker threads
+        # Bağlantı işçi iş parçacıkları tarafından paylaşılır
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self._connection = sqlite3.connect(db_path, check_same_thread=False,
+                                           isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS listings ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " ino INTEGER NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " entries TEXT NOT NULL)")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS listings_last_used ON listings (last_used)")
+
+        row = self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()
+        self._count = row[0]
+
+    def get(self, dir_path, dir_stat, need_stat=False):
+        """
+        Returns the cached entries of a directory if they are still valid.
+        Bir dizinin önbellekteki öğelerini hâlâ geçerliyse döndürür.
+
+        Args:
+            dir_path (str): Directory path. / Dizin yolu.
+            dir_stat (os.stat_result): Current stat of the directory. / Dizinin güncel stat bilgisi.
+            need_stat (bool): Entries must have size and mtime. / Öğelerde boyut ve mtime olmalı.
+        Returns:
+            list: Entry tuples, or None on a miss. / Öğe demetleri, ıskada None.
+        """
+        with self._lock:
+            try:
+                row = self._connection.execute(
+                    "SELECT mtime_ns, ino, entries FROM listings WHERE path = ?",
+                    (dir_path,)).fetchone()
+            except (sqlite3.Error, ValueError):
+                # ValueError: path cannot be encoded / yol kodlanamıyor
+                row = None
+
+            # Missing or outdated / Yok veya eski
+            if row is None or row[0] != dir_stat.st_mtime_ns or row[1] != dir_stat.st_ino:
+                self.misses += 1
+                return None
+
+            entries = json.loads(row[2])
+
+            # Stored without size/mtime but the caller needs them
+            # Boyut/mtime olmadan saklanmış ama çağıran bunlara ihtiyaç duyuyor
+            if need_stat:
+                for entry in entries:
+                    if entry[2] is None:
+                        self.misses += 1
+                        return None
+
+            try:
+                self._connection.execute(
+                    "UPDATE listings SET last_used = ? WHERE path = ?",
+                    (time.time(), dir_path))
+            except sqlite3.Error:
+                pass
+
+            self.hits += 1
+            return entries
+
+    def put(self, dir_path, dir_stat, entries):
+        """
+        Stores the entries of a directory.
+        Bir dizinin öğelerini saklar.
+
+        Args:
+            dir_path (str): Directory path. / Dizin yolu.
+            dir_stat (os.stat_result): Stat taken before the scan. / Taramadan önce alınan stat.
+            entries (list): Entry tuples. / Öğe demetleri.
+        """
+        # Skip directories that are still changing / Hâlâ değişen dizinleri atla
+        if time.time_ns() - dir_stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+
+        data = json.dumps(entries, separators=(",", ":"))
+
+        try:
+            with self._lock:
+                cursor = self._connection.execute(
+                    "UPDATE listings SET mtime_ns = ?, ino = ?, last_used = ?, entries = ?"
+                    " WHERE path = ?",
+                    (dir_stat.st_mtime_ns, dir_stat.st_ino, time.time(), data, dir_path))
+
+                if cursor.rowcount == 0:
+                    self._connection.execute(
+                        "INSERT INTO listings (path, mtime_ns, ino, last_used, entries)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (dir_path, dir_stat.st_mtime_ns, dir_stat.st_ino, time.time(), data))
+                    self._count += 1
+
+                if self._count > self.max_directories:
+                    self._evict()
+        except (sqlite3.Error, ValueError):
+            pass
+
+    def _evict(self):
+        """
+        Removes the least recently used tenth of the cache (lock must be held).
+        Önbelleğin en uzun süredir kullanılmayan onda birini siler (kilit tutulmalı).
+        """
+        remove_count = max(1, self.max_directories // 10)
+        self._connection.execute(
+            "DELETE FROM listings WHERE path IN"
+            " (SELECT path FROM listings ORDER BY last_used LIMIT ?)",
+            (remove_count,))
+
+        row = self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()
+        self._count = row[0]
+
+    def clear(self):
+        """
+        Deletes every cached listing and resets the counters.
+        Önbellekteki tüm listeleri siler ve sayaçları sıfırlar.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM listings")
+            self._count = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns cache statistics.
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: hits, misses, directories, max_directories.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "directories": self._count,
+            "max_directories": self.max_directories,
+        }
+
+    def close(self):
+        """
+        Closes the cache file.
+        Önbellek dosyasını kapatır.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class MemoryListingCache:
+    """
+    In-memory cache of directory listings with the ListingCache interface.
+    ListingCache arayüzüne sahip, bellekteki dizin listesi önbelleği.
+    """
+
+    def __init__(self, max_directories=5000):
+        """
+        Args:
+            max_directories (int): Size cap in directories. / Dizin cinsinden boyut sınırı.
+        """
+        self.max_directories = max_directories
+
+        # Hit/miss counters / İsabet/ıska sayaçları
+        self.hits = 0
+        self.misses = 0
+
+        # path -> (mtime_ns, ino, JSON entries), least recently used first
+        # yol -> (mtime_ns, ino, JSON öğeler), en uzun süredir kullanılmayan önce
+        self._listings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dir_path, dir_stat, need_stat=False):
+        """
+        Returns the cached entries of a directory if they are still valid.
+        Bir dizinin önbellekteki öğelerini hâlâ geçerliyse döndürür.
+
+        Args:
+            dir_path (str): Directory path. / Dizin yolu.
+            dir_stat (os.stat_result): Current stat of the directory. / Dizinin güncel stat bilgisi.
+            need_stat (bool): Entries must have size and mtime. / Öğelerde boyut ve mtime olmalı.
+        Returns:
+            list: Entry tuples, or None on a miss. / Öğe demetleri, ıskada None.
+        """
+        with self._lock:
+            row = self._listings.get(dir_path)
+
+            # Missing or outdated / Yok veya eski
+            if row is None or row[0] != dir_stat.st_mtime_ns or row[1] != dir_stat.st_ino:
+                self.misses += 1
+                return None
+
+            entries = json.loads(row[2])
+
+            # Stored without size/mtime but the caller needs them
+            # Boyut/mtime olmadan saklanmış ama çağıran bunlara ihtiyaç duyuyor
+            if need_stat:
+                for entry in entries:
+                    if entry[2] is None:
+                        self.misses += 1
+                        return None
+
+            self._listings.move_to_end(dir_path)
+            self.hits += 1
+            return entries
+
+    def put(self, dir_path, dir_stat, entries):
+        """
+        Stores the entries of a directory.
+        Bir dizinin öğelerini saklar.
+
+        Args:
+            dir_path (str): Directory path. / Dizin yolu.
+            dir_stat (os.stat_result): Stat taken before the scan. / Taramadan önce alınan stat.
+            entries (list): Entry tuples. / Öğe demetleri.
+        """
+        # Skip directories that are still changing / Hâlâ değişen dizinleri atla
+        if time.time_ns() - dir_stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+
+        data = json.dumps(entries, separators=(",", ":"))
+
+        with self._lock:
+            self._listings[dir_path] = (dir_stat.st_mtime_ns, dir_stat.st_ino, data)
+            self._listings.move_to_end(dir_path)
+
+            while len(self._listings) > self.max_directories:
+                self._listings.popitem(last=False)
+
+    def clear(self):
+        """
+        Deletes every cached listing and resets the counters.
+        Önbellekteki tüm listeleri siler ve sayaçları sıfırlar.
+        """
+        with self._lock:
+            self._listings.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns cache statistics.
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: hits, misses, directories, max_directories.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "directories": len(self._listings),
+            "max_directories": self.max_directories,
+        }
+
+    def close(self):
+        """
+        Nothing to close; kept for the ListingCache interface.
+        Kapatılacak bir şey yok; ListingCache arayüzü için tutulur.
+        """
+
+
+def default_cache_path():
+    """
+    Returns the default cache file path (XDG cache folder on Linux).
+    Varsayılan önbellek dosya yolunu döndürür (Linux'ta XDG önbellek klasörü).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "FileExplorerApp", "listings.sqlite3")
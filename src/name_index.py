@@ -0,0 +1,608 @@
+# =============================================================================
+# name_index.py - Persistent File Name Index / Kalıcı Dosya Adı İndeksi
+# =============================================================================
+# A locate-style index of every name under one root directory, stored in a
+# single compact file that is memory-mapped for queries.
+#
+# File layout (arrays in native byte order, every section 8-byte aligned):
+#   header        magic, counts, offset and length of each section
+#   root          root directory path (UTF-8, surrogateescape)
+#   entry_dir     int32  per entry  : index of the folder it is in
+#   entry_flags   uint8  per entry  : IS_DIR, HIDDEN, IN_HIDDEN bits
+#   name_offsets  uint32 per entry+1: entry names, in walk order
+#   dir_entry     int32  per folder : entry index of the folder (-1 = root)
+#   dir_first     uint32 per folder : first child entry (children are contiguous)
+#   dir_count     uint32 per folder : number of children
+#   dir_mtime     int64  per folder : st_mtime_ns when it was read
+#   sorted_entry  uint32 per entry  : entries sorted by lowercase name
+#   low_offsets   uint32 per entry+1: lowercase names in sorted order
+#   names         name bytes (walk order)
+#   low_names     lowercase name bytes + b"\0" (sorted order)
+#
+# Substring queries search the lowercase blob with mmap.find and map each
+# hit back to its name with a binary search; prefix queries binary-search
+# the sorted names. Both read only the mapped file, so they take
+# milliseconds even for millions of names.
+#
+# Updates reuse the old index: a folder whose st_mtime_ns is unchanged is
+# not listed again, only stat'ed. Symbolic links to folders are not
+# followed. The new file is written next to the old one and moved into
+# place by install() after the old mapping is closed (Windows cannot
+# replace a mapped file).
+#
+# Tek bir kök dizin altındaki tüm adların locate benzeri indeksi; sorgular
+# için belleğe eşlenen (mmap) tek ve sıkışık bir dosyada saklanır.
+#
+# Alt dizi sorguları küçük harfli ad bloğunda mmap.find ile arar ve her
+# isabeti ikili arama ile adına eşler; önek sorguları sıralı adlarda ikili
+# arama yapar. İkisi de sadece eşlenen dosyayı okur; bu yüzden milyonlarca
+# adda bile milisaniyeler sürer.
+#
+# Güncellemeler eski indeksi kullanır: st_mtime_ns değeri değişmeyen bir
+# klasör yeniden listelenmez, sadece stat edilir. Klasörlere giden sembolik
+# bağlar takip edilmez. Yeni dosya eskisinin yanına yazılır ve eski eşleme
+# kapatıldıktan sonra install() ile yerine taşınır (Windows eşlenmiş bir
+# dosyanın yerine başkasını koyamaz).
+# =============================================================================
+
+import os           # File system operations / Dosya sistemi işlemleri
+import mmap         # Memory-mapped index file / Belleğe eşlenen indeks dosyası
+import time         # Racy mtime check / Yarışlı mtime kontrolü
+import struct       # Header encoding / Başlık kodlaması
+import hashlib      # Index file names / İndeks dosya adları
+import tempfile     # New index file / Yeni indeks dosyası
+import threading    # Cancel event / İptal olayı
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+from .file_utils import is_hidden_entry
+from .dir_scanner import ScanCancelled
+from .listing_cache import RACY_WINDOW_NS
+
+
+# --- File format / Dosya biçimi ---
+MAGIC = b"FXNIDX01"
+
+SECTIONS = ("root", "entry_dir", "entry_flags", "name_offsets",
+            "dir_entry", "dir_first", "dir_count", "dir_mtime",
+            "sorted_entry", "low_offsets", "names", "low_names")
+
+# magic, entry count, folder count, then (offset, length) of each section
+# magic, öğe sayısı, klasör sayısı, ardından her bölümün (ofset, uzunluk) çifti
+HEADER = struct.Struct("<8sQQ" + "QQ" * len(SECTIONS))
+
+# Array type code of each numeric section / Her sayısal bölümün dizi tür kodu
+SECTION_TYPES = {
+    "entry_dir": "i",
+    "entry_flags": "B",
+    "name_offsets": "I",
+    "dir_entry": "i",
+    "dir_first": "I",
+    "dir_count": "I",
+    "dir_mtime": "q",
+    "sorted_entry": "I",
+    "low_offsets": "I",
+}
+
+# --- Entry flags / Öğe bayrakları ---
+IS_DIR = 1          # Entry is a folder / Öğe bir klasör
+HIDDEN = 2          # Entry is hidden / Öğe gizli
+IN_HIDDEN = 4       # Inside a hidden folder / Gizli bir klasörün içinde
+
+
+def _encode(name):
+    """
+    Encodes a name like the file system does (undecodable bytes kept).
+    Bir adı dosya sisteminin yaptığı gibi kodlar (çözülemeyen baytlar korunur).
+    """
+    return name.encode("utf-8", "surrogateescape")
+
+
+def _decode(data):
+    """
+    Reverse of _encode. / _encode işleminin tersi.
+    """
+    return bytes(data).decode("utf-8", "surrogateescape")
+
+
+def index_path_for(root_dir):
+    """
+    Returns the index file path of a root directory (XDG cache folder).
+    Bir kök dizinin indeks dosya yolunu döndürür (XDG önbellek klasörü).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+
+    digest = hashlib.sha1(_encode(os.path.abspath(root_dir))).hexdigest()
+    return os.path.join(cache_home, "FileExplorerApp", "index", digest + ".idx")
+
+
+def open_index(root_dir):
+    """
+    Opens the existing index of a root directory.
+    Bir kök dizinin mevcut indeksini açar.
+
+    Returns:
+        NameIndex: The index, or None if there is no usable index.
+                   İndeks; kullanılabilir indeks yoksa None.
+    """
+    try:
+        index = NameIndex(index_path_for(root_dir))
+    except (OSError, ValueError):
+        return None
+
+    # Hash collision or moved file / Hash çakışması veya taşınmış dosya
+    if index.root_dir != os.path.abspath(root_dir):
+        index.close()
+        return None
+    return index
+
+
+class NameIndex:
+    """
+    Read-only view of an index file.
+    Bir indeks dosyasının salt okunur görünümü.
+    """
+
+    def __init__(self, index_path):
+        """
+        Maps an index file into memory.
+        Bir indeks dosyasını belleğe eşler.
+
+        Raises:
+            OSError: If the file cannot be read. / Dosya okunamazsa.
+            ValueError: If the file is not a valid index. / Dosya geçerli bir indeks değilse.
+        """
+        self.index_path = index_path
+        self._views = []
+
+        with open(index_path, "rb") as index_file:
+            self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header()
+        except (ValueError, struct.error, TypeError):
+            self.close()
+            raise ValueError("Invalid index file: " + index_path)
+
+    def _read_header(self):
+        """
+        Reads the header and creates typed views of the sections.
+        Başlığı okur ve bölümlerin türlü görünümlerini oluşturur.
+        """
+        values = HEADER.unpack_from(self._map, 0)
+        if values[0] != MAGIC:
+            raise ValueError("bad magic")
+
+        self.entry_count = values[1]
+        self.dir_count = values[2]
+
+        # name -> (offset, length) / ad -> (ofset, uzunluk)
+        spans = {}
+        for number, name in enumerate(SECTIONS):
+            offset = values[3 + number * 2]
+            length = values[4 + number * 2]
+            if offset + length > len(self._map):
+                raise ValueError("truncated")
+            spans[name] = (offset, length)
+
+        view = memoryview(self._map)
+        self._views.append(view)
+
+        def section(name):
+            offset, length = spans[name]
+            part = view[offset:offset + length]
+            self._views.append(part)
+            if name in SECTION_TYPES:
+                part = part.cast(SECTION_TYPES[name])
+                self._views.append(part)
+            return part
+
+        self.root_dir = _decode(section("root"))
+        self.entry_dir = section("entry_dir")
+        self.entry_flags = section("entry_flags")
+        self.name_offsets = section("name_offsets")
+        self.dir_entry = section("dir_entry")
+        self.dir_first = section("dir_first")
+        self.dir_count_of = section("dir_count")
+        self.dir_mtime = section("dir_mtime")
+        self.sorted_entry = section("sorted_entry")
+        self.low_offsets = section("low_offsets")
+        self.names = section("names")
+        self._low_start = spans["low_names"][0]
+
+        # Sizes must agree with the counts / Boyutlar sayılarla uyuşmalı
+        if len(self.entry_dir) != self.entry_count or len(self.dir_mtime) != self.dir_count:
+            raise ValueError("bad section size")
+
+    def entry_name(self, entry):
+        """
+        Returns the name of an entry. / Bir öğenin adını döndürür.
+        """
+        return _decode(self.names[self.name_offsets[entry]:self.name_offsets[entry + 1]])
+
+    def folder_path(self, folder, path_cache=None):
+        """
+        Builds the full path of a folder from the parent chain.
+        Bir klasörün tam yolunu ebeveyn zincirinden oluşturur.
+
+        Args:
+            folder (int): Folder index. / Klasör indeksi.
+            path_cache (dict, optional): folder -> path, filled on the way.
+                                         klasör -> yol, yol boyunca doldurulur.
+        """
+        if path_cache is not None and folder in path_cache:
+            return path_cache[folder]
+
+        entry = self.dir_entry[folder]
+        if entry < 0:
+            path = self.root_dir
+        else:
+            parent_path = self.folder_path(self.entry_dir[entry], path_cache)
+            path = os.path.join(parent_path, self.entry_name(entry))
+
+        if path_cache is not None:
+            path_cache[folder] = path
+        return path
+
+    def entry_path(self, entry, path_cache=None):
+        """
+        Full path of an entry. / Bir öğenin tam yolu.
+        """
+        folder_path = self.folder_path(self.entry_dir[entry], path_cache)
+        return os.path.join(folder_path, self.entry_name(entry))
+
+    def _low_name(self, position):
+        """
+        Lowercase name bytes at a sorted position.
+        Sıralı bir konumdaki küçük harfli ad baytları.
+        """
+        start = self._low_start + self.low_offsets[position]
+        end = self._low_start + self.low_offsets[position + 1] - 1
+        return self._map[start:end]
+
+    def search(self, text, prefix=False, show_hidden=False, limit=1000):
+        """
+        Finds names containing (or starting with) text, ignoring case.
+        Metni içeren (veya onunla başlayan) adları büyük/küçük harf
+        ayırmadan bulur.
+
+        Args:
+            text (str): Text to look for. / Aranacak metin.
+            prefix (bool): Match only at the start of names. / Sadece ad başında eşleştir.
+            show_hidden (bool): Include hidden entries. / Gizli öğeleri de dahil et.
+            limit (int): Maximum number of results. / En fazla sonuç sayısı.
+        Returns:
+            list: (path, is_dir) tuples sorted by name. / Ada göre sıralı (yol, klasör_mü) demetleri.
+        """
+        needle = _encode(text.lower())
+        if not needle or b"\0" in needle:
+            return []
+
+        if prefix:
+            positions = self._prefix_positions(needle)
+        else:
+            positions = self._substring_positions(needle)
+
+        results = []
+        path_cache = {}
+        for position in positions:
+            entry = self.sorted_entry[position]
+            flags = self.entry_flags[entry]
+            if not show_hidden and flags & (HIDDEN | IN_HIDDEN):
+                continue
+
+            results.append((self.entry_path(entry, path_cache), bool(flags & IS_DIR)))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _substring_positions(self, needle):
+        """
+        Yields sorted positions of names containing needle.
+        needle içeren adların sıralı konumlarını üretir.
+        """
+        end = len(self._map)
+        offset = self._map.find(needle, self._low_start)
+
+        while offset != -1:
+            position = bisect_right(self.low_offsets, offset - self._low_start) - 1
+            yield position
+
+            # Continue after this name / Bu addan sonra devam et
+            offset = self._map.find(needle, self._low_start + self.low_offsets[position + 1], end)
+
+    def _prefix_positions(self, needle):
+        """
+        Yields sorted positions of names starting with needle.
+        needle ile başlayan adların sıralı konumlarını üretir.
+        """
+        low = 0
+        high = self.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._low_name(middle) < needle:
+                low = middle + 1
+            else:
+                high = middle
+
+        position = low
+        while position < self.entry_count and self._low_name(position).startswith(needle):
+            yield position
+            position += 1
+
+    def folder_lookup(self):
+        """
+        Returns path -> folder index for every folder (used by updates).
+        Her klasör için yol -> klasör indeksi döndürür (güncellemelerde kullanılır).
+        """
+        path_cache = {}
+        for folder in range(self.dir_count):
+            self.folder_path(folder, path_cache)
+
+        lookup = {}
+        for folder, path in path_cache.items():
+            lookup[path] = folder
+        return lookup
+
+    def folder_children(self, folder):
+        """
+        Returns (name, is_dir, hidden) tuples of a folder's children.
+        Bir klasörün alt öğelerinin (ad, klasör_mü, gizli) demetlerini döndürür.
+        """
+        first = self.dir_first[folder]
+        children = []
+        for entry in range(first, first + self.dir_count_of[folder]):
+            flags = self.entry_flags[entry]
+            children.append((self.entry_name(entry), bool(flags & IS_DIR), bool(flags & HIDDEN)))
+        return children
+
+    def close(self):
+        """
+        Unmaps the file. / Dosya eşlemesini kaldırır.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._map.close()
+
+
+class IndexBuilder:
+    """
+    Builds or updates the index of a root directory (run in a worker thread).
+    Bir kök dizinin indeksini oluşturur veya günceller (işçi iş parçacığında çalışır).
+    """
+
+    def __init__(self, root_dir, old_index=None):
+        """
+        Args:
+            root_dir (str): Directory to index. / İndekslenecek dizin.
+            old_index (NameIndex, optional): Previous index to reuse.
+                                             Tekrar kullanılacak önceki indeks.
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.index_path = index_path_for(root_dir)
+        self.old_index = old_index
+        self.cancel_event = threading.Event()
+
+        # Written file, moved into place by install()
+        # Yazılan dosya, install() ile yerine taşınır
+        self.temp_path = None
+
+        # Progress counters / İlerleme sayaçları
+        self.folder_count = 0
+        self.entry_count = 0
+        self.listed_count = 0      # Folders read with scandir / scandir ile okunan klasörler
+
+    def cancel(self):
+        """
+        Stops the build. / Oluşturmayı durdurur.
+        """
+        self.cancel_event.set()
+
+    def run(self):
+        """
+        Walks the tree and writes the new index file; install() puts it in place.
+        Ağacı gezer ve yeni indeks dosyasını yazar; install() onu yerine koyar.
+
+        Returns:
+            str: Written (temporary) file path. / Yazılan (geçici) dosya yolu.
+        Raises:
+            ScanCancelled: If cancelled. / İptal edilirse.
+            OSError: If the file cannot be written. / Dosya yazılamazsa.
+        """
+        old_folders = {}
+        if self.old_index is not None:
+            old_folders = self.old_index.folder_lookup()
+
+        names = []
+        entry_dir = array("i")
+        entry_flags = array("B")
+        dir_entry = array("i")
+        dir_first = array("I")
+        dir_count = array("I")
+        dir_mtime = array("q")
+
+        # Breadth-first: (path, own entry index, inside hidden folder?)
+        # Genişlik öncelikli: (yol, kendi öğe indeksi, gizli klasör içinde mi?)
+        pending = deque([(self.root_dir, -1, False)])
+
+        while pending:
+            if self.cancel_event.is_set():
+                raise ScanCancelled()
+
+            folder_path, own_entry, in_hidden = pending.popleft()
+            folder = len(dir_mtime)
+            children, mtime_ns = self._read_folder(folder_path, old_folders)
+
+            dir_entry.append(own_entry)
+            dir_first.append(len(names))
+            dir_count.append(len(children))
+            dir_mtime.append(mtime_ns)
+
+            for name, child_is_dir, child_hidden in children:
+                flags = 0
+                if child_is_dir:
+                    flags |= IS_DIR
+                if child_hidden:
+                    flags |= HIDDEN
+                if in_hidden:
+                    flags |= IN_HIDDEN
+
+                if child_is_dir:
+                    pending.append((os.path.join(folder_path, name), len(names),
+                                    in_hidden or child_hidden))
+
+                names.append(name)
+                entry_dir.append(folder)
+                entry_flags.append(flags)
+
+            self.folder_count += 1
+            self.entry_count = len(names)
+
+        self._write(names, entry_dir, entry_flags,
+                    dir_entry, dir_first, dir_count, dir_mtime)
+        return self.temp_path
+
+    def install(self):
+        """
+        Moves the written file over the index file. Every NameIndex of the
+        old file must be closed first.
+        Yazılan dosyayı indeks dosyasının üzerine taşır. Eski dosyanın tüm
+        NameIndex nesneleri önce kapatılmalıdır.
+
+        Raises:
+            OSError: If the file cannot be replaced (e.g. still open in
+                     another window on Windows).
+                     Dosya değiştirilemezse (ör. Windows'ta başka bir
+                     pencerede hâlâ açık).
+        """
+        try:
+            os.replace(self.temp_path, self.index_path)
+        except OSError:
+            self.discard()
+            raise
+        self.temp_path = None
+
+    def discard(self):
+        """
+        Deletes a written file that will not be installed.
+        Yerine konmayacak yazılmış bir dosyayı siler.
+        """
+        if self.temp_path is None:
+            return
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+        self.temp_path = None
+
+    def _read_folder(self, folder_path, old_folders):
+        """
+        Returns the children of a folder, from the old index if the folder
+        did not change.
+        Bir klasörün alt öğelerini döndürür; klasör değişmediyse eski indeksten.
+
+        Returns:
+            tuple: (children, mtime_ns); mtime_ns is 0 if the folder must be
+                   read again next time.
+                   (alt öğeler, mtime_ns); klasör bir dahaki sefere yeniden
+                   okunmalıysa mtime_ns 0'dır.
+        """
+        try:
+            mtime_ns = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return [], 0
+
+        old_folder = old_folders.get(folder_path)
+        if old_folder is not None and mtime_ns != 0:
+            if self.old_index.dir_mtime[old_folder] == mtime_ns:
+                return self.old_index.folder_children(old_folder), mtime_ns
+
+        children = []
+        try:
+            with os.scandir(folder_path) as scan:
+                for entry in scan:
+                    try:
+                        entry_is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        entry_is_dir = False
+                    children.append((entry.name, entry_is_dir, is_hidden_entry(entry)))
+        except OSError:
+            # Unreadable: try again next time / Okunamadı: bir dahaki sefere tekrar dene
+            return [], 0
+
+        self.listed_count += 1
+
+        # Still changing: do not trust this mtime later
+        # Hâlâ değişiyor: bu mtime değerine sonra güvenme
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            mtime_ns = 0
+        return children, mtime_ns
+
+    def _write(self, names, entry_dir, entry_flags,
+               dir_entry, dir_first, dir_count, dir_mtime):
+        """
+        Writes the index to a new file next to the index file (self.temp_path).
+        İndeksi indeks dosyasının yanında yeni bir dosyaya yazar (self.temp_path).
+        """
+        # Names in walk order / Gezinme sırasında adlar
+        encoded = [_encode(name) for name in names]
+        name_offsets = array("I", [0])
+        total = 0
+        for data in encoded:
+            total += len(data)
+            name_offsets.append(total)
+
+        # Lowercase names in sorted order / Sıralı küçük harfli adlar
+        lowered = [_encode(name.lower()) for name in names]
+        sorted_entry = array("I", sorted(range(len(names)), key=lowered.__getitem__))
+        low_offsets = array("I", [0])
+        total = 0
+        for entry in sorted_entry:
+            total += len(lowered[entry]) + 1
+            low_offsets.append(total)
+
+        sections = {
+            "root": _encode(self.root_dir),
+            "entry_dir": entry_dir.tobytes(),
+            "entry_flags": entry_flags.tobytes(),
+            "name_offsets": name_offsets.tobytes(),
+            "dir_entry": dir_entry.tobytes(),
+            "dir_first": dir_first.tobytes(),
+            "dir_count": dir_count.tobytes(),
+            "dir_mtime": dir_mtime.tobytes(),
+            "sorted_entry": sorted_entry.tobytes(),
+            "low_offsets": low_offsets.tobytes(),
+            "names": b"".join(encoded),
+            "low_names": b"".join(lowered[entry] + b"\0" for entry in sorted_entry),
+        }
+
+        # Section offsets and lengths, each section aligned to 8 bytes
+        # Bölüm ofsetleri ve uzunlukları, her bölüm 8 bayta hizalı
+        spans = []
+        position = HEADER.size
+        for name in SECTIONS:
+            position += -position % 8
+            spans.append(position)
+            spans.append(len(sections[name]))
+            position += len(sections[name])
+
+        # A unique name: an older, cancelled build may still be writing
+        # Benzersiz bir ad: daha eski, iptal edilmiş bir oluşturma hâlâ yazıyor olabilir
+        folder = os.path.dirname(self.index_path)
+        os.makedirs(folder, exist_ok=True)
+        handle, self.temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.index_path) + ".", suffix=".tmp", dir=folder)
+
+        try:
+            with os.fdopen(handle, "wb") as index_file:
+                index_file.write(HEADER.pack(MAGIC, len(names), len(dir_mtime), *spans))
+                for number, name in enumerate(SECTIONS):
+                    index_file.write(b"\0" * (spans[number * 2] - index_file.tell()))
+                    index_file.write(sections[name])
+        except OSError:
+            self.discard()
+            raise
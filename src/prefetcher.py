@@ -0,0 +1,161 @@
+# =============================================================================
+# prefetcher.py - Idle Listing Prefetch / Boşta Liste Ön Yükleme
+# =============================================================================
+# While the explorer is idle, the folders the user is likely to open next
+# (visible, not yet expanded folders and the parent of the root) are read
+# ahead on one worker thread and their listings are stored in the listing
+# cache. Opening such a folder, or going up a level, then reads the listing
+# from the cache instead of scanning the directory.
+#
+# Prefetching is speculative, so it gives way to real work: the worker has
+# a lower scheduling priority (Linux), a running prefetch is cancelled as
+# soon as a real load starts, and it stops after max_entries entries until
+# reset() is called (memory ceiling for the staged listings).
+#
+# Gezgin boştayken kullanıcının sonra açması muhtemel klasörler (görünür,
+# henüz açılmamış klasörler ve kökün üst klasörü) tek bir işçi iş
+# parçacığında önceden okunur ve listeleri listeleme önbelleğine konur.
+# Böyle bir klasörü açmak veya bir üst seviyeye çıkmak listeyi dizini
+# taramak yerine önbellekten okur.
+#
+# Ön yükleme tahmine dayalıdır, bu yüzden gerçek işe yol verir: işçinin
+# zamanlama önceliği daha düşüktür (Linux), gerçek bir yükleme başlar
+# başlamaz çalışan ön yükleme iptal edilir ve reset() çağrılana kadar
+# max_entries öğeden sonra durur (önceden konan listeler için bellek sınırı).
+# =============================================================================
+
+import sys          # Platform check / Platform kontrolü
+import os           # Thread priority / İş parçacığı önceliği
+import threading    # Cancel events / İptal olayları
+from concurrent.futures import ThreadPoolExecutor   # Worker thread / İşçi iş parçacığı
+
+from .dir_scanner import ScanCancelled
+from .profiler import NULL_OPERATION, activated
+
+
+# Niceness added to the prefetch thread / Ön yükleme iş parçacığına eklenen nice değeri
+PREFETCH_NICENESS = 10
+
+
+def _lower_thread_priority():
+    """
+    Lowers the priority of the calling worker thread. On Linux the nice
+    value belongs to the thread; elsewhere it would apply to the whole
+    process, so nothing is done.
+    Çağıran işçi iş parçacığının önceliğini düşürür. Linux'ta nice değeri
+    iş parçacığına aittir; başka yerlerde tüm sürece uygulanırdı, bu
+    yüzden bir şey yapılmaz.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0,
+                       os.getpriority(os.PRIO_PROCESS, 0) + PREFETCH_NICENESS)
+    except (AttributeError, OSError):
+        pass
+
+
+class Prefetcher:
+    """
+    Reads folder listings ahead of time into the listing cache.
+    Klasör listelerini önceden listeleme önbelleğine okur.
+    """
+
+    def __init__(self, file_system, max_entries=100000):
+        """
+        Args:
+            file_system (LocalFileSystem): Reads folders through the listing cache.
+                                           Klasörleri listeleme önbelleği üzerinden okur.
+            max_entries (int): Entries staged until reset(). / reset()'e kadar konan öğe sayısı.
+        """
+        self.file_system = file_system
+        self.max_entries = max_entries
+
+        # Entries staged so far and the folders already read
+        # Şimdiye kadar konan öğeler ve zaten okunan klasörler
+        self.staged_entries = 0
+        self._done = set()
+
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            initializer=_lower_thread_priority)
+        self._cancel_event = None
+
+    def wants(self, path):
+        """
+        True if a folder has not been prefetched yet and there is room left.
+        Bir klasör henüz önceden okunmadıysa ve yer kaldıysa True.
+        """
+        return path not in self._done and self.staged_entries < self.max_entries
+
+    def start(self, paths, with_stat=False, op=NULL_OPERATION):
+        """
+        Starts reading folders in the background, in the given order.
+        Klasörleri verilen sırada arka planda okumaya başlar.
+
+        Args:
+            paths (list): Folder paths, most likely first. / Klasör yolları, en olası önce.
+            with_stat (bool): Also read sizes and dates. / Boyut ve tarihleri de oku.
+            op (Operation, optional): Profiler operation. / Profilleyici işlemi.
+        Returns:
+            Future: Resolves to the number of entries staged.
+                    Konan öğe sayısını döndürür.
+        """
+        self.cancel()
+        self._cancel_event = threading.Event()
+        return self._executor.submit(self._run, list(paths), with_stat,
+                                     self._cancel_event, op)
+
+    def _run(self, paths, with_stat, cancel_event, op):
+        """
+        Reads the folders until cancelled or full (worker thread).
+        İptal edilene veya dolana kadar klasörleri okur (işçi iş parçacığı).
+        """
+        staged = 0
+        with activated(op):
+            for path in paths:
+                if cancel_event.is_set() or not self.wants(path):
+                    continue
+
+                try:
+                    nodes = self.file_system.list_directory(path, cancel_event, with_stat)
+                except ScanCancelled:
+                    break
+                except OSError:
+                    # Unreadable: do not try again / Okunamıyor: tekrar deneme
+                    self._done.add(path)
+                    continue
+
+                self._done.add(path)
+                self.staged_entries += len(nodes)
+                staged += len(nodes)
+                op.count("prefetched_folders")
+
+        return staged
+
+    def cancel(self):
+        """
+        Stops the running prefetch; folders not read yet are tried again later.
+        Çalışan ön yüklemeyi durdurur; henüz okunmayan klasörler sonra tekrar denenir.
+        """
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def reset(self):
+        """
+        Forgets the prefetched folders and the staged entry count (new root,
+        refresh or cleared cache).
+        Önceden okunan klasörleri ve konan öğe sayısını unutur (yeni kök,
+        yenileme veya temizlenen önbellek).
+        """
+        self.cancel()
+        self._done = set()
+        self.staged_entries = 0
+
+    def close(self):
+        """
+        Stops the worker thread. / İşçi iş parçacığını durdurur.
+        """
+        self.cancel()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,460 @@
+# =============================================================================
+# profiler.py - Operation Profiler / İşlem Profilleyici
+# =============================================================================
+# Measures the explorer's hot paths per user-level operation (loading a
+# folder, loading the root, refreshing, Expand All):
+#   - time spent in each phase: scan, filter, sort, probe, insert
+#   - file system calls made by the listing code (scandir, stat, open)
+#     and listing cache hits/misses
+#   - items loaded and items per second
+#   - time the UI thread was busy (blocked) for the operation, and the
+#     longest single UI block overall
+#
+# Operations started for another one (e.g. folder loads of Expand All)
+# are added to their parent when they finish. Finished operations are
+# kept in a short history, passed to listeners (the debug panel) and
+# written to an optional JSON Lines trace file, one object per line.
+#
+# Worker threads make an operation current with activated(); the listing
+# code then reports calls with count() and phases with phase() without
+# knowing about operations. When profiling is off, begin() returns
+# NULL_OPERATION, whose methods do nothing.
+#
+# Gezginin sık kullanılan yollarını kullanıcı düzeyindeki işlem başına
+# ölçer (bir klasörü yükleme, kökü yükleme, yenileme, Tümünü Genişlet):
+#   - her aşamada geçen süre: tarama, filtre, sıralama, yoklama, ekleme
+#   - listeleme kodunun yaptığı dosya sistemi çağrıları (scandir, stat,
+#     open) ve listeleme önbelleği isabet/ıskaları
+#   - yüklenen öğeler ve saniyedeki öğe sayısı
+#   - işlem için UI iş parçacığının meşgul (bloklu) kaldığı süre ve genel
+#     olarak en uzun tek UI bloğu
+#
+# Başka bir işlem için başlatılan işlemler (ör. Tümünü Genişlet'in klasör
+# yüklemeleri) bitince ebeveynlerine eklenir. Biten işlemler kısa bir
+# geçmişte tutulur, dinleyicilere (hata ayıklama paneli) verilir ve isteğe
+# bağlı bir JSON Lines iz dosyasına satır başına bir nesne olarak yazılır.
+#
+# İşçi iş parçacıkları bir işlemi activated() ile geçerli yapar; listeleme
+# kodu işlemlerden habersiz olarak çağrıları count() ile, aşamaları
+# phase() ile bildirir. Profilleme kapalıyken begin() NULL_OPERATION
+# döndürür; onun metotları hiçbir şey yapmaz.
+# =============================================================================
+
+import json         # Trace file / İz dosyası
+import time         # Timing / Zamanlama
+import itertools    # Operation IDs / İşlem ID'leri
+import threading    # Current operation per thread / İş parçacığı başına geçerli işlem
+import contextlib   # No-op context / Boş bağlam
+from collections import deque
+
+
+# Current operation of each thread / Her iş parçacığının geçerli işlemi
+_local = threading.local()
+
+# Shared no-op phase / Paylaşılan boş aşama
+_NO_PHASE = contextlib.nullcontext()
+
+
+def count(name, amount=1):
+    """
+    Adds to a counter of the current thread's operation (if any).
+    Geçerli iş parçacığının işlemindeki bir sayaca ekler (varsa).
+
+    Args:
+        name (str): Counter name, e.g. "scandir". / Sayaç adı, ör. "scandir".
+        amount (int): Amount to add. / Eklenecek miktar.
+    """
+    operation = getattr(_local, "operation", None)
+    if operation is not None:
+        operation.count(name, amount)
+
+
+def phase(name):
+    """
+    Times a phase of the current thread's operation: with phase("scan"): ...
+    Geçerli iş parçacığının işleminin bir aşamasını ölçer: with phase("scan"): ...
+    """
+    operation = getattr(_local, "operation", None)
+    if operation is None:
+        return _NO_PHASE
+    return operation.phase(name)
+
+
+def activated(operation):
+    """
+    Makes an operation current in this thread: with activated(operation): ...
+    Bir işlemi bu iş parçacığında geçerli yapar: with activated(operation): ...
+    """
+    return _Activation(operation)
+
+
+class _Activation:
+    """
+    Context manager returned by activated(). / activated() tarafından döndürülen bağlam yöneticisi.
+    """
+
+    def __init__(self, operation):
+        self.operation = operation
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = getattr(_local, "operation", None)
+        if self.operation is NULL_OPERATION:
+            _local.operation = None
+        else:
+            _local.operation = self.operation
+        return self.operation
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.operation = self._previous
+        return False
+
+
+class _PhaseTimer:
+    """
+    Adds the time of a "with" block to a phase of an operation.
+    Bir "with" bloğunun süresini bir işlemin aşamasına ekler.
+    """
+
+    __slots__ = ("operation", "name", "started")
+
+    def __init__(self, operation, name):
+        self.operation = operation
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.operation.add_phase(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class Operation:
+    """
+    Measurements of one operation. / Tek bir işlemin ölçümleri.
+    """
+
+    def __init__(self, operation_id, name, target, parent=None):
+        """
+        Args:
+            operation_id (int): Unique ID. / Benzersiz ID.
+            name (str): Operation name, e.g. "load_children". / İşlem adı.
+            target (str): Folder it works on. / Üzerinde çalıştığı klasör.
+            parent (Operation, optional): Operation to add the results to.
+                                          Sonuçların ekleneceği işlem.
+        """
+        self.operation_id = operation_id
+        self.name = name
+        self.target = target
+        self.parent = parent
+        self.started_at = time.time()       # Wall clock, for the trace / Duvar saati, iz için
+        self.started = time.perf_counter()
+        self.duration = None                # Seconds, set by finish / Saniye, finish ayarlar
+        self.status = "running"
+        self.phases = {}                    # Phase -> seconds / Aşama -> saniye
+        self.counts = {}                    # Counter -> amount / Sayaç -> miktar
+        self.items = 0                      # Items loaded / Yüklenen öğeler
+        self.ui_seconds = 0.0               # UI thread busy time / UI iş parçacığının meşgul süresi
+        self._lock = threading.Lock()
+
+    def phase(self, name):
+        """
+        Context manager timing one phase. / Bir aşamayı ölçen bağlam yöneticisi.
+        """
+        return _PhaseTimer(self, name)
+
+    def add_phase(self, name, seconds):
+        """
+        Adds time to a phase. / Bir aşamaya süre ekler.
+        """
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        """
+        Adds to a counter. / Bir sayaca ekler.
+        """
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def add_items(self, amount):
+        """
+        Adds loaded items. / Yüklenen öğeleri ekler.
+        """
+        self.items += amount
+
+    def add_ui_time(self, seconds):
+        """
+        Adds UI thread busy time. / UI iş parçacığının meşgul süresini ekler.
+        """
+        self.ui_seconds += seconds
+
+    def merge(self, child):
+        """
+        Adds the measurements of a finished child operation.
+        Biten bir alt işlemin ölçümlerini ekler.
+        """
+        with self._lock:
+            for name, seconds in child.phases.items():
+                self.phases[name] = self.phases.get(name, 0.0) + seconds
+            for name, amount in child.counts.items():
+                self.counts[name] = self.counts.get(name, 0) + amount
+        self.items += child.items
+        self.ui_seconds += child.ui_seconds
+
+    def syscall_count(self):
+        """
+        File system calls counted for the operation.
+        İşlem için sayılan dosya sistemi çağrıları.
+        """
+        total = 0
+        for name, amount in self.counts.items():
+            if not name.startswith("cache_"):
+                total += amount
+        return total
+
+    def items_per_second(self):
+        """
+        Loaded items per second of the whole operation (0 if unknown).
+        Tüm işlemin saniyedeki yüklenen öğe sayısı (bilinmiyorsa 0).
+        """
+        if not self.duration:
+            return 0.0
+        return self.items / self.duration
+
+    def to_dict(self):
+        """
+        Trace record of the operation. / İşlemin iz kaydı.
+        """
+        phases_ms = {}
+        for name, seconds in self.phases.items():
+            phases_ms[name] = round(seconds * 1000.0, 3)
+
+        parent_id = None
+        if self.parent is not None:
+            parent_id = self.parent.operation_id
+
+        return {
+            "id": self.operation_id,
+            "parent": parent_id,
+            "name": self.name,
+            "target": self.target,
+            "status": self.status,
+            "start": round(self.started_at, 6),
+            "duration_ms": round((self.duration or 0.0) * 1000.0, 3),
+            "phases_ms": phases_ms,
+            "counts": dict(self.counts),
+            "syscalls": self.syscall_count(),
+            "items": self.items,
+            "items_per_s": round(self.items_per_second(), 1),
+            "ui_ms": round(self.ui_seconds * 1000.0, 3),
+        }
+
+
+class _NullOperation:
+    """
+    Stand-in used while profiling is off: every method does nothing.
+    Profilleme kapalıyken kullanılan yedek: her metot hiçbir şey yapmaz.
+    """
+
+    parent = None
+
+    def phase(self, name):
+        return _NO_PHASE
+
+    def add_phase(self, name, seconds):
+        pass
+
+    def count(self, name, amount=1):
+        pass
+
+    def add_items(self, amount):
+        pass
+
+    def add_ui_time(self, seconds):
+        pass
+
+
+NULL_OPERATION = _NullOperation()
+
+
+class _UIBlock:
+    """
+    Measures one stretch of UI-thread work; nested blocks count once.
+    UI iş parçacığı işinin bir parçasını ölçer; iç içe bloklar bir kez sayılır.
+    """
+
+    __slots__ = ("profiler", "operation", "started", "split_seconds")
+
+    def __init__(self, profiler, operation):
+        self.profiler = profiler
+        self.operation = operation
+        self.started = None
+        self.split_seconds = 0.0
+
+    def __enter__(self):
+        if self.profiler._ui_depth == 0:
+            self.started = time.perf_counter()
+            self.profiler._open_ui_block = self
+        self.profiler._ui_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler._ui_depth -= 1
+        if self.started is not None:
+            self.profiler._open_ui_block = None
+            self.split()
+            self.profiler._record_ui_block(self.split_seconds)
+        return False
+
+    def split(self):
+        """
+        Records the time so far, so an operation that finishes inside the
+        block includes it; the rest is recorded on exit.
+        Şimdiye kadarki süreyi kaydeder; böylece blok içinde biten bir işlem
+        onu içerir. Kalanı çıkışta kaydedilir.
+        """
+        now = time.perf_counter()
+        self.profiler._add_ui_time(self.operation, now - self.started)
+        self.split_seconds += now - self.started
+        self.started = now
+
+
+class Profiler:
+    """
+    Creates, collects and reports operations. Used from the UI thread;
+    worker threads only touch the operations they were given.
+    İşlemleri oluşturur, toplar ve raporlar. UI iş parçacığından kullanılır;
+    işçi iş parçacıkları sadece kendilerine verilen işlemlere dokunur.
+    """
+
+    def __init__(self, enabled=False, trace_path=None, history_size=50):
+        """
+        Args:
+            enabled (bool): Measure operations. / İşlemleri ölç.
+            trace_path (str, optional): JSON Lines file for finished operations
+                                        (enables profiling). / Biten işlemler
+                                        için JSON Lines dosyası (profillemeyi açar).
+            history_size (int): Finished operations kept. / Tutulan biten işlemler.
+        """
+        self.enabled = enabled or trace_path is not None
+        self.trace_path = trace_path
+        self.history = deque(maxlen=history_size)
+        self.listeners = []                 # Called with each finished operation / Her biten işlemle çağrılır
+
+        # UI thread totals / UI iş parçacığı toplamları
+        self.ui_seconds = 0.0
+        self.longest_ui_block = 0.0
+        self.ui_block_count = 0
+
+        self._ids = itertools.count(1)
+        self._ui_depth = 0
+        self._open_ui_block = None
+        self._trace_file = None
+        if trace_path is not None:
+            self._trace_file = open(trace_path, "a", encoding="utf-8")
+
+    def begin(self, name, target="", parent=None):
+        """
+        Starts an operation. / Bir işlem başlatır.
+
+        Args:
+            name (str): Operation name. / İşlem adı.
+            target (str): Folder it works on. / Üzerinde çalıştığı klasör.
+            parent (Operation, optional): Parent operation. / Ebeveyn işlem.
+        Returns:
+            Operation: New operation, or NULL_OPERATION when disabled.
+                       Yeni işlem; kapalıyken NULL_OPERATION.
+        """
+        if not self.enabled:
+            return NULL_OPERATION
+        if parent is NULL_OPERATION:
+            parent = None
+        return Operation(next(self._ids), name, target, parent)
+
+    def finish(self, operation, status="ok", items=None):
+        """
+        Ends an operation: adds it to its parent, the history, the
+        listeners and the trace file.
+        Bir işlemi bitirir: ebeveynine, geçmişe, dinleyicilere ve iz
+        dosyasına ekler.
+        """
+        if operation is NULL_OPERATION or operation is None:
+            return
+        if operation.duration is not None:
+            return
+
+        # UI time of the block that is finishing the operation
+        # İşlemi bitiren bloğun UI süresi
+        if self._open_ui_block is not None and self._open_ui_block.operation is operation:
+            self._open_ui_block.split()
+
+        operation.duration = time.perf_counter() - operation.started
+        operation.status = status
+        if items is not None:
+            operation.items = items
+
+        if operation.parent is not None and operation.parent.duration is None:
+            operation.parent.merge(operation)
+
+        self.history.append(operation)
+        if self._trace_file is not None:
+            self._trace_file.write(json.dumps(operation.to_dict(), ensure_ascii=False) + "\n")
+            self._trace_file.flush()
+
+        for listener in self.listeners:
+            listener(operation)
+
+    def ui_block(self, operation=NULL_OPERATION):
+        """
+        Context manager around UI-thread work of an operation.
+        Bir işlemin UI iş parçacığı işinin etrafındaki bağlam yöneticisi.
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        return _UIBlock(self, operation)
+
+    def _record_ui_block(self, seconds):
+        """
+        Counts one finished UI block. / Biten bir UI bloğunu sayar.
+        """
+        self.ui_block_count += 1
+        if seconds > self.longest_ui_block:
+            self.longest_ui_block = seconds
+
+    def _add_ui_time(self, operation, seconds):
+        """
+        Adds UI time to the totals and the operation.
+        UI süresini toplamlara ve işleme ekler.
+        """
+        self.ui_seconds += seconds
+        operation.add_ui_time(seconds)
+
+    def close(self):
+        """
+        Closes the trace file. / İz dosyasını kapatır.
+        """
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+
+
+def format_operation(operation):
+    """
+    One-line summary of a finished operation for the debug panel.
+    Hata ayıklama paneli için biten bir işlemin tek satırlık özeti.
+    """
+    phase_texts = []
+    for name in ("scan", "filter", "sort", "probe", "insert"):
+        if name in operation.phases:
+            phase_texts.append(name + " " + "%.1f" % (operation.phases[name] * 1000.0))
+
+    return (operation.name + ": " + str(operation.items) + " öğe, "
+            + "%.1f ms" % (operation.duration * 1000.0)
+            + " (" + ", ".join(phase_texts) + " ms), "
+            + "%.0f öğe/sn, " % operation.items_per_second()
+            + str(operation.syscall_count()) + " sistem çağrısı, "
+            + "UI %.1f ms" % (operation.ui_seconds * 1000.0))
@@ -4,10 +4,128 @@
 # This module defines the TreeNode class which represents a single
 # file or directory in the file system tree.
 #
+# Nodes use __slots__ (no per-node __dict__) and keep a reference to their
+# parent instead of a full path string. The path is built on demand from
+# the parent chain; only nodes without a parent (the root, or freshly
+# scanned nodes not yet attached) store their path.
+#
 # Bu modül, dosya sistemi ağacında tek bir dosya veya klasörü temsil
 # eden TreeNode sınıfını tanımlar.
+#
+# Düğümler __slots__ kullanır (düğüm başına __dict__ yok) ve tam yol metni
+# yerine ebeveynlerine bir referans tutar. Yol, ebeveyn zincirinden
+# gerektiğinde oluşturulur; sadece ebeveyni olmayan düğümler (kök veya
+# henüz bağlanmamış yeni taranmış düğümler) yollarını saklar.
 # =============================================================================
 
+import os  # For building paths / Yol oluşturmak için
+
+from .file_utils import EMOJI_ICONS
+
+
+# Shared empty children list for nodes that have no children yet.
+# A real list is created only when the first child is added.
+# Henüz alt öğesi olmayan düğümler için paylaşılan boş alt öğe listesi.
+# Gerçek bir liste sadece ilk alt öğe eklenince oluşturulur.
+NO_CHILDREN = ()
+
+
+def node_sort_key(node):
+    """
+    Sort key for nodes: directories first, then files. Alphabetical in each group.
+    Düğümler için sıralama anahtarı: önce klasörler, sonra dosyalar. Her grup alfabetik.
+
+    Args:
+        node (TreeNode): Node to sort. / Sıralanacak düğüm.
+    Returns:
+        tuple: (is_file, lowercase_name)
+    """
+    # Directories come first (False < True, so "not is_dir" puts dirs first)
+    # Klasörler önce gelir (False < True, "not is_dir" klasörleri öne alır)
+    is_file = not node.is_dir
+    lowercase_name = node.name.lower()
+    return (is_file, lowercase_name)
+
+
+# Columns the tree can be sorted by / Ağacın sıralanabildiği sütunlar
+SORT_COLUMNS = ("name", "size", "modified", "type")
+
+
+def _is_file(node):
+    """
+    Group key: directories (False) before files (True).
+    Grup anahtarı: klasörler (False) dosyalardan (True) önce.
+    """
+    return not node.is_dir
+
+
+def _name_key(node):
+    """
+    Sort key of the name column. / Ad sütununun sıralama anahtarı.
+    """
+    return node.name.lower()
+
+
+def _size_key(node):
+    """
+    Sort key of the size column; unknown sizes come first.
+    Boyut sütununun sıralama anahtarı; bilinmeyen boyutlar önce gelir.
+    """
+    if node.size is None:
+        return (-1, node.name.lower())
+    return (node.size, node.name.lower())
+
+
+def _modified_key(node):
+    """
+    Sort key of the modified column. / Değiştirilme sütununun sıralama anahtarı.
+    """
+    if node.mtime is None:
+        return (0.0, node.name.lower())
+    return (node.mtime, node.name.lower())
+
+
+def _type_key(node):
+    """
+    Sort key of the type column: category, then extension.
+    Tür sütununun sıralama anahtarı: kategori, sonra uzantı.
+    """
+    extension = os.path.splitext(node.name)[1].lower()
+    return (node.category, extension, node.name.lower())
+
+
+# Sort key function of each column / Her sütunun sıralama anahtarı fonksiyonu
+COLUMN_KEYS = {
+    "name": _name_key,
+    "size": _size_key,
+    "modified": _modified_key,
+    "type": _type_key,
+}
+
+
+def sort_nodes(nodes, column="name", reverse=False):
+    """
+    Sorts nodes in place by a column. Directories always stay before files;
+    ties are broken by name, so the order is stable and repeatable.
+    Each key is computed once per node (list.sort decorates the list).
+    Düğümleri bir sütuna göre yerinde sıralar. Klasörler her zaman dosyalardan
+    önce kalır; eşitlikler adla çözülür, böylece sıra kararlı ve tekrarlanabilir.
+    Her anahtar düğüm başına bir kez hesaplanır (list.sort listeyi süsler).
+
+    Args:
+        nodes (list): TreeNode objects. / TreeNode nesneleri.
+        column (str): One of SORT_COLUMNS. / SORT_COLUMNS içinden biri.
+        reverse (bool): Descending order inside each group. / Her grupta azalan sıra.
+    """
+    # Sort by the column, then (stable) move directories to the front.
+    # Two passes with plain keys are faster than one with (is_file, name)
+    # tuples: about half the time for 200k names.
+    # Sütuna göre sırala, sonra (kararlı) klasörleri öne al. Düz
+    # anahtarlarla iki geçiş, (dosya_mı, ad) demetleriyle tek geçişten
+    # hızlıdır: 200 bin ad için yaklaşık yarı süre.
+    nodes.sort(key=COLUMN_KEYS[column], reverse=reverse)
+    nodes.sort(key=_is_file)
+
 
 class TreeNode:
     """
@@ -15,41 +133,135 @@ class TreeNode:
     Ağaçtaki bir dosya veya klasörü temsil eder.
     """
 
-    def __init__(self, name, path, is_dir):
+    # Fixed attribute set: no __dict__ per node / Sabit öznitelik kümesi: düğüm başına __dict__ yok
+    __slots__ = ("name", "parent", "_path", "is_dir", "category", "hidden",
+                 "children", "hidden_children", "loaded", "has_children", "stale",
+                 "size", "mtime")
+
+    def __init__(self, name, path, is_dir, category=None, hidden=False):
         """
         Creates a new TreeNode.
         Yeni bir TreeNode oluşturur.
 
         Args:
             name (str): File/directory name. / Dosya/klasör adı.
-            path (str): Full path. / Tam yol.
+            path (str): Full path (dropped when the node gets a parent).
+                        Tam yol (düğüm bir ebeveyn alınca bırakılır).
             is_dir (bool): True = directory, False = file. / True = klasör, False = dosya.
+            category (str, optional): Icon category key. / İkon kategori anahtarı.
+            hidden (bool, optional): Is hidden? / Gizli mi?
         """
-        self.name = name        # Name / Ad
-        self.path = path        # Full path / Tam yol
-        self.is_dir = is_dir    # Is directory? / Klasör mü?
-        self.children = []      # Child nodes / Alt düğümler
-        self.loaded = False     # Children loaded? / Alt düğümler yüklendi mi?
+        # Default category comes from the entry type
+        # Varsayılan kategori öğe türünden gelir
+        if category is None:
+            if is_dir:
+                category = "directory"
+            else:
+                category = "file"
+
+        self.name = name            # Name / Ad
+        self.parent = None          # Parent node / Ebeveyn düğüm
+        self._path = path           # Only kept while detached / Sadece bağlı değilken tutulur
+        self.is_dir = is_dir        # Is directory? / Klasör mü?
+        self.category = category    # Icon category / İkon kategorisi
+        self.hidden = hidden        # Is hidden? / Gizli mi?
+        self.children = NO_CHILDREN # Child nodes / Alt düğümler
+        self.hidden_children = NO_CHILDREN  # Hidden entries not shown / Gösterilmeyen gizli öğeler
+        self.loaded = False         # Children loaded? / Alt düğümler yüklendi mi?
+        self.has_children = None    # None = unknown / None = bilinmiyor
+        self.stale = False          # Needs a rescan when opened? / Açılınca yeniden taranmalı mı?
+        self.size = None            # Size in bytes, if read / Okunduysa bayt cinsinden boyut
+        self.mtime = None           # Modification time, if read / Okunduysa değiştirilme zamanı
+
+    @property
+    def path(self):
+        """
+        Full path, built from the parent chain.
+        Ebeveyn zincirinden oluşturulan tam yol.
+        """
+        if self._path is not None:
+            return self._path
+        return os.path.join(self.parent.path, self.name)
+
+    @property
+    def icon(self):
+        """
+        Emoji icon for this node's category.
+        Bu düğümün kategorisine ait emoji ikon.
+        """
+        return EMOJI_ICONS.get(self.category, EMOJI_ICONS["file"])
+
+    def _attach(self, child_node):
+        """
+        Makes this node the parent of child_node.
+        Bu düğümü child_node'un ebeveyni yapar.
+        """
+        child_node.parent = self
+        child_node._path = None
+
+    def detach(self):
+        """
+        Makes this node a root again: it keeps its full path, drops its parent.
+        Bu düğümü tekrar kök yapar: tam yolunu korur, ebeveynini bırakır.
+        """
+        self._path = self.path
+        self.parent = None
 
     def add_child(self, child_node):
         """
         Adds a child node.
         Alt düğüm ekler.
         """
+        if self.children is NO_CHILDREN:
+            self.children = []
+        self._attach(child_node)
         self.children.append(child_node)
 
+    def add_children(self, child_nodes):
+        """
+        Adds several child nodes at once.
+        Birden fazla alt düğümü tek seferde ekler.
+        """
+        if self.children is NO_CHILDREN:
+            self.children = []
+        for child_node in child_nodes:
+            self._attach(child_node)
+        self.children.extend(child_nodes)
+
+    def set_children(self, child_nodes):
+        """
+        Replaces the children list (nodes are attached to this node).
+        Alt öğe listesini değiştirir (düğümler bu düğüme bağlanır).
+        """
+        for child_node in child_nodes:
+            if child_node.parent is not self:
+                self._attach(child_node)
+
+        if len(child_nodes) == 0:
+            self.children = NO_CHILDREN
+        else:
+            self.children = list(child_nodes)
+
+    def set_hidden_children(self, child_nodes):
+        """
+        Keeps the hidden entries that are not shown, so they can be shown
+        again without reading the folder.
+        Gösterilmeyen gizli öğeleri saklar; böylece klasör okunmadan
+        yeniden gösterilebilirler.
+        """
+        for child_node in child_nodes:
+            if child_node.parent is not self:
+                self._attach(child_node)
+
+        if len(child_nodes) == 0:
+            self.hidden_children = NO_CHILDREN
+        else:
+            self.hidden_children = list(child_nodes)
+
     def sort_children(self):
         """
         Sorts children: directories first, then files. Alphabetical in each group.
         Alt düğümleri sıralar: önce klasörler, sonra dosyalar. Her grup alfabetik.
         """
-        # We use a helper function instead of a lambda for clarity
-        # Anlaşılırlık için lambda yerine yardımcı fonksiyon kullanıyoruz
-        def sort_key(node):
-            # Directories come first (False < True, so "not is_dir" puts dirs first)
-            # Klasörler önce gelir (False < True, "not is_dir" klasörleri öne alır)
-            is_file = not node.is_dir
-            lowercase_name = node.name.lower()
-            return (is_file, lowercase_name)
-
-        self.children.sort(key=sort_key)
+        if self.children is not NO_CHILDREN:
+            sort_nodes(self.children)
@@ -0,0 +1,135 @@
+# =============================================================================
+# treeview_bulk.py - Bulk Treeview Insertion / Toplu Treeview Ekleme
+# =============================================================================
+# ttk.Treeview.insert costs one Python -> Tcl call per row (plus option
+# formatting in tkinter), and a folder row needs a second call for its
+# "Yükleniyor..." placeholder. For big folders these calls dominate.
+#
+# BulkInserter defines a small Tcl procedure once and sends a whole batch
+# of rows to it in a single call. Converting a Python object to Tcl costs
+# about as much as the insert itself, so a batch is sent as a few flat
+# values instead of one tuple per row: all texts joined with "\0" (file
+# names cannot contain it), the indexes of the rows that get a
+# placeholder, and the detail cells joined the same way. The procedure
+# splits them in Tcl, runs the inserts and returns the new item IDs and
+# placeholder IDs as two lists. Tk redraws the widget from the idle
+# queue, so nothing is laid out or drawn until the batch is in.
+#
+# ttk.Treeview.insert satır başına bir Python -> Tcl çağrısına (artı
+# tkinter'da seçenek biçimlendirmesine) mal olur ve bir klasör satırı
+# "Yükleniyor..." yer tutucusu için ikinci bir çağrı gerektirir. Büyük
+# klasörlerde bu çağrılar baskındır.
+#
+# BulkInserter küçük bir Tcl prosedürünü bir kez tanımlar ve bütün bir
+# satır grubunu ona tek çağrıda gönderir. Bir Python nesnesini Tcl'e
+# çevirmek eklemenin kendisi kadar sürdüğü için grup, satır başına bir
+# demet yerine birkaç düz değer olarak gönderilir: "\0" ile birleştirilmiş
+# tüm metinler (dosya adları bunu içeremez), yer tutucu alacak satırların
+# indisleri ve aynı şekilde birleştirilmiş ayrıntı hücreleri. Prosedür
+# bunları Tcl'de böler, eklemeleri yapar ve yeni öğe ID'lerini ve yer
+# tutucu ID'lerini iki liste olarak döndürür. Tk pencereyi boşta
+# kuyruğundan yeniden çizer; bu yüzden grup eklenene kadar hiçbir şey
+# yerleştirilmez veya çizilmez.
+# =============================================================================
+
+# Name of the Tcl procedure / Tcl prosedürünün adı
+BULK_INSERT_COMMAND = "::fileexplorer_bulk_insert"
+
+# Separator of the joined texts and cells / Birleştirilmiş metin ve hücrelerin ayırıcısı
+FIELD_SEPARATOR = "\0"
+
+# Arguments: texts and cells joined with \0, the number of cells per row
+# (0 for none), the row indexes that get a placeholder and its text.
+# Default options (-open 0, empty -values) are left out, so Tk parses
+# fewer options per row. Returns {items placeholders}.
+# Argümanlar: \0 ile birleştirilmiş metinler ve hücreler, satır başına
+# hücre sayısı (yoksa 0), yer tutucu alan satır indisleri ve metni.
+# Varsayılan seçenekler (-open 0, boş -values) atlanır; böylece Tk satır
+# başına daha az seçenek ayrıştırır. {öğeler yer_tutucular} döndürür.
+BULK_INSERT_PROC = """
+proc %s {tree parent texts cells width folders placeholder} {
+    # split returns no element for "", but a batch always has a row
+    # split "" için öğe döndürmez, ama bir grupta her zaman satır vardır
+    if {$texts eq ""} {
+        set texts [list {}]
+    } else {
+        set texts [split $texts \\0]
+    }
+    set items {}
+    if {$width == 0} {
+        foreach text $texts {
+            lappend items [$tree insert $parent end -text $text]
+        }
+    } else {
+        set first 0
+        set last [expr {$width - 1}]
+        set cells [split $cells \\0]
+        foreach text $texts {
+            lappend items [$tree insert $parent end -text $text \\
+                               -values [lrange $cells $first $last]]
+            incr first $width
+            incr last $width
+        }
+    }
+    set placeholders {}
+    foreach index $folders {
+        lappend placeholders [$tree insert [lindex $items $index] end -text $placeholder]
+    }
+    return [list $items $placeholders]
+}
+""" % BULK_INSERT_COMMAND
+
+
+class BulkInserter:
+    """
+    Inserts batches of Treeview rows with one Tcl call per batch.
+    Treeview satır gruplarını grup başına bir Tcl çağrısıyla ekler.
+    """
+
+    def __init__(self, treeview):
+        """
+        Args:
+            treeview (ttk.Treeview): Target widget. / Hedef pencere öğesi.
+        """
+        self.treeview = treeview
+        self._defined = False
+
+    def insert_rows(self, parent_id, texts, values=None, placeholder_rows=(), placeholder=""):
+        """
+        Appends rows under a parent item.
+        Bir ebeveyn öğenin altına satırlar ekler.
+
+        Args:
+            parent_id (str): Parent Treeview item ID ("" for the top level).
+                             Ebeveyn Treeview öğe ID'si (en üst seviye için "").
+            texts (list): Row texts. / Satır metinleri.
+            values (list, optional): Detail cells of each row, all of the
+                                     same length; None for no cells.
+                                     Her satırın ayrıntı hücreleri, hepsi aynı
+                                     uzunlukta; hücre yoksa None.
+            placeholder_rows (list): Indexes of the rows that get a child
+                                     placeholder row. / Alt yer tutucu satırı
+                                     alacak satırların indisleri.
+            placeholder (str): Text of the placeholder rows. / Yer tutucu satırlarının metni.
+        Returns:
+            tuple: (item IDs in row order, placeholder IDs in placeholder_rows order).
+                   (Satır sırasında öğe ID'leri, placeholder_rows sırasında yer tutucu ID'leri).
+        """
+        if not texts:
+            return (), ()
+
+        tk_app = self.treeview.tk
+        if not self._defined:
+            tk_app.eval(BULK_INSERT_PROC)
+            self._defined = True
+
+        width = 0
+        cells = ""
+        if values and values[0]:
+            width = len(values[0])
+            cells = FIELD_SEPARATOR.join([cell for row in values for cell in row])
+
+        items, placeholders = tk_app.splitlist(tk_app.call(
+            BULK_INSERT_COMMAND, str(self.treeview), parent_id,
+            FIELD_SEPARATOR.join(texts), cells, width, tuple(placeholder_rows), placeholder))
+        return tk_app.splitlist(items), tk_app.splitlist(placeholders)